@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+English Tutor Cohort Analytics
+
+Flattens every learner's review history into one columnar table and computes
+cohort metrics with NumPy group-bys: retention by review interval, ease
+factor distribution and daily workload. The table can be exported as CSV,
+NPZ, or Parquet (when pyarrow is installed).
+
+Requires NumPy. Used by the `analytics` command of progress_manager.py.
+
+Usage:
+    python progress_manager.py analytics [--output FILE]
+
+Examples:
+    python progress_manager.py analytics
+    python progress_manager.py analytics --output reviews.parquet
+"""
+
+import csv
+import json
+import warnings
+from datetime import timezone
+from pathlib import Path
+
+import numpy as np
+
+import profile_schema
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Parquet export is optional
+    pyarrow = None
+
+# Review interval buckets in days: [0,1), [1,2), [2,3), [3,5), ...
+INTERVAL_EDGES = [0, 1, 2, 3, 5, 7, 14, 30, 60, 120, 365]
+
+# Ease factor histogram bins (SM-2 keeps EF within 1.3 - 2.5)
+EASE_EDGES = [round(1.3 + 0.1 * i, 1) for i in range(13)]
+
+COLUMNS = ["learner", "word", "level", "review_index", "timestamp", "quality",
+           "elapsed_days", "ease_factor"]
+
+
+def _wall_clock_seconds(value) -> float:
+    # Offsets and epoch numbers become local time, exactly as on import
+    parsed = profile_schema.parse_timestamp(value)
+    return parsed.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _parse_timestamps(values: list) -> np.ndarray:
+    """
+    Parse timestamps to seconds, vectorized when possible.
+
+    Profiles store naive local wall-clock times (profile_schema normalizes
+    everything else to that at import). The seconds encode that wall-clock
+    time as if it were UTC, so day buckets follow the learner's local dates.
+    Values datetime64 would read differently (offsets) take the slow path.
+    """
+    try:
+        with warnings.catch_warnings():
+            # datetime64 converts offsets to UTC with only a warning
+            warnings.simplefilter("error")
+            parsed = np.array(values, dtype="datetime64[us]")
+        return parsed.astype("int64") / 1e6
+    except (ValueError, TypeError, Warning):
+        return np.array([_wall_clock_seconds(v) for v in values], dtype="float64")
+
+
+def flatten_reviews(data_dir: Path) -> dict:
+    """
+    Load every learner profile and return the review table as NumPy columns.
+    learner and word are returned as codes into the `learners`/`words` lists.
+    """
+    learners, words = [], []
+    learner_col, word_col, level_col, index_col, quality_col, ease_col = [], [], [], [], [], []
+    dates = []
+
+    for filepath in sorted(data_dir.glob("*.json")):
+        with open(filepath, "r") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or "vocabulary" not in data:
+            continue
+        learner_code = len(learners)
+        learners.append(data.get("name", filepath.stem))
+
+        for word, word_data in data["vocabulary"].items():
+            history = word_data.get("review_history") or []
+            if not history:
+                continue
+            word_code = len(words)
+            words.append(word)
+            level = word_data.get("level", 0) or 0
+            ease = word_data.get("ease_factor", 2.5)
+            for i, review in enumerate(history):
+                learner_col.append(learner_code)
+                word_col.append(word_code)
+                level_col.append(level)
+                index_col.append(i)
+                quality_col.append(review.get("quality", 0))
+                ease_col.append(ease)
+                dates.append(review.get("date"))
+
+    timestamps = _parse_timestamps(dates) if dates else np.zeros(0)
+    word_codes = np.array(word_col, dtype="int64")
+
+    # Reviews of a word are stored in order, so the interval is the gap to
+    # the previous row whenever both rows belong to the same word
+    elapsed = np.full(len(timestamps), np.nan)
+    if len(timestamps) > 1:
+        same_word = word_codes[1:] == word_codes[:-1]
+        gaps = (timestamps[1:] - timestamps[:-1]) / 86400
+        elapsed[1:][same_word] = gaps[same_word]
+
+    return {
+        "learners": learners,
+        "words": words,
+        "learner": np.array(learner_col, dtype="int32"),
+        "word": word_codes,
+        "level": np.array(level_col, dtype="int8"),
+        "review_index": np.array(index_col, dtype="int32"),
+        "timestamp": timestamps,
+        "quality": np.array(quality_col, dtype="int8"),
+        "elapsed_days": elapsed,
+        "ease_factor": np.array(ease_col, dtype="float32"),
+    }
+
+
+def retention_by_interval(table: dict) -> list:
+    """Share of reviews answered correctly (quality >= 3) per interval bucket."""
+    elapsed = table["elapsed_days"]
+    mask = ~np.isnan(elapsed)
+    buckets = np.digitize(elapsed[mask], INTERVAL_EDGES[1:])
+    correct = (table["quality"][mask] >= 3).astype("int64")
+    n_buckets = len(INTERVAL_EDGES)
+    counts = np.bincount(buckets, minlength=n_buckets)
+    hits = np.bincount(buckets, weights=correct, minlength=n_buckets)
+
+    result = []
+    for i in range(n_buckets):
+        upper = INTERVAL_EDGES[i + 1] if i + 1 < len(INTERVAL_EDGES) else None
+        result.append({
+            "min_days": INTERVAL_EDGES[i],
+            "max_days": upper,
+            "reviews": int(counts[i]),
+            "retention": round(float(hits[i] / counts[i]), 4) if counts[i] else None,
+        })
+    return result
+
+
+def ease_distribution(table: dict) -> list:
+    """Histogram of each word's current ease factor."""
+    if len(table["word"]) == 0:
+        return []
+    # One row per word: the first review row carries the word's ease factor
+    first_rows = table["review_index"] == 0
+    counts, _ = np.histogram(table["ease_factor"][first_rows],
+                             bins=EASE_EDGES + [EASE_EDGES[-1] + 0.1])
+    return [{"ease_factor": edge, "words": int(count)} for edge, count in zip(EASE_EDGES, counts)]
+
+
+def workload_curve(table: dict) -> list:
+    """Reviews and active learners per calendar day."""
+    if len(table["timestamp"]) == 0:
+        return []
+    days = (table["timestamp"] // 86400).astype("int64")
+    unique_days, reviews = np.unique(days, return_counts=True)
+    pairs = np.unique(np.stack([days, table["learner"].astype("int64")]), axis=1)
+    _, active = np.unique(pairs[0], return_counts=True)
+    dates = unique_days.astype("datetime64[D]").astype(str)
+    return [{"date": d, "reviews": int(r), "active_learners": int(a)}
+            for d, r, a in zip(dates, reviews, active)]
+
+
+def export_table(table: dict, output: Path) -> None:
+    """Write the review table as .csv, .npz or .parquet based on the suffix."""
+    suffix = output.suffix.lower()
+    learners = np.array(table["learners"], dtype=object)
+    words = np.array(table["words"], dtype=object)
+
+    if suffix == ".npz":
+        np.savez_compressed(output, learners=np.array(table["learners"]),
+                            words=np.array(table["words"]),
+                            **{c: table[c] for c in COLUMNS})
+    elif suffix == ".parquet":
+        if pyarrow is None:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+        columns = {c: table[c] for c in COLUMNS}
+        columns["learner"] = pyarrow.DictionaryArray.from_arrays(table["learner"], learners.tolist())
+        columns["word"] = pyarrow.DictionaryArray.from_arrays(table["word"], words.tolist())
+        pyarrow.parquet.write_table(pyarrow.table(columns), output)
+    elif suffix == ".csv":
+        with open(output, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            rows = zip(learners[table["learner"]], words[table["word"]], table["level"],
+                       table["review_index"], table["timestamp"], table["quality"],
+                       table["elapsed_days"], table["ease_factor"])
+            writer.writerows(rows)
+    else:
+        raise ValueError(f"Unsupported output format '{suffix}' (use .csv, .npz or .parquet)")
+
+
+def run_analytics(data_dir: Path, output: Path = None) -> dict:
+    """Build the cohort table, optionally export it, and return the metrics."""
+    table = flatten_reviews(data_dir)
+    if output:
+        export_table(table, output)
+    return {
+        "learners": len(table["learners"]),
+        "words": len(table["words"]),
+        "reviews": int(len(table["quality"])),
+        "retention": round(float((table["quality"] >= 3).mean()), 4) if len(table["quality"]) else 0,
+        "retention_by_interval": retention_by_interval(table),
+        "ease_factor_distribution": ease_distribution(table),
+        "workload": workload_curve(table),
+    }
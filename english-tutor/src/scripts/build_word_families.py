@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Build the word-family table (references/word-families.json)
+
+Generates inflected forms of every word in vocabulary-lists.md with spelling
+rules plus a table of irregular forms: -s/-ed/-ing for nouns and verbs, and
+-er/-est only for the adjectives tagged in ADJECTIVES (so 'butter', 'shower'
+or 'news' are never read as forms of 'but', 'show' or 'new'). It also
+groups list words into families using derivational prefixes and suffixes
+(fair/unfair, teach/teacher, happy/happily), except pairs listed as
+UNRELATED (fact/factor). The result is a compact lookup
+table used by progress_manager.py to merge inflections in add_word and to
+suggest unseen family members.
+
+Run this again whenever vocabulary-lists.md changes.
+
+Usage:
+    python build_word_families.py [--output FILE]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import progress_manager as pm
+
+OUTPUT_FILE = pm.REFERENCES_DIR / "word-families.json"
+
+VOWELS = "aeiou"
+
+# Irregular forms: base -> forms (verbs, nouns and adjectives used at levels 1-5)
+IRREGULAR = {
+    "be": ["am", "is", "are", "was", "were", "been", "being"],
+    "have": ["has", "had", "having"],
+    "do": ["does", "did", "done", "doing"],
+    "go": ["goes", "went", "gone", "going"],
+    "run": ["ran"],
+    "eat": ["ate", "eaten"],
+    "drink": ["drank", "drunk"],
+    "sleep": ["slept"],
+    "write": ["wrote", "written"],
+    "draw": ["drew", "drawn"],
+    "sing": ["sang", "sung"],
+    "swim": ["swam", "swum"],
+    "fly": ["flew", "flown"],
+    "sit": ["sat"],
+    "stand": ["stood"],
+    "speak": ["spoke", "spoken"],
+    "come": ["came"],
+    "see": ["saw", "seen"],
+    "give": ["gave", "given"],
+    "take": ["took", "taken"],
+    "make": ["made"],
+    "know": ["knew", "known"],
+    "find": ["found"],
+    "get": ["got", "gotten"],
+    "say": ["said"],
+    "think": ["thought"],
+    "bring": ["brought"],
+    "buy": ["bought"],
+    "catch": ["caught"],
+    "teach": ["taught"],
+    "hold": ["held"],
+    "break": ["broke", "broken"],
+    "build": ["built"],
+    "choose": ["chose", "chosen"],
+    "lead": ["led"],
+    "lend": ["lent"],
+    "throw": ["threw", "thrown"],
+    "begin": ["began", "begun"],
+    "feel": ["felt"],
+    "keep": ["kept"],
+    "leave": ["left"],
+    "lose": ["lost"],
+    "meet": ["met"],
+    "pay": ["paid"],
+    "tell": ["told"],
+    "win": ["won"],
+    "wear": ["wore", "worn"],
+    "grow": ["grew", "grown"],
+    "hide": ["hid", "hidden"],
+    "ride": ["rode", "ridden"],
+    "forgive": ["forgave", "forgiven"],
+    "understand": ["understood"],
+    "forget": ["forgot", "forgotten"],
+    "lie": ["lay", "lain", "lying"],
+    "child": ["children"],
+    "man": ["men"],
+    "woman": ["women"],
+    "mouse": ["mice"],
+    "foot": ["feet"],
+    "tooth": ["teeth"],
+    "person": ["people"],
+    "criterion": ["criteria"],
+    "phenomenon": ["phenomena"],
+    "good": ["better", "best"],
+    "bad": ["worse", "worst"],
+}
+
+# Uninflected forms that are written the same (cut/cut/cut)
+UNCHANGED = {"cut", "put", "hit", "let", "set", "read", "hurt", "cost", "shut", "quit"}
+
+# Function words are never inflected (the -> thing, he -> her, but -> butter)
+FUNCTION_WORDS = {"a", "an", "the", "i", "he", "she", "we", "me", "his", "her", "they",
+                  "them", "this", "that", "these", "those", "there", "their", "then", "than",
+                  "and", "to", "in", "it", "you", "for", "on", "with", "as", "at", "from",
+                  "by", "but", "some", "what", "can", "out", "all", "your", "when", "up",
+                  "how", "each", "which", "if", "will", "about", "many", "so", "him", "my",
+                  "no", "most", "who", "over", "could", "would", "may", "down", "now", "any",
+                  "where", "after", "only", "every", "our", "under", "more", "other"}
+
+# Gradable adjectives in the lists: the only words given -er/-est, and not
+# -s/-ed/-ing (new -> news). Agent nouns (singer, player) are not inflections
+ADJECTIVES = {"big", "small", "tall", "long", "little", "new", "hot", "cold", "warm", "cool",
+              "fast", "slow", "strong", "weak", "soft", "hard", "easy", "heavy", "light",
+              "clean", "dirty", "wet", "dry", "loud", "quiet", "bright", "dark", "smooth",
+              "rough", "ugly", "happy", "sad", "angry", "hungry", "thirsty", "shy", "brave",
+              "kind", "friendly", "lonely", "healthy", "sick", "simple", "rare", "fair",
+              "proud", "common", "real"}
+
+# Adjectives that are also verbs, so they take -s/-ed/-ing too (clean -> cleaned)
+ADJECTIVE_VERBS = {"clean", "dry", "warm", "cool"}
+
+# Affixes whose removal reliably leaves a related word; 're', 'in' and '-y'
+# are left out because they mostly produce false pairs (search/research,
+# come/income, part/party)
+PREFIXES = ("un", "dis", "im", "ir", "il", "non")
+SUFFIXES = ("ation", "ness", "ment", "less", "ship", "able", "ful", "ion", "ity",
+            "ist", "ous", "ive", "ly", "er", "or", "al")
+
+# List-word pairs an affix rule links although they are unrelated in meaning
+UNRELATED = {frozenset(pair) for pair in [
+    ("author", "authority"), ("fact", "factor"), ("public", "publication"),
+    ("specific", "specification"), ("practice", "practical"), ("consider", "considerable"),
+    ("corporate", "corporation"), ("converse", "conversation"),
+]}
+
+# Shortest word that is inflected or used as a stem when linking families
+MIN_STEM = 3
+
+
+def _vowel_groups(word: str) -> int:
+    groups, previous = 0, False
+    for ch in word:
+        is_vowel = ch in VOWELS
+        if is_vowel and not previous:
+            groups += 1
+        previous = is_vowel
+    return groups
+
+
+def _doubles_final(word: str) -> bool:
+    """Single-syllable consonant-vowel-consonant words double before -ed/-ing."""
+    return (len(word) >= 3 and _vowel_groups(word) == 1 and word[-1] not in VOWELS + "wxy"
+            and word[-2] in VOWELS and word[-3] not in VOWELS)
+
+
+def _with_suffix(base: str, suffix: str) -> str:
+    """Attach -ed, -ing, -er or -est with the usual spelling changes."""
+    if base.endswith("ie"):
+        return base[:-2] + "ying" if suffix == "ing" else base + suffix[1:]
+    if base.endswith("e"):
+        return base[:-1] + "ing" if suffix == "ing" else base + suffix[1:]
+    if base.endswith("y") and len(base) > 1 and base[-2] not in VOWELS:
+        return base + suffix if suffix == "ing" else base[:-1] + "i" + suffix
+    if _doubles_final(base):
+        return base + base[-1] + suffix
+    return base + suffix
+
+
+def inflect(base: str) -> set:
+    """Regular noun and verb forms of a base word (not all are real words)."""
+    forms = set()
+    if base.endswith(("s", "x", "z", "ch", "sh", "o")):
+        forms.add(base + "es")
+    elif base.endswith("y") and len(base) > 1 and base[-2] not in VOWELS:
+        forms.add(base[:-1] + "ies")
+    else:
+        forms.add(base + "s")
+    if base.endswith("fe"):
+        forms.add(base[:-2] + "ves")
+    elif base.endswith("f"):
+        forms.add(base[:-1] + "ves")
+    forms.update(_with_suffix(base, suffix) for suffix in ("ed", "ing"))
+    forms.discard(base)
+    return forms
+
+
+def compare(base: str) -> set:
+    """Comparative and superlative of an adjective."""
+    return {_with_suffix(base, suffix) for suffix in ("er", "est")}
+
+
+def regular_forms(word: str) -> set:
+    """Regular forms of a list word, by its part of speech."""
+    if len(word) < MIN_STEM or word in FUNCTION_WORDS | UNCHANGED:
+        return set()
+    if word in ADJECTIVES:
+        return compare(word) | (inflect(word) if word in ADJECTIVE_VERBS else set())
+    return inflect(word)
+
+
+def stem_candidates(word: str) -> set:
+    """Possible list-word stems of a derived word."""
+    candidates = set()
+    for prefix in PREFIXES:
+        if word.startswith(prefix) and len(word) - len(prefix) >= MIN_STEM:
+            candidates.add(word[len(prefix):])
+    for suffix in SUFFIXES:
+        if not word.endswith(suffix) or len(word) - len(suffix) < MIN_STEM:
+            continue
+        stem = word[:-len(suffix)]
+        candidates.update({stem, stem + "e"})
+        if stem.endswith("i"):
+            candidates.add(stem[:-1] + "y")          # happily -> happy
+        if len(stem) > 1 and stem[-1] == stem[-2]:
+            candidates.add(stem[:-1])                # runner -> run
+    return {c for c in candidates if len(c) >= MIN_STEM and c != word}
+
+
+def build_table(level_words: dict) -> dict:
+    """Build the lemma, family and level tables from {level: [words]}."""
+    levels = {}
+    for level, words in sorted(level_words.items()):
+        for word in words:
+            levels.setdefault(word, level)
+    list_words = set(levels)
+
+    # Inflected form -> lemma. List words are always their own lemma, so
+    # 'morning' or 'bed' never collapse into 'morn' or 'be'
+    lemmas = {}
+    for base in sorted(list_words | set(IRREGULAR)):
+        generated = regular_forms(base) | set(IRREGULAR.get(base, []))
+        for form in generated:
+            if form not in list_words:
+                lemmas.setdefault(form, base)
+
+    # Families: union list words linked by inflection or derivation
+    parent = {word: word for word in list_words}
+
+    def find(word):
+        while parent[word] != word:
+            parent[word] = parent[parent[word]]
+            word = parent[word]
+        return word
+
+    inflected = set()
+    for word in sorted(list_words):
+        forms = set(IRREGULAR.get(word, [])) | regular_forms(word)
+        inflected |= forms & list_words
+        for other in (forms | stem_candidates(word)) & list_words:
+            if frozenset((word, other)) not in UNRELATED:
+                parent[find(other)] = find(word)
+
+    groups = {}
+    for word in list_words:
+        groups.setdefault(find(word), []).append(word)
+
+    # A family is named after its simplest base word (make, not made)
+    families = {}
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        root = min(members, key=lambda w: (w in inflected, len(w), levels[w], w))
+        families[root] = sorted(members, key=lambda w: (levels[w], w))
+    families = dict(sorted(families.items()))
+
+    return {
+        "version": 1,
+        "source": "vocabulary-lists.md",
+        "levels": dict(sorted(levels.items())),
+        "lemmas": dict(sorted(lemmas.items())),
+        "families": families,
+        "irregular": {base: forms for base, forms in sorted(IRREGULAR.items()) if base in list_words},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the word-family lookup table")
+    parser.add_argument("--output", help=f"Output file (default: {OUTPUT_FILE})")
+
+    args = parser.parse_args()
+
+    table = build_table(pm.load_level_words())
+    output = Path(args.output) if args.output else OUTPUT_FILE
+    with open(output, "w") as f:
+        json.dump(table, f, separators=(",", ":"), sort_keys=False)
+        f.write("\n")
+    print(f"Wrote {len(table['lemmas'])} inflected forms and {len(table['families'])} families "
+          f"({len(table['levels'])} list words) to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+English Tutor Load Test
+
+Reproduces many tutoring agents sharing one data directory. N worker
+processes run session scripts (get-daily, add-word, update-batch, stats)
+against a pool of generated learners in a temporary data directory, then the
+final profiles are checked for lost or corrupted updates by comparing review
+counts with the number of reviews the workers submitted.
+
+By default commands run in-process through progress_manager.main(); with
+--subprocess every command is a separate `python progress_manager.py` run,
+like an agent invoking the CLI.
+
+Usage:
+    python load_test.py [--workers N] [--learners L] [--sessions S] [--subprocess]
+
+Examples:
+    python load_test.py --workers 8 --learners 4 --sessions 50
+    python load_test.py --workers 16 --learners 1 --subprocess --json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+import progress_manager as pm
+
+OPERATIONS = ("get-daily", "add-word", "update-batch", "stats")
+
+# Session shape: words per get-daily call and vocabulary each learner starts with
+SESSION_COUNT = 5
+SEED_WORDS = 50
+
+
+def create_learners(data_dir: Path, learners: int, seed_words: int) -> list:
+    """Generate learner profiles with a backlog of words due for review."""
+    pm.DATA_DIR = data_dir
+    names = [f"load-{i}" for i in range(learners)]
+    start = pm.now() - timedelta(days=30)
+    for name in names:
+        data = pm.new_learner_data(name)
+        for j in range(seed_words):
+            pm.add_word(data, f"seed{j}", introduced_at=start + timedelta(hours=j), verbose=False)
+        pm.save_learner(name, data, verbose=False)
+    return names
+
+
+def run_command(argv: list, data_dir: Path, use_subprocess: bool) -> str:
+    """Run one progress_manager command and return its output."""
+    if use_subprocess:
+        # progress_manager keeps its data under $HOME/.english-tutor
+        env = dict(os.environ, HOME=str(data_dir.parent))
+        result = subprocess.run([sys.executable, pm.__file__] + argv, env=env,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else
+                               f"exit status {result.returncode}")
+        return result.stdout
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            pm.main(argv)
+        except SystemExit as e:
+            if e.code:
+                raise RuntimeError(output.getvalue().strip().splitlines()[-1])
+    return output.getvalue()
+
+
+def run_worker(worker_id: int, data_dir: str, names: list, sessions: int,
+               seed: int, use_subprocess: bool) -> dict:
+    """Run `sessions` tutoring sessions, each against a randomly chosen learner."""
+    data_dir = Path(data_dir)
+    pm.DATA_DIR = data_dir
+    rng = random.Random(seed * 7919 + worker_id)
+    latencies = {op: [] for op in OPERATIONS}
+    errors = {op: 0 for op in OPERATIONS}
+    submitted = {name: 0 for name in names}
+    first_error = None
+
+    def timed(op: str, argv: list) -> str:
+        nonlocal first_error
+        started = time.perf_counter()
+        try:
+            output = run_command(argv, data_dir, use_subprocess)
+        except Exception as e:
+            errors[op] += 1
+            first_error = first_error or f"{op}: {e}"
+            output = None
+        latencies[op].append(time.perf_counter() - started)
+        return output
+
+    for session in range(sessions):
+        name = rng.choice(names)
+        output = timed("get-daily", ["get-daily", name, "--count", str(SESSION_COUNT)])
+        try:
+            daily = json.loads(output) if output else {}
+        except ValueError:
+            daily = {}
+            errors["get-daily"] += 1
+
+        words = [item["word"] for item in daily.get("review_words", [])]
+        new_words = [f"w{worker_id}x{session}x{i}" for i in range(daily.get("new_word_slots", 0))]
+        # Words whose add-word failed would make their updates fail too and
+        # show up as lost updates; only review words that were added
+        if new_words and timed("add-word", ["add-word", name] + new_words) is not None:
+            words += new_words
+
+        if words:
+            pairs = [f"{word}={rng.randint(0, 5)}" for word in words]
+            if timed("update-batch", ["update-batch", name] + pairs) is not None:
+                submitted[name] += len(pairs)
+
+        timed("stats", ["stats", name])
+
+    return {"latencies": latencies, "errors": errors, "submitted": submitted,
+            "first_error": first_error}
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def check_learners(data_dir: Path, names: list, submitted: dict) -> dict:
+    """Compare every final profile with the reviews the workers submitted."""
+    results = {}
+    for name in names:
+        path = data_dir / f"{name}.json"
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            results[name] = {"expected": submitted[name], "recorded": None,
+                             "lost": submitted[name], "corrupted": True, "error": str(e)}
+            continue
+        vocabulary = data.get("vocabulary", {})
+        history = sum(len(w.get("review_history", [])) for w in vocabulary.values())
+        recorded = data.get("stats", {}).get("total_reviews", 0)
+        results[name] = {
+            "expected": submitted[name],
+            "recorded": recorded,
+            "lost": submitted[name] - recorded,
+            # The counter and the per-word histories must agree
+            "corrupted": history != recorded or
+                         data.get("stats", {}).get("words_learned") != len(vocabulary),
+        }
+    return results
+
+
+def run_load_test(workers: int, learners: int, sessions: int, seed: int = 0,
+                  use_subprocess: bool = False, seed_words: int = SEED_WORDS,
+                  keep_dir: bool = False) -> dict:
+    """Generate learners, run the workers concurrently and summarize."""
+    root = Path(tempfile.mkdtemp(prefix="english-tutor-load-"))
+    data_dir = root / ".english-tutor"
+    try:
+        names = create_learners(data_dir, learners, seed_words)
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_worker, i, str(data_dir), names, sessions,
+                                       seed, use_subprocess) for i in range(workers)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+        submitted = {name: sum(r["submitted"][name] for r in results) for name in names}
+        learner_checks = check_learners(data_dir, names, submitted)
+    finally:
+        if not keep_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    operations = {}
+    total_ops = 0
+    for op in OPERATIONS:
+        values = sorted(v for r in results for v in r["latencies"][op])
+        total_ops += len(values)
+        operations[op] = {
+            "count": len(values),
+            "errors": sum(r["errors"][op] for r in results),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        }
+
+    expected = sum(submitted.values())
+    lost = sum(max(0, c["lost"]) for c in learner_checks.values())
+    return {
+        "workers": workers,
+        "learners": learners,
+        "sessions_per_worker": sessions,
+        "mode": "subprocess" if use_subprocess else "in-process",
+        "data_dir": str(data_dir) if keep_dir else None,
+        "elapsed_seconds": round(elapsed, 2),
+        "ops": total_ops,
+        "ops_per_second": round(total_ops / elapsed, 1) if elapsed else 0.0,
+        "operations": operations,
+        "reviews_submitted": expected,
+        "reviews_lost": lost,
+        "lost_rate": round(lost / expected, 4) if expected else 0.0,
+        "corrupted_learners": sorted(n for n, c in learner_checks.items() if c["corrupted"]),
+        "first_error": next((r["first_error"] for r in results if r["first_error"]), None),
+        "per_learner": learner_checks,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Load test: {report['workers']} workers x {report['sessions_per_worker']} sessions "
+          f"on {report['learners']} learner(s), {report['mode']}")
+    print(f"  {report['ops']} ops in {report['elapsed_seconds']}s "
+          f"({report['ops_per_second']} ops/sec)")
+    print()
+    print(f"  {'operation':<14}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for op, stats in report["operations"].items():
+        print(f"  {op:<14}{stats['count']:>7}{stats['errors']:>8}{stats['p50_ms']:>10}"
+              f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+    print()
+    print(f"  Reviews submitted: {report['reviews_submitted']}")
+    print(f"  Reviews lost:      {report['reviews_lost']} ({report['lost_rate']:.1%})")
+    corrupted = report["corrupted_learners"]
+    print(f"  Corrupted profiles: {len(corrupted)}" + (f" ({', '.join(corrupted)})" if corrupted else ""))
+    if report["first_error"]:
+        print(f"  First error: {report['first_error']}")
+    if report["data_dir"]:
+        print(f"  Data kept in {report['data_dir']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent load test for the progress manager")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--learners", type=int, default=2, help="Learners shared by all workers")
+    parser.add_argument("--sessions", type=int, default=20, help="Sessions per worker")
+    parser.add_argument("--seed-words", type=int, default=SEED_WORDS,
+                        help="Words each learner starts with (all due for review)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run every command as a separate CLI process")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated data directory")
+    parser.add_argument("--json", action="store_true", help="Output the full report as JSON")
+
+    args = parser.parse_args()
+
+    report = run_load_test(args.workers, args.learners, args.sessions, args.seed,
+                           args.subprocess, args.seed_words, args.keep)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    # Non-zero exit makes lost updates visible in CI
+    return 1 if report["reviews_lost"] or report["corrupted_learners"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
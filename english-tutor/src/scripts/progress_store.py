@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+English Tutor Progress Store
+
+Async API over the learner profiles managed by progress_manager.py, for
+embedding in asyncio services. Nothing is printed; blocking file I/O and JSON
+encoding run on a bounded thread pool. Profiles stay in memory once loaded,
+and concurrent writes to the same learner are coalesced into a single save.
+
+Example:
+    store = ProgressStore(max_workers=4)
+    daily = await store.get_daily("link", count=5)
+    await store.add_words("link", ["apple"])
+    await store.record_review("link", "apple", 4)
+    print(await store.stats("link"))
+    await store.close()
+"""
+
+import asyncio
+import copy
+import functools
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import progress_manager as pm
+
+
+class LearnerNotFound(LookupError):
+    """Raised when a learner profile does not exist."""
+
+
+class WordNotFound(LookupError):
+    """Raised when a word is not in the learner's vocabulary."""
+
+
+def _read_profile(path: Path) -> tuple:
+    """Load a profile and return it with the file signature, or (None, None)."""
+    try:
+        with open(path, "r") as f:
+            info = os.fstat(f.fileno())
+            return json.load(f), (info.st_mtime_ns, info.st_size)
+    except FileNotFoundError:
+        return None, None
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+# Same layout as progress_manager.save_learner
+_encode = functools.partial(json.dumps, indent=2, default=str)
+
+
+def _write_profile(path: Path, payload: str) -> tuple:
+    """Replace the profile atomically and return the new file signature."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(temp_name, path)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+    return _file_signature(path)
+
+
+class _Learner:
+    """In-memory state of one learner profile."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = asyncio.Lock()
+        self.data = None
+        self.signature = None   # (mtime_ns, size) of the file we last read or wrote
+        self.waiters = []       # futures resolved by the next completed save
+        self.saver = None       # running save task, if any
+
+
+class ProgressStore:
+    """
+    Async access to learner profiles.
+
+    Mutating methods return once the change has been saved. Callers that
+    modify the same learner while a save is running share the next save.
+    Profiles changed on disk by another process (e.g. the CLI) are reloaded
+    before use as long as no save is pending.
+    """
+
+    def __init__(self, data_dir: Optional[Path] = None, max_workers: int = 4,
+                 save_delay: float = 0.0):
+        self.data_dir = Path(data_dir) if data_dir else pm.DATA_DIR
+        self.save_delay = save_delay
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="progress-store")
+        self._learners = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _learner(self, name: str) -> _Learner:
+        key = name.lower()
+        learner = self._learners.get(key)
+        if learner is None:
+            learner = self._learners[key] = _Learner(self.data_dir / f"{key}.json")
+        return learner
+
+    async def _ensure_loaded(self, learner: _Learner, name: str) -> dict:
+        """Load (or reload, if changed on disk) the profile. Caller holds the lock."""
+        if learner.data is not None:
+            if learner.saver is not None or learner.waiters:
+                return learner.data
+            if await self._run(_file_signature, learner.path) == learner.signature:
+                return learner.data
+        learner.data, learner.signature = await self._run(_read_profile, learner.path)
+        if learner.data is None:
+            raise LearnerNotFound(f"Learner '{name}' not found")
+        return learner.data
+
+    async def _read(self, name: str, func):
+        """Run func(data) against the loaded profile without saving."""
+        learner = self._learner(name)
+        async with learner.lock:
+            data = await self._ensure_loaded(learner, name)
+            return func(data)
+
+    async def _modify(self, name: str, func):
+        """Run func(data) under the learner lock, then wait for the coalesced save."""
+        learner = self._learner(name)
+        async with learner.lock:
+            data = await self._ensure_loaded(learner, name)
+            result = func(data)
+        await self._save(learner)
+        return result
+
+    async def _save(self, learner: _Learner) -> None:
+        future = asyncio.get_running_loop().create_future()
+        learner.waiters.append(future)
+        if learner.saver is None:
+            learner.saver = asyncio.create_task(self._save_loop(learner))
+        await future
+
+    async def _save_loop(self, learner: _Learner) -> None:
+        try:
+            if self.save_delay:
+                await asyncio.sleep(self.save_delay)
+            while learner.waiters:
+                waiters, learner.waiters = learner.waiters, []
+                try:
+                    # Encoding holds the lock so the profile cannot change mid-dump;
+                    # the write itself does not
+                    async with learner.lock:
+                        payload = await self._run(_encode, learner.data)
+                    learner.signature = await self._run(_write_profile, learner.path, payload)
+                except Exception as e:
+                    for future in waiters:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for future in waiters:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            learner.saver = None
+
+    async def create_learner(self, name: str, age: int = 10, level: int = 1,
+                             learner_type: str = "child", mother_tongue: Optional[str] = None,
+                             interests: Optional[str] = None) -> dict:
+        """Create a new learner profile (replacing any existing one)."""
+        learner = self._learner(name)
+        async with learner.lock:
+            learner.data = pm.new_learner_data(name, age, level, learner_type,
+                                               mother_tongue, interests)
+            result = copy.deepcopy(learner.data)
+        await self._save(learner)
+        return result
+
+    async def exists(self, name: str) -> bool:
+        """Check whether a learner profile exists."""
+        try:
+            await self._read(name, lambda data: None)
+        except LearnerNotFound:
+            return False
+        return True
+
+    async def get_profile(self, name: str) -> dict:
+        """Return a copy of the full learner profile."""
+        return await self._read(name, copy.deepcopy)
+
+    async def get_daily(self, name: str, count: int = 5) -> dict:
+        """Words to review and new word slots for today's session."""
+        return await self._read(name, lambda data: pm.get_daily_words(data, count))
+
+    async def stats(self, name: str) -> dict:
+        """Learner statistics, as reported by the `stats` command."""
+        return await self._read(name, pm.get_stats)
+
+    async def add_words(self, name: str, words: list, level: Optional[int] = None,
+                        merge_forms: bool = False) -> list:
+        """
+        Add words to the vocabulary, as `add-word` does. Returns the words
+        that became new vocabulary entries; with merge_forms, inflected forms
+        recorded under a tracked base word are not included.
+        """
+        def apply(data):
+            added = []
+            for word in words:
+                if word.lower() not in data.get("vocabulary", {}):
+                    pm.add_word(data, word, level, verbose=False, merge_forms=merge_forms)
+                    if word.lower() in data["vocabulary"]:
+                        added.append(word)
+            return added
+        return await self._modify(name, apply)
+
+    async def record_review(self, name: str, word: str, quality: int) -> dict:
+        """Record one review (quality 0-5) and return the word's new schedule."""
+        results = await self.record_reviews(name, [(word, quality)])
+        return results[0]
+
+    async def record_reviews(self, name: str, reviews: list) -> list:
+        """
+        Record several (word, quality) reviews with a single save. A form
+        of a tracked word ('runs') counts for that word, as with `update`.
+        Raises WordNotFound (and records nothing) if any word is unknown.
+        """
+        def apply(data):
+            vocabulary = data.get("vocabulary", {})
+            keys = []
+            for word, quality in reviews:
+                key = pm.resolve_word(data, word)
+                if key is None:
+                    raise WordNotFound(f"Word '{word}' not found in vocabulary")
+                if not 0 <= quality <= 5:
+                    raise ValueError(f"Quality must be between 0 and 5, got {quality}")
+                keys.append(key)
+            results = []
+            for (word, quality), key in zip(reviews, keys):
+                pm.update_word(data, key, quality, verbose=False)
+                word_data = vocabulary[key]
+                results.append({
+                    "word": word,
+                    "mastery_level": word_data["mastery_level"],
+                    "interval_days": word_data["interval_days"],
+                    "next_review": word_data["next_review"],
+                })
+            return results
+        return await self._modify(name, apply)
+
+    async def record_assessment(self, name: str, level: int, vocab_size: int) -> None:
+        """Record an assessment result and update the learner's level."""
+        await self._modify(name, lambda data: pm.update_assessment(data, level, vocab_size) and None)
+
+    async def update_interests(self, name: str, interests: str) -> None:
+        """Replace the learner's interests."""
+        await self._modify(name, lambda data: pm.update_interests(data, interests) and None)
+
+    async def flush(self) -> None:
+        """Wait for every pending save to finish."""
+        savers = [learner.saver for learner in self._learners.values() if learner.saver]
+        if savers:
+            await asyncio.gather(*savers, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush pending saves and shut down the worker threads."""
+        await self.flush()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+English Tutor Reference Index
+
+Indexes the Markdown files in references/ by heading so a single section can
+be read with one seek instead of loading the whole document. The index maps
+every heading (including standalone **bold** subheadings) to the byte range
+of its section and is rebuilt automatically for files whose mtime or size
+changed. Used by the `ref` command of progress_manager.py.
+
+Usage:
+    python reference_index.py [--rebuild] [--index FILE]
+
+Examples:
+    python progress_manager.py ref vocab --level 3 --theme descriptors
+    python progress_manager.py ref srs --section "mastery levels"
+    python progress_manager.py ref assessment --list
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Reference documents shipped with the skill
+REFERENCES_DIR = Path(__file__).resolve().parent.parent / "references"
+
+# Short names accepted by the `ref` command
+DOCUMENTS = {
+    "vocab": "vocabulary-lists.md",
+    "srs": "spaced-repetition.md",
+    "assessment": "assessment-guide.md",
+}
+
+# Default index location; progress_manager passes its own DATA_DIR-based path
+INDEX_FILE = Path.home() / ".english-tutor" / "index" / "references.json"
+
+INDEX_VERSION = 1
+
+# Standalone bold lines act as headings one level below ###
+BOLD_DEPTH = 4
+
+_HEADING_RE = re.compile(rb"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_BOLD_RE = re.compile(rb"^\*\*([^*]+?)\*\*\s*$")
+
+
+def index_file_sections(path: Path) -> list:
+    """
+    Scan a Markdown file and return its sections in document order.
+    Each section records the byte range of its body (after the heading line)
+    up to the next heading of the same or a higher level.
+    """
+    sections = []
+    open_sections = []
+    offset = 0
+    in_fence = False
+    with open(path, "rb") as f:
+        for line in f:
+            start = offset
+            offset += len(line)
+            stripped = line.strip()
+            if stripped.startswith(b"```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+
+            match = _HEADING_RE.match(stripped)
+            if match:
+                depth, title = len(match.group(1)), match.group(2)
+            else:
+                match = _BOLD_RE.match(stripped)
+                if not match:
+                    continue
+                depth, title = BOLD_DEPTH, match.group(1)
+
+            while open_sections and open_sections[-1]["depth"] >= depth:
+                open_sections.pop()["end"] = start
+            section = {
+                "title": title.decode("utf-8").strip().rstrip(":"),
+                "depth": depth,
+                "parent": sections.index(open_sections[-1]) if open_sections else None,
+                "start": offset,
+                "end": None,
+            }
+            sections.append(section)
+            open_sections.append(section)
+    for section in open_sections:
+        section["end"] = offset
+    return sections
+
+
+def _load_saved(index_file: Path) -> dict:
+    try:
+        with open(index_file, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index if index.get("version") == INDEX_VERSION else {}
+
+
+def _save(index: dict, index_file: Path) -> None:
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=index_file.parent, prefix=".references-")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(temp_name, index_file)
+    except OSError:
+        # A read-only data directory only costs a rebuild next time
+        pass
+
+
+def load_index(index_file: Path = None, references_dir: Path = None, rebuild: bool = False) -> dict:
+    """Return the section index, reindexing any reference file that changed."""
+    index_file = index_file or INDEX_FILE
+    references_dir = references_dir or REFERENCES_DIR
+    index = {} if rebuild else _load_saved(index_file)
+    files = index.get("files", {})
+
+    changed = index.get("references_dir") != str(references_dir)
+    if changed:
+        files = {}
+    for filename in DOCUMENTS.values():
+        path = references_dir / filename
+        info = path.stat()
+        entry = files.get(filename)
+        if entry and entry["mtime_ns"] == info.st_mtime_ns and entry["size"] == info.st_size:
+            continue
+        files[filename] = {
+            "mtime_ns": info.st_mtime_ns,
+            "size": info.st_size,
+            "sections": index_file_sections(path),
+        }
+        changed = True
+
+    index = {"version": INDEX_VERSION, "references_dir": str(references_dir), "files": files}
+    if changed:
+        _save(index, index_file)
+    return index
+
+
+def read_section(index: dict, doc: str, section: dict) -> str:
+    """Read one section body from disk using its byte range."""
+    path = Path(index["references_dir"]) / DOCUMENTS[doc]
+    with open(path, "rb") as f:
+        f.seek(section["start"])
+        data = f.read(section["end"] - section["start"])
+    text = data.decode("utf-8").strip()
+    # Drop the horizontal rule that separates top-level sections
+    if text.endswith("\n---") or text == "---":
+        text = text[:-3].rstrip()
+    return text
+
+
+def find_sections(index: dict, doc: str, query: str, within: int = None) -> list:
+    """
+    Sections of doc whose title contains query (case-insensitive).
+    With within, only descendants of that section index are considered.
+    """
+    sections = index["files"][DOCUMENTS[doc]]["sections"]
+    query = query.lower().strip()
+    matches = []
+    for i, section in enumerate(sections):
+        if query not in section["title"].lower():
+            continue
+        if within is not None and not _is_descendant(sections, i, within):
+            continue
+        matches.append(i)
+    return matches
+
+
+def _is_descendant(sections: list, i: int, ancestor: int) -> bool:
+    parent = sections[i]["parent"]
+    while parent is not None:
+        if parent == ancestor:
+            return True
+        parent = sections[parent]["parent"]
+    return False
+
+
+def outline(index: dict, doc: str) -> list:
+    """Heading outline of a document."""
+    return [{"title": s["title"], "depth": s["depth"]}
+            for s in index["files"][DOCUMENTS[doc]]["sections"]]
+
+
+def parse_word_list(text: str) -> list:
+    """Split the comma-separated word lines of a section body into entries."""
+    words = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#*|`-" or "," not in line:
+            continue
+        words.extend(w.strip() for w in line.split(",") if w.strip())
+    return words
+
+
+def parse_tables(text: str) -> list:
+    """Parse Markdown tables into lists of row dicts keyed by header."""
+    tables = []
+    rows = []
+    for line in text.splitlines() + [""]:
+        line = line.strip()
+        if line.startswith("|"):
+            rows.append([cell.strip() for cell in line.strip("|").split("|")])
+            continue
+        if len(rows) >= 2:
+            header = rows[0]
+            body = [r for r in rows[1:] if not all(set(c) <= set("-: ") for c in r)]
+            tables.append([dict(zip(header, r)) for r in body])
+        rows = []
+    return tables
+
+
+def level_sections(index: dict) -> dict:
+    """Map level number -> section index for the '## Level N' sections."""
+    levels = {}
+    for i, section in enumerate(index["files"][DOCUMENTS["vocab"]]["sections"]):
+        parts = section["title"].split()
+        if section["depth"] == 2 and len(parts) >= 2 and parts[0] == "Level" \
+                and parts[1].rstrip(":").isdigit():
+            levels[int(parts[1].rstrip(":"))] = i
+    return levels
+
+
+def vocab_level(index: dict, level: int, theme: str = None) -> dict:
+    """
+    Word lists of one level, grouped by subsection. With theme, only the
+    subsections whose title matches it. Raises KeyError if nothing matches.
+    """
+    levels = level_sections(index)
+    if level not in levels:
+        raise KeyError(f"No vocabulary list for level {level} (available: "
+                       f"{', '.join(str(l) for l in sorted(levels))})")
+    sections = index["files"][DOCUMENTS["vocab"]]["sections"]
+    root = levels[level]
+
+    groups = []
+    for i, section in enumerate(sections):
+        if not _is_descendant(sections, i, root):
+            continue
+        words = parse_word_list(read_section(index, "vocab", section)) \
+            if not any(s["parent"] == i for s in sections) else []
+        if words:
+            groups.append({"theme": section["title"], "words": words})
+
+    if theme:
+        available = [g["theme"] for g in groups]
+        groups = [g for g in groups if theme.lower() in g["theme"].lower()]
+        if not groups:
+            raise KeyError(f"No theme matching '{theme}' at level {level} "
+                           f"(available: {', '.join(available)})")
+
+    return {
+        "level": level,
+        "title": sections[root]["title"],
+        "groups": groups,
+        "word_count": sum(len(g["words"]) for g in groups),
+    }
+
+
+def section_content(index: dict, doc: str, query: str) -> dict:
+    """The first section matching query, with any tables parsed."""
+    matches = find_sections(index, doc, query)
+    if not matches:
+        raise KeyError(f"No section matching '{query}' in {DOCUMENTS[doc]}")
+    section = index["files"][DOCUMENTS[doc]]["sections"][matches[0]]
+    text = read_section(index, doc, section)
+    result = {"document": DOCUMENTS[doc], "title": section["title"], "text": text}
+    tables = parse_tables(text)
+    if tables:
+        result["tables"] = tables
+    if len(matches) > 1:
+        sections = index["files"][DOCUMENTS[doc]]["sections"]
+        result["other_matches"] = [sections[i]["title"] for i in matches[1:]]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the reference section index")
+    parser.add_argument("--rebuild", action="store_true", help="Reindex every file")
+    parser.add_argument("--index", help=f"Index file (default: {INDEX_FILE})")
+
+    args = parser.parse_args()
+
+    index_file = Path(args.index) if args.index else INDEX_FILE
+    index = load_index(index_file, rebuild=args.rebuild)
+    for filename, entry in index["files"].items():
+        print(f"{filename}: {len(entry['sections'])} sections")
+    print(f"Index: {index_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+English Tutor Trace Replay
+
+Re-runs a trace of real progress_manager.py invocations against a copy of a
+data directory snapshot and measures each command's latency, so two code
+versions can be compared on the production command mix and profile shapes.
+
+Traces are recorded by progress_manager.py itself when ENGLISH_TUTOR_TRACE
+names a file: every invocation appends one JSON line with the subcommand,
+arguments, profile size, timestamp and wall time.
+
+Replayed commands are timed by the same recorder, so the latencies measure
+the command itself like the trace does; process startup is reported
+separately as wall time.
+
+Commands run in-process by default, with the clock set to the time each
+command was recorded so due dates match the original session. With
+--progress-manager every command runs as a separate process of the given
+script instead (another checkout, for example); those use the real clock.
+update-batch --stdin records are skipped because their input is not traced.
+
+Usage:
+    python replay.py run <trace.jsonl> [--snapshot DIR] [--timing fast|original] [--speed X]
+                         [--progress-manager PATH] [--output FILE]
+    python replay.py compare <baseline.json> <current.json> [--threshold PERCENT]
+
+Examples:
+    ENGLISH_TUTOR_TRACE=~/trace.jsonl python progress_manager.py get-daily emma
+    cp -r ~/.english-tutor ~/snapshot   # before recording
+    python replay.py run ~/trace.jsonl --snapshot ~/snapshot --output before.json
+    python replay.py run ~/trace.jsonl --snapshot ~/snapshot --output after.json
+    python replay.py compare before.json after.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import progress_manager as pm
+from load_test import percentile
+
+RESULTS_VERSION = 1
+
+
+def read_trace(trace_file: Path) -> list:
+    """Trace records in file order; unreadable lines are skipped."""
+    records = []
+    with open(trace_file, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("argv"), list):
+                records.append(record)
+    return records
+
+
+def run_traced_command(record: dict, data_dir: Path, script: Path = None) -> str:
+    """
+    Run one recorded invocation; returns 'ok' or 'error'.
+    In-process runs see the clock at the recorded time.
+    """
+    if script:
+        env = dict(os.environ, HOME=str(data_dir.parent))
+        result = subprocess.run([sys.executable, str(script)] + record["argv"], env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return "ok" if result.returncode == 0 else "error"
+
+    recorded = datetime.fromisoformat(record["ts"])
+    started = datetime.now()
+    pm.set_clock(lambda: recorded + (datetime.now() - started))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            pm.main(record["argv"])
+        return "ok"
+    except SystemExit as e:
+        return "error" if e.code else "ok"
+    except Exception:
+        return "error"
+    finally:
+        pm.set_clock()
+
+
+def read_new_record(trace_file: Path, offset: int):
+    """The record appended to trace_file after offset, or None."""
+    try:
+        with open(trace_file, "r") as f:
+            f.seek(offset)
+            lines = f.read().splitlines()
+        return json.loads(lines[-1]) if lines else None
+    except (OSError, ValueError):
+        return None
+
+
+def summarize(samples: list) -> dict:
+    """Latency distribution per command, with the recorded one for reference."""
+    summary = {}
+    for command in sorted({s["command"] for s in samples}):
+        runs = [s for s in samples if s["command"] == command]
+        values = sorted(s["elapsed_ms"] for s in runs)
+        wall = sorted(s["wall_ms"] for s in runs)
+        recorded = sorted(s["recorded_ms"] for s in runs if s["recorded_ms"] is not None)
+        summary[command] = {
+            "count": len(values),
+            "errors": sum(1 for s in runs if s["status"] != s["recorded_status"]),
+            "mean_ms": round(statistics.mean(values), 3),
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+            "max_ms": round(values[-1], 3),
+            "wall_p50_ms": round(percentile(wall, 50), 3),
+            "recorded_p50_ms": round(percentile(recorded, 50), 3) if recorded else None,
+        }
+    return summary
+
+
+def replay(trace_file: Path, snapshot: Path, timing: str = "fast", speed: float = 1.0,
+           script: Path = None, keep_dir: bool = False) -> dict:
+    """Replay a trace against a temporary copy of snapshot and time every command."""
+    records = read_trace(trace_file)
+    replayable = [r for r in records if not r.get("stdin")]
+
+    root = Path(tempfile.mkdtemp(prefix="english-tutor-replay-"))
+    data_dir = root / ".english-tutor"
+    saved_data_dir = pm.DATA_DIR
+    saved_trace = os.environ.get(pm.TRACE_ENV)
+    replay_trace = root / "replay-trace.jsonl"
+    os.environ[pm.TRACE_ENV] = str(replay_trace)
+    samples = []
+    try:
+        if snapshot.exists():
+            shutil.copytree(snapshot, data_dir)
+        else:
+            data_dir.mkdir()
+        pm.DATA_DIR = data_dir
+
+        first = datetime.fromisoformat(replayable[0]["ts"]) if replayable else None
+        started = time.perf_counter()
+        for record in replayable:
+            if timing == "original":
+                offset = (datetime.fromisoformat(record["ts"]) - first).total_seconds() / speed
+                delay = started + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            trace_size = replay_trace.stat().st_size if replay_trace.exists() else 0
+            command_started = time.perf_counter()
+            status = run_traced_command(record, data_dir, script)
+            wall_ms = round((time.perf_counter() - command_started) * 1000, 3)
+            # Arguments rejected by argparse never reach the recorder
+            replayed = read_new_record(replay_trace, trace_size)
+            samples.append({
+                "command": record.get("command") or record["argv"][0],
+                "elapsed_ms": replayed["elapsed_ms"] if replayed else wall_ms,
+                "wall_ms": wall_ms,
+                "recorded_ms": record.get("elapsed_ms"),
+                "status": status,
+                "recorded_status": record.get("status", "ok"),
+                "profile_bytes": record.get("profile_bytes"),
+            })
+        elapsed = time.perf_counter() - started
+    finally:
+        pm.DATA_DIR = saved_data_dir
+        if saved_trace is None:
+            os.environ.pop(pm.TRACE_ENV, None)
+        else:
+            os.environ[pm.TRACE_ENV] = saved_trace
+        if not keep_dir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "trace": str(trace_file),
+        "snapshot": str(snapshot),
+        "mode": f"subprocess ({script})" if script else "in-process",
+        "timing": timing if timing == "fast" else f"original x{speed}",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "data_dir": str(data_dir) if keep_dir else None,
+        "commands_replayed": len(samples),
+        "commands_skipped": len(records) - len(replayable),
+        "elapsed_seconds": round(elapsed, 3),
+        "commands": summarize(samples),
+        "samples": samples,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list:
+    """Per command: p50 and p95 change in percent; a p50 slowdown above threshold is a regression."""
+    rows = []
+    for command, stats in current["commands"].items():
+        before = baseline["commands"].get(command)
+        if not before:
+            continue
+        row = {"command": command, "count": stats["count"]}
+        for key in ("p50_ms", "p95_ms"):
+            row[f"baseline_{key}"] = before[key]
+            row[f"current_{key}"] = stats[key]
+            row[f"{key[:3]}_change_pct"] = (round((stats[key] - before[key]) / before[key] * 100, 1)
+                                            if before[key] else 0.0)
+        row["regression"] = row["p50_change_pct"] > threshold
+        rows.append(row)
+    return rows
+
+
+def print_report(report: dict) -> None:
+    print(f"Replayed {report['commands_replayed']} command(s) in {report['elapsed_seconds']}s "
+          f"({report['mode']}, {report['timing']} timing)")
+    if report["commands_skipped"]:
+        print(f"  Skipped {report['commands_skipped']} update-batch --stdin command(s)")
+    print()
+    print(f"  {'command':<18}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'recorded p50':>14}{'wall p50':>10}")
+    for command, stats in report["commands"].items():
+        recorded = stats["recorded_p50_ms"] if stats["recorded_p50_ms"] is not None else "-"
+        print(f"  {command:<18}{stats['count']:>7}{stats['errors']:>8}{stats['p50_ms']:>10}"
+              f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{recorded:>14}{stats['wall_p50_ms']:>10}")
+    if report["data_dir"]:
+        print(f"  Data kept in {report['data_dir']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded progress manager traces")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    run_parser = subparsers.add_parser("run", help="Replay a trace and time every command")
+    run_parser.add_argument("trace", help="Trace file written via $ENGLISH_TUTOR_TRACE")
+    run_parser.add_argument("--snapshot", help=f"Data directory to replay against, copied first "
+                                               f"(default: {pm.DATA_DIR})")
+    run_parser.add_argument("--timing", choices=["fast", "original"], default="fast",
+                            help="Run back to back, or keep the recorded gaps between commands")
+    run_parser.add_argument("--speed", type=float, default=1.0,
+                            help="Speed-up factor for --timing original")
+    run_parser.add_argument("--progress-manager", help="Run commands as processes of this script")
+    run_parser.add_argument("--output", help="Save the results as JSON")
+    run_parser.add_argument("--keep", action="store_true", help="Keep the replayed data directory")
+    run_parser.add_argument("--json", action="store_true", help="Print the full results as JSON")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two replay results")
+    compare_parser.add_argument("baseline", help="Results of the previous version")
+    compare_parser.add_argument("current", help="Results of the current version")
+    compare_parser.add_argument("--threshold", type=float, default=10.0,
+                                help="p50 slowdown in percent reported as a regression (default 10)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if args.speed <= 0:
+            print("--speed must be positive")
+            return 1
+        snapshot = Path(args.snapshot).expanduser() if args.snapshot else pm.DATA_DIR
+        script = Path(args.progress_manager).resolve() if args.progress_manager else None
+        try:
+            report = replay(Path(args.trace), snapshot, args.timing, args.speed, script, args.keep)
+        except OSError as e:
+            print(f"Error: {e}")
+            return 1
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_report(report)
+            if args.output:
+                print(f"Saved results to {args.output}")
+        return 0
+
+    elif args.command == "compare":
+        try:
+            with open(args.baseline, "r") as f:
+                baseline = json.load(f)
+            with open(args.current, "r") as f:
+                current = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading results: {e}")
+            return 1
+        if baseline.get("trace") != current.get("trace"):
+            print("Warning: results come from different traces")
+
+        rows = compare_results(baseline, current, args.threshold)
+        print(f"  {'command':<18}{'count':>7}{'p50 before':>12}{'p50 after':>11}{'change':>9}"
+              f"{'p95 before':>12}{'p95 after':>11}{'change':>9}")
+        for row in rows:
+            print(f"  {row['command']:<18}{row['count']:>7}{row['baseline_p50_ms']:>12}"
+                  f"{row['current_p50_ms']:>11}{row['p50_change_pct']:>+8.1f}%"
+                  f"{row['baseline_p95_ms']:>12}{row['current_p95_ms']:>11}{row['p95_change_pct']:>+8.1f}%"
+                  + ("  REGRESSION" if row["regression"] else ""))
+        regressions = [r["command"] for r in rows if r["regression"]]
+        if regressions:
+            print(f"p50 regressions above {args.threshold}%: {', '.join(regressions)}")
+            return 1
+        print(f"No p50 regressions above {args.threshold}%")
+        return 0
+
+    else:
+        parser.print_help()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+English Tutor Learner Simulator
+
+Runs synthetic learners through months of virtual time using the real
+scheduling code in progress_manager.py (get_daily_words, add_word,
+update_word), so changes to the scheduler can be evaluated without waiting
+for real learners. Learners forget according to an exponential forgetting
+curve whose stability grows with each successful review.
+
+Usage:
+    python simulate.py [--learners N] [--days D] [--count COUNT] [--workers W]
+
+Examples:
+    python simulate.py --learners 100 --days 90
+    python simulate.py --learners 10000 --days 365 --workers 16 --output sim.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import progress_manager as pm
+
+# Session time of day in virtual time
+SESSION_HOUR = 18
+
+DEFAULT_PARAMS = {
+    "initial_stability": 1.5,   # days until recall drops to 1/e after first learning
+    "stability_growth": 2.2,    # stability multiplier after a successful review
+    "lapse_factor": 0.5,        # stability multiplier after a failed review
+    "learning_rate": 0.8,       # recall probability right after a word is introduced
+    "aptitude_sd": 0.2,         # spread of learner aptitude around 1.0
+}
+
+
+class VirtualClock:
+    """Clock that only moves when the simulation advances it."""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def __call__(self) -> datetime:
+        return self.current
+
+
+def recall_quality(rng: random.Random, recall_probability: float) -> int:
+    """Map a recall draw to the 0-5 quality scale."""
+    if rng.random() < recall_probability:
+        if recall_probability > 0.9:
+            return 5
+        return 4 if recall_probability > 0.7 else 3
+    return 2 if rng.random() < 0.5 else rng.choice((0, 1))
+
+
+def simulate_learner(learner_id: int, days: int, count: int, seed: int,
+                     params: dict, start: datetime, clock: VirtualClock) -> dict:
+    """
+    Simulate one learner day by day.
+    Returns per-day lists of reviews, correct reviews, new words and due backlog.
+    """
+    rng = random.Random(seed * 1_000_003 + learner_id)
+    # Per-learner variation in how quickly memories stabilize
+    aptitude = max(0.3, rng.gauss(1.0, params["aptitude_sd"]))
+    memory = {}  # word -> (stability_days, last_seen)
+
+    data = {
+        "name": f"sim-{learner_id}",
+        "current_level": 1,
+        "vocabulary": {},
+        "stats": {"words_learned": 0, "words_mastered": 0, "total_reviews": 0},
+    }
+    series = {"reviews": [0] * days, "correct": [0] * days,
+              "new_words": [0] * days, "due": [0] * days}
+    next_word = 0
+
+    for day in range(days):
+        clock.current = start + timedelta(days=day, hours=SESSION_HOUR)
+        daily = pm.get_daily_words(data, count)
+        series["due"][day] = daily["total_due"]
+
+        for item in daily["review_words"]:
+            word = item["word"]
+            stability, last_seen = memory[word]
+            elapsed = (clock.current - last_seen).total_seconds() / 86400
+            recall = math.exp(-elapsed / stability)
+            quality = recall_quality(rng, recall)
+            if quality >= 3:
+                stability *= params["stability_growth"] * aptitude
+                series["correct"][day] += 1
+            else:
+                stability = max(params["initial_stability"] / 2, stability * params["lapse_factor"])
+            memory[word] = (stability, clock.current)
+            pm.update_word(data, word, quality)
+            series["reviews"][day] += 1
+
+        for _ in range(daily["new_word_slots"]):
+            word = f"w{next_word}"
+            next_word += 1
+            pm.add_word(data, word)
+            # New words are practiced right after being introduced
+            quality = recall_quality(rng, params["learning_rate"])
+            pm.update_word(data, word, quality)
+            memory[word] = (params["initial_stability"] * aptitude, clock.current)
+            series["new_words"][day] += 1
+
+    mastered = sum(1 for w in data["vocabulary"].values() if w.get("mastery_level", 0) >= 4)
+    series["words"] = len(data["vocabulary"])
+    series["mastered"] = mastered
+    return series
+
+
+def simulate_chunk(learner_ids: list, days: int, count: int, seed: int, params: dict) -> dict:
+    """Simulate a group of learners in one process and sum their series."""
+    start = datetime(2025, 1, 1)
+    clock = VirtualClock(start)
+    pm.set_clock(clock)
+
+    totals = {"reviews": [0] * days, "correct": [0] * days, "new_words": [0] * days,
+              "due": [0] * days, "words": 0, "mastered": 0, "learners": 0}
+    for learner_id in learner_ids:
+        series = simulate_learner(learner_id, days, count, seed, params, start, clock)
+        for key in ("reviews", "correct", "new_words", "due"):
+            totals[key] = [a + b for a, b in zip(totals[key], series[key])]
+        totals["words"] += series["words"]
+        totals["mastered"] += series["mastered"]
+        totals["learners"] += 1
+    return totals
+
+
+def run_simulation(learners: int, days: int, count: int = 5, workers: int = 1,
+                   seed: int = 0, params: dict = None) -> dict:
+    """Run a cohort, in parallel when workers > 1, and summarize the results."""
+    params = dict(DEFAULT_PARAMS, **(params or {}))
+    ids = list(range(learners))
+    chunk_size = max(1, math.ceil(learners / (workers * 4)))
+    chunks = [ids[i:i + chunk_size] for i in range(0, learners, chunk_size)]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(simulate_chunk, chunks, [days] * len(chunks),
+                                        [count] * len(chunks), [seed] * len(chunks),
+                                        [params] * len(chunks)))
+    else:
+        results = [simulate_chunk(chunk, days, count, seed, params) for chunk in chunks]
+
+    totals = results[0]
+    for result in results[1:]:
+        for key in ("reviews", "correct", "new_words", "due"):
+            totals[key] = [a + b for a, b in zip(totals[key], result[key])]
+        for key in ("words", "mastered", "learners"):
+            totals[key] += result[key]
+
+    n = max(1, totals["learners"])
+    total_reviews = sum(totals["reviews"])
+    return {
+        "learners": totals["learners"],
+        "days": days,
+        "count": count,
+        "params": params,
+        "summary": {
+            "reviews_per_day": round(total_reviews / (n * days), 3),
+            "new_words_per_day": round(sum(totals["new_words"]) / (n * days), 3),
+            "retention": round(sum(totals["correct"]) / total_reviews, 4) if total_reviews else 0,
+            "final_due_backlog": round(totals["due"][-1] / n, 2),
+            "words_per_learner": round(totals["words"] / n, 1),
+            "mastered_per_learner": round(totals["mastered"] / n, 1),
+        },
+        "daily": {
+            "reviews": [round(v / n, 3) for v in totals["reviews"]],
+            "retention": [round(c / r, 4) if r else None
+                          for c, r in zip(totals["correct"], totals["reviews"])],
+            "new_words": [round(v / n, 3) for v in totals["new_words"]],
+            "due": [round(v / n, 3) for v in totals["due"]],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate learners against the real scheduler")
+    parser.add_argument("--learners", type=int, default=100, help="Number of synthetic learners")
+    parser.add_argument("--days", type=int, default=90, help="Days of virtual time")
+    parser.add_argument("--count", type=int, default=5, help="Words per daily session")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--initial-stability", type=float, default=DEFAULT_PARAMS["initial_stability"])
+    parser.add_argument("--stability-growth", type=float, default=DEFAULT_PARAMS["stability_growth"])
+    parser.add_argument("--lapse-factor", type=float, default=DEFAULT_PARAMS["lapse_factor"])
+    parser.add_argument("--learning-rate", type=float, default=DEFAULT_PARAMS["learning_rate"])
+    parser.add_argument("--aptitude-sd", type=float, default=DEFAULT_PARAMS["aptitude_sd"])
+    parser.add_argument("--output", help="Write the full report (including daily series) to this JSON file")
+
+    args = parser.parse_args()
+    if args.learners < 1:
+        parser.error("--learners must be at least 1")
+
+    params = {
+        "initial_stability": args.initial_stability,
+        "stability_growth": args.stability_growth,
+        "lapse_factor": args.lapse_factor,
+        "learning_rate": args.learning_rate,
+        "aptitude_sd": args.aptitude_sd,
+    }
+
+    started = time.perf_counter()
+    report = run_simulation(args.learners, args.days, args.count, args.workers, args.seed, params)
+    report["elapsed_seconds"] = round(time.perf_counter() - started, 2)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote simulation report to {args.output}")
+
+    print(json.dumps({k: report[k] for k in ("learners", "days", "count", "summary", "elapsed_seconds")},
+                     indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Skill Manager Benchmark - Times packaging, installation, validation and listing
+
+Generates a catalog of synthetic skills in a temporary directory and times
+package_skill, install_from_directory, install_from_skill_file,
+validate_skill_file and list_skills against it. Every operation runs once
+cold (fresh skills directory, empty skill store, frontmatter cache cleared
+and source files evicted from the page cache where the OS allows it) and
+then --repeat times warm. Bytes read and written are taken from
+/proc/self/io on Linux.
+
+Results are saved as JSON so runs from two versions can be compared.
+
+Usage:
+    python benchmark.py run [--skills N] [--files N] [--file-size BYTES] [--compressibility 0-1]
+                            [--repeat N] [--output FILE]
+    python benchmark.py compare <baseline.json> <current.json> [--threshold PERCENT]
+
+Examples:
+    python benchmark.py run --skills 200 --files 20 --output before.json
+    python benchmark.py run --skills 200 --files 20 --output after.json
+    python benchmark.py compare before.json after.json --threshold 15
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import frontmatter
+import install_skill
+import list_skills
+import package_skill
+import skill_store
+import validate_skill
+
+OPERATIONS = ("package", "package-deterministic", "install-directory", "install-file",
+              "validate-file", "list")
+
+RESULTS_VERSION = 1
+
+# Words used for the compressible part of generated files
+_WORDS = ("skill", "reference", "example", "workflow", "install", "package", "validate",
+          "script", "template", "guide", "section", "output", "input", "config", "the", "a")
+
+
+def _text(rng: random.Random, size: int) -> bytes:
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words).encode()[:size]
+
+
+def file_content(rng: random.Random, size: int, compressibility: float) -> bytes:
+    """
+    Generated file content: the compressible fraction is repetitive text,
+    the rest random bytes that deflate cannot shrink.
+    """
+    text_size = int(size * compressibility)
+    return _text(rng, text_size) + rng.randbytes(size - text_size)
+
+
+def generate_skill(root: Path, name: str, files: int, file_size: int,
+                   compressibility: float, rng: random.Random) -> Path:
+    """Create one synthetic skill directory with SKILL.md and reference files."""
+    skill_dir = root / name
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Synthetic benchmark skill {name} for timing "
+        f"skill-manager operations\n---\n\n# {name}\n\n## Usage\n\n"
+        + _text(rng, 2000).decode() + "\n")
+    for i in range(files):
+        (skill_dir / "references" / f"ref-{i:04d}.md").write_bytes(
+            file_content(rng, file_size, compressibility))
+    return skill_dir
+
+
+def generate_catalog(root: Path, skills: int, files: int, file_size: int,
+                     compressibility: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [generate_skill(root, f"bench-skill-{i:04d}", files, file_size, compressibility, rng)
+            for i in range(skills)]
+
+
+def read_io_counters():
+    """
+    Process I/O counters from /proc/self/io: rchar/wchar count every read and
+    write call, read_bytes/write_bytes only what reached the storage layer.
+    Returns None where the file is not available.
+    """
+    try:
+        with open("/proc/self/io", "r") as f:
+            return {key: int(value) for key, value in
+                    (line.split(":", 1) for line in f if ":" in line)}
+    except (OSError, ValueError):
+        return None
+
+
+def evict_from_cache(paths) -> None:
+    """Ask the kernel to drop cached pages of the given files (best effort)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for root in paths:
+        root = Path(root)
+        for file_path in ([root] if root.is_file() else root.rglob("*")):
+            if not file_path.is_file():
+                continue
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+
+def use_install_root(root: Path) -> None:
+    """Point every skill-manager module at a scratch skills directory."""
+    skills_dir = root / "skill"
+    skills_dir.mkdir(parents=True, exist_ok=True)
+    install_skill.SKILLS_DIR = skills_dir
+    install_skill.STORE_DIR = root / "skill-store"
+    install_skill.INDEX_FILE = root / "skill-index.json"
+    list_skills.SKILLS_DIR = skills_dir
+    list_skills.ARCHIVE_CACHE_FILE = root / "skill-archive-cache.json"
+
+
+def measure(func) -> dict:
+    """Run func with its output discarded; return elapsed time and I/O deltas."""
+    before = read_io_counters()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = func()
+    elapsed = time.perf_counter() - started
+    after = read_io_counters()
+
+    sample = {"seconds": elapsed, "ok": bool(ok)}
+    if before and after:
+        sample["bytes_read"] = after.get("rchar", 0) - before.get("rchar", 0)
+        sample["bytes_written"] = after.get("wchar", 0) - before.get("wchar", 0)
+        sample["disk_read"] = after.get("read_bytes", 0) - before.get("read_bytes", 0)
+        sample["disk_written"] = after.get("write_bytes", 0) - before.get("write_bytes", 0)
+    return sample
+
+
+def summarize(samples: list, skills: int) -> dict:
+    times = [s["seconds"] for s in samples]
+    summary = {
+        "runs": len(samples),
+        "failures": sum(1 for s in samples if not s["ok"]),
+        "median_s": round(statistics.median(times), 6),
+        "min_s": round(min(times), 6),
+        "max_s": round(max(times), 6),
+        "per_skill_ms": round(statistics.median(times) / skills * 1000, 3),
+    }
+    for key in ("bytes_read", "bytes_written", "disk_read", "disk_written"):
+        if key in samples[0]:
+            summary[key] = int(statistics.median(s[key] for s in samples))
+    return summary
+
+
+def run_operation(op: str, work: Path, sources: list, packages: dict, repeat: int) -> dict:
+    """Time one operation over the whole catalog, cold once then warm."""
+    run_root = work / "runs" / op
+    if run_root.exists():
+        skill_store.remove_tree(run_root)
+    use_install_root(run_root)
+    output_dir = run_root / "packages"
+
+    if op in ("package", "package-deterministic"):
+        deterministic = op == "package-deterministic"
+        def once(warm):
+            return all(package_skill.package_skill(src, output_dir / f"{src.name}.skill", deterministic)
+                       for src in sources)
+        inputs = sources
+    elif op == "install-directory":
+        def once(warm):
+            return all(install_skill.install_from_directory(src, update=warm) for src in sources)
+        inputs = sources
+    elif op == "install-file":
+        def once(warm):
+            return all(install_skill.install_from_skill_file(packages[src.name], update=warm)
+                       for src in sources)
+        inputs = list(packages.values())
+    elif op == "validate-file":
+        def once(warm):
+            return all(validate_skill.validate_skill_file(packages[src.name])[0] for src in sources)
+        inputs = list(packages.values())
+    elif op == "list":
+        with contextlib.redirect_stdout(io.StringIO()):
+            for src in sources:
+                install_skill.install_from_skill_file(packages[src.name])
+        def once(warm):
+            return list_skills.list_skills(details=True)
+        inputs = [install_skill.SKILLS_DIR]
+    else:
+        raise ValueError(f"Unknown operation: {op}")
+
+    frontmatter.clear_cache()
+    evict_from_cache(inputs)
+    cold = measure(lambda: once(False))
+    warm = [measure(lambda: once(True)) for _ in range(repeat)]
+
+    result = {"cold": summarize([cold], len(sources))}
+    if warm:
+        result["warm"] = summarize(warm, len(sources))
+    return result
+
+
+def run_benchmark(skills: int, files: int, file_size: int, compressibility: float,
+                  repeat: int, seed: int = 0, operations=OPERATIONS, keep: bool = False) -> dict:
+    work = Path(tempfile.mkdtemp(prefix="skill-manager-bench-"))
+    try:
+        sources = generate_catalog(work / "sources", skills, files, file_size, compressibility, seed)
+
+        # The install-file, validate-file and list runs read deterministic packages
+        packages = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for src in sources:
+                packages[src.name] = work / "packages" / f"{src.name}.skill"
+                package_skill.package_skill(src, packages[src.name], deterministic=True)
+
+        results = {}
+        for op in operations:
+            print(f"⏱️  {op}...", file=sys.stderr)
+            results[op] = run_operation(op, work, sources, packages, repeat)
+    finally:
+        if keep:
+            print(f"   Data kept in {work}", file=sys.stderr)
+        else:
+            skill_store.remove_tree(work)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "skills": skills,
+            "files": files,
+            "file_size": file_size,
+            "compressibility": compressibility,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "operations": results,
+    }
+
+
+def print_results(results: dict) -> None:
+    config = results["config"]
+    print(f"📊 {config['skills']} skills x {config['files']} files of {config['file_size']} bytes "
+          f"(compressibility {config['compressibility']}), {config['repeat']} warm runs")
+    print()
+    print(f"  {'operation':<24}{'phase':<6}{'median s':>11}{'per skill ms':>14}"
+          f"{'read KB':>11}{'written KB':>12}")
+    for op, phases in results["operations"].items():
+        for phase, stats in phases.items():
+            read = f"{stats['bytes_read'] / 1024:.0f}" if "bytes_read" in stats else "-"
+            written = f"{stats['bytes_written'] / 1024:.0f}" if "bytes_written" in stats else "-"
+            failed = f"  ❌ {stats['failures']} failed" if stats["failures"] else ""
+            print(f"  {op:<24}{phase:<6}{stats['median_s']:>11.4f}{stats['per_skill_ms']:>14.3f}"
+                  f"{read:>11}{written:>12}{failed}")
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Per operation and phase: median time change in percent.
+    A change above threshold is a regression.
+    """
+    rows = []
+    for op, phases in current["operations"].items():
+        for phase, stats in phases.items():
+            before = baseline["operations"].get(op, {}).get(phase)
+            if not before:
+                continue
+            change = ((stats["median_s"] - before["median_s"]) / before["median_s"] * 100
+                      if before["median_s"] else 0.0)
+            rows.append({
+                "operation": op,
+                "phase": phase,
+                "baseline_s": before["median_s"],
+                "current_s": stats["median_s"],
+                "change_pct": round(change, 1),
+                "bytes_written_change": (stats.get("bytes_written", 0) - before.get("bytes_written", 0)
+                                         if "bytes_written" in stats and "bytes_written" in before
+                                         else None),
+                "regression": change > threshold,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill-manager operations")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark")
+    run_parser.add_argument("--skills", type=int, default=50, help="Skills in the generated catalog")
+    run_parser.add_argument("--files", type=int, default=10, help="Reference files per skill")
+    run_parser.add_argument("--file-size", type=int, default=16 * 1024, help="Bytes per file")
+    run_parser.add_argument("--compressibility", type=float, default=0.5,
+                            help="Fraction of each file that is compressible text (0-1)")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Warm runs per operation")
+    run_parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS),
+                            help="Operations to time (default: all)")
+    run_parser.add_argument("--seed", type=int, default=0, help="Random seed for generated content")
+    run_parser.add_argument("--output", "-o", help="Save results as JSON to this file")
+    run_parser.add_argument("--keep", action="store_true", help="Keep the generated files")
+    run_parser.add_argument("--json", "-j", action="store_true", help="Print results as JSON")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two saved results")
+    compare_parser.add_argument("baseline", help="Results of the previous version")
+    compare_parser.add_argument("current", help="Results of the current version")
+    compare_parser.add_argument("--threshold", type=float, default=10.0,
+                                help="Slowdown in percent reported as a regression (default 10)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        if args.skills < 1 or args.files < 0 or args.file_size < 0 or args.repeat < 0:
+            print("❌ Error: --skills must be at least 1 and counts must not be negative")
+            return 1
+        if not 0 <= args.compressibility <= 1:
+            print("❌ Error: --compressibility must be between 0 and 1")
+            return 1
+
+        results = run_benchmark(args.skills, args.files, args.file_size, args.compressibility,
+                                args.repeat, args.seed, args.operations, args.keep)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+                f.write("\n")
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_results(results)
+            if args.output:
+                print()
+                print(f"✅ Results saved to {args.output}")
+        failed = any(stats["failures"] for phases in results["operations"].values()
+                     for stats in phases.values())
+        return 1 if failed else 0
+
+    elif args.command == "compare":
+        try:
+            with open(args.baseline, "r") as f:
+                baseline = json.load(f)
+            with open(args.current, "r") as f:
+                current = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading results: {e}")
+            return 1
+
+        if baseline.get("config") != current.get("config"):
+            print("⚠️  Results were produced with different settings; comparison may be misleading")
+
+        rows = compare_results(baseline, current, args.threshold)
+        print(f"  {'operation':<24}{'phase':<6}{'baseline s':>12}{'current s':>12}{'change':>9}")
+        for row in rows:
+            marker = "  ❌ regression" if row["regression"] else ""
+            print(f"  {row['operation']:<24}{row['phase']:<6}{row['baseline_s']:>12.4f}"
+                  f"{row['current_s']:>12.4f}{row['change_pct']:>+8.1f}%{marker}")
+
+        regressions = [r for r in rows if r["regression"]]
+        print()
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) above {args.threshold}%")
+            return 1
+        print(f"✅ No regressions above {args.threshold}%")
+        return 0
+
+    else:
+        parser.print_help()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+SKILL.md Frontmatter - Shared, cached frontmatter reader for skill-manager scripts
+
+Only the frontmatter prefix of SKILL.md is read, in bounded chunks, so large
+skill bodies are never loaded just to find a name and description. Parsed
+results are memoized per (path, mtime, size).
+
+YAML is parsed with PyYAML when it is installed. Without it, or when the
+frontmatter is not strict YAML (unquoted descriptions containing ': ' are
+common), a lenient parser handles quoted values, block scalars and indented
+continuation lines.
+"""
+
+import re
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional
+    yaml = None
+
+CHUNK_SIZE = 4096
+
+# Frontmatter larger than this is treated as unterminated
+MAX_FRONTMATTER_BYTES = 256 * 1024
+
+_CLOSING_RE = re.compile(rb"\r?\n---[ \t]*(\r?\n|$)")
+_KEY_RE = re.compile(r"^([A-Za-z0-9_][A-Za-z0-9_-]*)\s*:(?:\s+(.*)|\s*)$")
+
+# path -> (mtime_ns, size, result); result is a dict or a FrontmatterError
+_cache = {}
+
+
+class FrontmatterError(ValueError):
+    """Raised when SKILL.md frontmatter is missing or malformed."""
+
+
+def read_frontmatter(skill_md: Path) -> dict:
+    """
+    Return the parsed frontmatter of a SKILL.md file.
+    Raises FrontmatterError if it is missing or not closed, OSError if the
+    file cannot be read.
+    """
+    skill_md = Path(skill_md)
+    info = skill_md.stat()
+    key = str(skill_md.absolute())
+
+    cached = _cache.get(key)
+    if cached and cached[0] == info.st_mtime_ns and cached[1] == info.st_size:
+        result = cached[2]
+    else:
+        try:
+            with open(skill_md, "rb") as f:
+                result = read_frontmatter_stream(f)
+        except FrontmatterError as e:
+            result = e
+        _cache[key] = (info.st_mtime_ns, info.st_size, result)
+
+    if isinstance(result, FrontmatterError):
+        raise result
+    return dict(result)
+
+
+def read_frontmatter_stream(stream) -> dict:
+    """Parse frontmatter from a binary file-like object, reading only its prefix."""
+    buffer = stream.read(CHUNK_SIZE)
+    first_line = buffer.split(b"\n", 1)[0].rstrip(b"\r")
+    if first_line != b"---":
+        raise FrontmatterError("SKILL.md does not start with YAML frontmatter (---)")
+
+    start = len(first_line)
+    eof = False
+    while True:
+        match = _CLOSING_RE.search(buffer, start)
+        # A match at the very end of the buffer may be '---' followed by more text
+        if match and (match.group(1) or eof):
+            return parse_frontmatter(buffer[start:match.start()].decode("utf-8"))
+        if eof or len(buffer) > MAX_FRONTMATTER_BYTES:
+            raise FrontmatterError("YAML frontmatter not properly closed with '---'")
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            eof = True
+        buffer += chunk
+
+
+def parse_frontmatter(text: str) -> dict:
+    """
+    Parse the text between the '---' delimiters into a dict.
+    Scalar values are returned as strings; empty values as None.
+    """
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict):
+            return {str(k): _normalize(v) for k, v in data.items()}
+    return _parse_lenient(text)
+
+
+def clear_cache() -> None:
+    """Forget all memoized results."""
+    _cache.clear()
+
+
+def _normalize(value):
+    if value is None or isinstance(value, (dict, list)):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _parse_lenient(text: str) -> dict:
+    result = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if not line.strip() or line.lstrip().startswith("#") or line[0] in " \t":
+            continue
+        match = _KEY_RE.match(line)
+        if not match:
+            continue
+        key, value = match.group(1), (match.group(2) or "").strip()
+
+        # Indented continuation lines belong to this key
+        block = []
+        while i < len(lines) and (not lines[i].strip() or lines[i][0] in " \t"):
+            block.append(lines[i])
+            i += 1
+        while block and not block[-1].strip():
+            block.pop()
+
+        result[key] = _parse_value(value, block)
+    return result
+
+
+def _parse_value(value: str, block: list):
+    if value[:1] in ("|", ">"):
+        indent = min((len(l) - len(l.lstrip()) for l in block if l.strip()), default=0)
+        body = [l[indent:] for l in block]
+        if value[0] == "|":
+            text = "\n".join(body)
+        else:
+            text = _fold(body)
+        return text if text else None
+
+    if value[:1] in ("'", '"'):
+        quote = value[0]
+        joined = " ".join([value] + [l.strip() for l in block]) if block else value
+        end = joined.rfind(quote)
+        if end > 0:
+            inner = joined[1:end]
+            if quote == "'":
+                return inner.replace("''", "'")
+            return inner.replace('\\"', '"').replace("\\\\", "\\")
+        return joined.strip(quote) or None
+
+    parts = [value] + [l.strip() for l in block]
+    text = _fold(parts).strip()
+    return text if text else None
+
+
+def _fold(lines: list) -> str:
+    # Folded scalars join lines with spaces; blank lines become newlines
+    paragraphs, current = [], []
+    for line in lines:
+        if line.strip():
+            current.append(line.strip())
+        else:
+            paragraphs.append(" ".join(current))
+            current = []
+    paragraphs.append(" ".join(current))
+    return "\n".join(p for p in paragraphs if p)
@@ -3,7 +3,7 @@
 Skill Installer - Installs skills to opencode skills directory
 
 Usage:
-    python install_skill.py <skill_path> [--update] [--force]
+    python install_skill.py <skill_path> [--update] [--force] [--copy]
     
 Examples:
     python install_skill.py /path/to/my-skill
@@ -12,16 +12,34 @@ Examples:
 """
 
 import argparse
+import hashlib
+import json
 import os
+import posixpath
+import re
 import shutil
+import stat
 import sys
 import zipfile
 from pathlib import Path
 import tempfile
 
+import frontmatter
+import package_skill
+import search_skills
+import skill_store
+
 # Default opencode skills directory
 SKILLS_DIR = Path.home() / ".config" / "opencode" / "skill"
 
+# Content-addressed store that installed files are hardlinked from
+STORE_DIR = SKILLS_DIR.parent / "skill-store"
+
+# Search index kept up to date on every install
+INDEX_FILE = SKILLS_DIR.parent / "skill-index.json"
+
+SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
 def validate_skill_structure(skill_path: Path):
     """
     Validate basic skill structure.
@@ -38,32 +56,23 @@ def validate_skill_structure(skill_path: Path):
     
     # Read SKILL.md to check frontmatter
     try:
-        content = skill_md.read_text()
-        if not content.startswith("---"):
-            return False, "SKILL.md does not have YAML frontmatter"
-        
-        # Basic frontmatter check
-        lines = content.split("\n")
-        if lines[0] != "---":
-            return False, "Invalid frontmatter format"
-        
-        # Look for second "---" to end frontmatter
-        try:
-            end_idx = lines.index("---", 1)
-            frontmatter_lines = lines[1:end_idx]
-            frontmatter = "\n".join(frontmatter_lines)
-            
-            # Check for name and description fields
-            if "name:" not in frontmatter:
-                return False, "Missing 'name:' in frontmatter"
-            if "description:" not in frontmatter:
-                return False, "Missing 'description:' in frontmatter"
-                
-        except ValueError:
-            return False, "Frontmatter not properly closed with '---'"
-            
+        meta = frontmatter.read_frontmatter(skill_md)
+    except frontmatter.FrontmatterError as e:
+        return False, str(e)
     except Exception as e:
         return False, f"Error reading SKILL.md: {e}"
+
+    return check_required_fields(meta)
+
+def check_required_fields(meta: dict):
+    """
+    Check frontmatter for name and description fields.
+    Returns (is_valid, message)
+    """
+    if "name" not in meta:
+        return False, "Missing 'name:' in frontmatter"
+    if "description" not in meta:
+        return False, "Missing 'description:' in frontmatter"
     
     return True, "Skill structure is valid"
 
@@ -74,26 +83,20 @@ def extract_skill_name(skill_path: Path) -> str:
     skill_md = skill_path / "SKILL.md"
     if skill_md.exists():
         try:
-            content = skill_md.read_text()
-            lines = content.split("\n")
-            if lines[0] == "---":
-                end_idx = lines.index("---", 1) if "---" in lines[1:] else len(lines)
-                for i in range(1, end_idx):
-                    line = lines[i].strip()
-                    if line.startswith("name:"):
-                        name = line[5:].strip()
-                        # Remove quotes if present
-                        name = name.strip("'\"")
-                        return name
-        except:
+            name = str(frontmatter.read_frontmatter(skill_md).get("name") or "").strip()
+            if name:
+                return name
+        except (frontmatter.FrontmatterError, OSError):
             pass
     
     # Fallback to directory name
     return skill_path.name
 
-def install_from_directory(source_dir: Path, update: bool = False, force: bool = False) -> bool:
+def install_from_directory(source_dir: Path, update: bool = False, force: bool = False,
+                           copy: bool = False) -> bool:
     """
     Install a skill from a directory.
+    Files are hardlinked from the skill store unless copy is True.
     """
     source_dir = source_dir.resolve()
     
@@ -114,7 +117,34 @@ def install_from_directory(source_dir: Path, update: bool = False, force: bool =
         print("❌ Error: Could not determine skill name")
         return False
     
-    # Target directory
+    target_dir = prepare_target(skill_name, update, force)
+    if target_dir is None:
+        return False
+    
+    # Copy the skill directory, or assemble it from the store
+    try:
+        if copy:
+            shutil.copytree(source_dir, target_dir)
+        else:
+            result = skill_store.link_tree(source_dir, target_dir, STORE_DIR)
+            print(f"   Files: {result['files']} ({result['new_blobs']} new, "
+                  f"{result['files'] - result['new_blobs']} shared)")
+        print(f"✅ Successfully installed skill '{skill_name}' to {target_dir}")
+    except Exception as e:
+        print(f"❌ Error copying skill: {e}")
+        # Clean up partial copy
+        if target_dir.exists():
+            skill_store.remove_tree(target_dir)
+        return False
+    
+    update_search_index(target_dir)
+    return True
+
+def prepare_target(skill_name: str, update: bool = False, force: bool = False):
+    """
+    Get the install directory for a skill, removing an existing install when
+    updating. Returns None if installation must not proceed.
+    """
     target_dir = SKILLS_DIR / skill_name
     
     # Check if already exists
@@ -122,36 +152,140 @@ def install_from_directory(source_dir: Path, update: bool = False, force: bool =
         if not update and not force:
             print(f"❌ Skill '{skill_name}' already exists at {target_dir}")
             print("   Use --update to update existing skill or --force to overwrite")
-            return False
+            return None
         else:
             # Backup or remove existing
             print(f"⚠️  Skill '{skill_name}' already exists, updating...")
             try:
-                shutil.rmtree(target_dir)
+                skill_store.remove_tree(target_dir)
             except Exception as e:
                 print(f"❌ Error removing existing skill: {e}")
-                return False
+                return None
     
     # Create target directory
     try:
         target_dir.parent.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         print(f"❌ Error creating target directory: {e}")
+        return None
+    
+    return target_dir
+
+def update_search_index(target_dir: Path) -> None:
+    """Keep the search index current; a stale index is not an install failure."""
+    try:
+        search_skills.update_index(target_dir, INDEX_FILE)
+    except Exception as e:
+        print(f"⚠️  Could not update search index: {e}")
+
+def read_manifest(zipf: zipfile.ZipFile):
+    """
+    Return the manifest of a deterministic .skill archive, or None if the
+    archive has no manifest or its members do not match it.
+    """
+    try:
+        manifest = json.loads(zipf.read(package_skill.MANIFEST_NAME))
+        prefix = manifest["skill_dir"] + "/"
+        files = manifest["files"]
+    except (KeyError, TypeError, ValueError):
+        return None
+    members = {info.filename for info in zipf.infolist()
+               if info.filename.startswith(prefix) and not info.is_dir()}
+    if members != set(files):
+        return None
+    return manifest
+
+def manifest_relative_path(arcname: str, prefix: str) -> str:
+    """
+    Path of a manifest member inside the skill directory. Raises ValueError
+    for members outside prefix, absolute paths and '..' components.
+    """
+    if not arcname.startswith(prefix) or "\\" in arcname:
+        raise ValueError(f"Unsafe path in manifest: {arcname}")
+    relative = arcname[len(prefix):]
+    parts = relative.split("/")
+    if (not relative or posixpath.isabs(relative) or ".." in parts or "" in parts
+            or "." in parts or ":" in parts[0]):
+        raise ValueError(f"Unsafe path in manifest: {arcname}")
+    return relative
+
+def install_from_manifest(zipf: zipfile.ZipFile, manifest: dict,
+                          update: bool = False, force: bool = False) -> bool:
+    """
+    Install a deterministic .skill archive straight from the zip.
+    Files already in the skill store are linked using the manifest hashes;
+    only missing content is decompressed.
+    """
+    prefix = manifest["skill_dir"] + "/"
+    files = manifest["files"]
+    
+    # Manifest paths and hashes become filesystem paths: check them all first
+    try:
+        skill_dir = manifest["skill_dir"]
+        if not skill_dir or "/" in skill_dir or manifest_relative_path(skill_dir, "") != skill_dir:
+            raise ValueError(f"Unsafe skill directory in manifest: {skill_dir}")
+        members = []
+        for arcname in sorted(files):
+            entry = files[arcname]
+            if not isinstance(entry.get("sha256"), str) or not SHA256_RE.fullmatch(entry["sha256"]):
+                raise ValueError(f"Invalid hash in manifest for {arcname}")
+            members.append((arcname, manifest_relative_path(arcname, prefix), entry))
+    except (AttributeError, TypeError, ValueError) as e:
+        print(f"❌ Validation failed: {e}")
+        return False
+    
+    # Validate SKILL.md without extracting anything else
+    skill_md = prefix + "SKILL.md"
+    if skill_md not in files:
+        print(f"❌ Validation failed: SKILL.md not found in {manifest['skill_dir']}")
+        return False
+    try:
+        with zipf.open(skill_md) as f:
+            meta = frontmatter.read_frontmatter_stream(f)
+    except frontmatter.FrontmatterError as e:
+        print(f"❌ Validation failed: {e}")
+        return False
+    valid, message = check_required_fields(meta)
+    if not valid:
+        print(f"❌ Validation failed: {message}")
+        return False
+    
+    skill_name = str(meta.get("name") or "").strip() or manifest["skill_dir"]
+    target_dir = prepare_target(skill_name, update, force)
+    if target_dir is None:
         return False
     
-    # Copy the skill directory
     try:
-        shutil.copytree(source_dir, target_dir)
+        target_dir.mkdir()
+        root = target_dir.resolve()
+        new_blobs = 0
+        for arcname, relative, entry in members:
+            target = target_dir / relative
+            if root not in target.resolve().parents:
+                raise ValueError(f"Unsafe path in manifest: {arcname}")
+            executable = bool(int(entry["mode"], 8) & stat.S_IXUSR)
+            key = skill_store.blob_key(entry["sha256"], executable)
+            blob = skill_store.blob_path(key, STORE_DIR)
+            if not blob.exists():
+                data = zipf.read(arcname)
+                if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                    raise ValueError(f"Content of {arcname} does not match the manifest")
+                blob = skill_store.store_bytes(data, executable, STORE_DIR)
+                new_blobs += 1
+            skill_store.link_blob(blob, target)
+        print(f"   Files: {len(files)} ({new_blobs} new, {len(files) - new_blobs} shared)")
         print(f"✅ Successfully installed skill '{skill_name}' to {target_dir}")
-        return True
     except Exception as e:
-        print(f"❌ Error copying skill: {e}")
-        # Clean up partial copy
+        print(f"❌ Error installing skill: {e}")
         if target_dir.exists():
-            shutil.rmtree(target_dir, ignore_errors=True)
+            skill_store.remove_tree(target_dir)
         return False
+    
+    update_search_index(target_dir)
+    return True
 
-def install_from_skill_file(skill_file: Path, update: bool = False, force: bool = False) -> bool:
+def install_from_skill_file(skill_file: Path, update: bool = False, force: bool = False,
+                            copy: bool = False) -> bool:
     """
     Install a skill from a .skill file (zip).
     """
@@ -166,6 +300,18 @@ def install_from_skill_file(skill_file: Path, update: bool = False, force: bool
         print(f"❌ Error: File must have .skill extension: {skill_file}")
         return False
     
+    # Deterministic archives carry a manifest: install from the store
+    # without extracting content that is already there
+    if not copy:
+        try:
+            with zipfile.ZipFile(skill_file, 'r') as zipf:
+                manifest = read_manifest(zipf)
+                if manifest is not None:
+                    return install_from_manifest(zipf, manifest, update, force)
+        except zipfile.BadZipFile:
+            print(f"❌ Error: Invalid .skill file (not a valid zip): {skill_file}")
+            return False
+    
     # Create temporary directory for extraction
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
@@ -200,13 +346,14 @@ def install_from_skill_file(skill_file: Path, update: bool = False, force: bool
             return False
         
         # Install from the extracted directory
-        return install_from_directory(extracted_dir, update, force)
+        return install_from_directory(extracted_dir, update, force, copy)
 
 def main():
     parser = argparse.ArgumentParser(description="Install a skill to opencode skills directory")
     parser.add_argument("skill_path", help="Path to skill directory or .skill file")
     parser.add_argument("--update", action="store_true", help="Update existing skill")
     parser.add_argument("--force", action="store_true", help="Force overwrite without confirmation")
+    parser.add_argument("--copy", action="store_true", help="Copy files instead of linking them from the skill store")
     
     args = parser.parse_args()
     
@@ -225,9 +372,9 @@ def main():
     
     # Determine if it's a directory or .skill file
     if skill_path.is_dir():
-        success = install_from_directory(skill_path, args.update, args.force)
+        success = install_from_directory(skill_path, args.update, args.force, args.copy)
     elif skill_path.is_file() and skill_path.suffix == ".skill":
-        success = install_from_skill_file(skill_path, args.update, args.force)
+        success = install_from_skill_file(skill_path, args.update, args.force, args.copy)
     else:
         print(f"❌ Error: Path must be a directory or .skill file: {skill_path}")
         print("   Directory must contain SKILL.md")
@@ -12,14 +12,33 @@ Examples:
 """
 
 import argparse
+import os
 import sys
+import tempfile
+import zipfile
 from pathlib import Path
 import json
 from datetime import datetime
 
+import frontmatter
+import validate_skill
+
 # Default opencode skills directory
 SKILLS_DIR = Path.home() / ".config" / "opencode" / "skill"
 
+# Frontmatter of installed .skill archives, keyed by file name and checked
+# against (size, mtime) so unchanged archives are never reopened
+ARCHIVE_CACHE_FILE = SKILLS_DIR.parent / "skill-archive-cache.json"
+
+ARCHIVE_CACHE_VERSION = 1
+
+def _short_description(meta: dict):
+    desc = str(meta.get("description") or "").strip()
+    # Truncate long descriptions
+    if len(desc) > 100:
+        desc = desc[:97] + "..."
+    return desc or None
+
 def get_skill_info(skill_dir: Path) -> dict:
     """
     Get information about a skill from its directory.
@@ -29,6 +48,7 @@ def get_skill_info(skill_dir: Path) -> dict:
     info = {
         "name": skill_dir.name,
         "path": str(skill_dir),
+        "type": "directory",
         "has_skill_md": skill_md.exists(),
         "size_mb": 0,
         "modified": datetime.fromtimestamp(skill_dir.stat().st_mtime).isoformat()
@@ -47,34 +67,111 @@ def get_skill_info(skill_dir: Path) -> dict:
     # Try to read skill name and description from SKILL.md
     if skill_md.exists():
         try:
-            content = skill_md.read_text()
-            lines = content.split("\n")
-            
-            if lines[0] == "---":
-                try:
-                    end_idx = lines.index("---", 1)
-                    frontmatter_lines = lines[1:end_idx]
-                    
-                    for line in frontmatter_lines:
-                        line = line.strip()
-                        if line.startswith("name:"):
-                            name = line[5:].strip().strip("'\"")
-                            if name:
-                                info["name_from_md"] = name
-                        elif line.startswith("description:"):
-                            desc = line[12:].strip().strip("'\"")
-                            if desc:
-                                # Truncate long descriptions
-                                if len(desc) > 100:
-                                    desc = desc[:97] + "..."
-                                info["description"] = desc
-                except ValueError:
-                    pass
-        except:
-            pass
+            meta = frontmatter.read_frontmatter(skill_md)
+        except (frontmatter.FrontmatterError, OSError):
+            meta = {}
+        
+        name = str(meta.get("name") or "").strip()
+        if name:
+            info["name_from_md"] = name
+        desc = _short_description(meta)
+        if desc:
+            info["description"] = desc
+    
+    return info
+
+def load_archive_cache() -> dict:
+    try:
+        with open(ARCHIVE_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {"version": ARCHIVE_CACHE_VERSION, "archives": {}}
+    if cache.get("version") != ARCHIVE_CACHE_VERSION:
+        return {"version": ARCHIVE_CACHE_VERSION, "archives": {}}
+    return cache
+
+def save_archive_cache(cache: dict) -> None:
+    """Write the cache atomically; a cache that cannot be written is not an error."""
+    try:
+        ARCHIVE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=ARCHIVE_CACHE_FILE.parent, prefix=".skill-archive-cache-")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, separators=(",", ":"), default=str)
+        os.replace(temp_name, ARCHIVE_CACHE_FILE)
+    except (OSError, ValueError):
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+
+def read_archive_frontmatter(skill_file: Path) -> dict:
+    """
+    Parse the SKILL.md frontmatter of a .skill archive without extracting
+    it: the member is located through the zip central directory and only
+    its frontmatter prefix is decompressed.
+    Returns {"frontmatter": {...}} or {"error": message}.
+    """
+    try:
+        with zipfile.ZipFile(skill_file, 'r') as zipf:
+            member = validate_skill.find_skill_md_member(zipf.namelist())
+            if member is None:
+                return {"error": "No SKILL.md found in .skill file"}
+            with zipf.open(member) as f:
+                return {"frontmatter": frontmatter.read_frontmatter_stream(f)}
+    except zipfile.BadZipFile:
+        return {"error": "Not a valid zip file"}
+    except (frontmatter.FrontmatterError, OSError, UnicodeDecodeError) as e:
+        return {"error": str(e)}
+    except Exception as e:
+        # Corrupt or encrypted members (zlib.error, NotImplementedError,
+        # RuntimeError) must not abort the whole listing
+        return {"error": f"Unreadable archive: {e}"}
+
+def get_archive_info(skill_file: Path, cache: dict) -> dict:
+    """
+    Get information about a packaged .skill file, reading its frontmatter
+    only when the archive is not in the cache with the same size and mtime.
+    Sets cache["dirty"] when the cache was updated.
+    """
+    file_info = skill_file.stat()
+    info = {
+        "name": skill_file.name,
+        "path": str(skill_file),
+        "type": "archive",
+        "size_mb": round(file_info.st_size / (1024 * 1024), 2),
+        "modified": datetime.fromtimestamp(file_info.st_mtime).isoformat()
+    }
     
+    entry = cache["archives"].get(skill_file.name)
+    if not entry or entry["size"] != file_info.st_size or entry["mtime_ns"] != file_info.st_mtime_ns:
+        entry = {"size": file_info.st_size, "mtime_ns": file_info.st_mtime_ns,
+                 **read_archive_frontmatter(skill_file)}
+        cache["archives"][skill_file.name] = entry
+        cache["dirty"] = True
+    
+    if "error" in entry:
+        info["error"] = entry["error"]
+        return info
+    meta = entry["frontmatter"]
+    name = str(meta.get("name") or "").strip()
+    if name:
+        info["name_from_md"] = name
+    desc = _short_description(meta)
+    if desc:
+        info["description"] = desc
+    info["frontmatter"] = meta
     return info
 
+def finish_archive_cache(cache: dict, archive_names: set) -> None:
+    """Drop entries of removed archives and save the cache if it changed."""
+    for name in list(cache["archives"]):
+        if name not in archive_names:
+            del cache["archives"][name]
+            cache["dirty"] = True
+    if cache.pop("dirty", False):
+        save_archive_cache(cache)
+
 def list_skills(details: bool = False, show_path: bool = False) -> bool:
     """
     List all installed skills.
@@ -108,6 +205,7 @@ def list_skills(details: bool = False, show_path: bool = False) -> bool:
     
     # Sort by name
     skill_dirs.sort(key=lambda x: x.name.lower())
+    cache = load_archive_cache()
     
     for i, skill_path in enumerate(skill_dirs, 1):
         if skill_path.is_dir():
@@ -141,17 +239,28 @@ def list_skills(details: bool = False, show_path: bool = False) -> bool:
             
         elif skill_path.is_file() and skill_path.suffix == ".skill":
             # .skill file (packaged)
-            print(f"{i:2d}. {skill_path.name} (.skill file)")
+            info = get_archive_info(skill_path, cache)
+            label = info.get("name_from_md", skill_path.name)
+            print(f"{i:2d}. {label} (.skill file)")
+            if details:
+                if 'description' in info:
+                    print(f"     Description: {info['description']}")
+                print(f"     File: {skill_path.name}")
+                print(f"     Size: {info['size_mb']:.2f} MB")
+                print(f"     Modified: {info['modified']}")
+                if 'error' in info:
+                    print(f"     ⚠️  {info['error']}")
             if show_path:
                 print(f"     Path: {skill_path}")
-            if details:
-                size_mb = skill_path.stat().st_size / (1024 * 1024)
-                modified = datetime.fromtimestamp(skill_path.stat().st_mtime).isoformat()
-                print(f"     Size: {size_mb:.2f} MB")
-                print(f"     Modified: {modified}")
+            if not details and not show_path and 'description' in info:
+                first_line = info['description'].split('\n')[0]
+                if len(first_line) > 60:
+                    first_line = first_line[:57] + "..."
+                print(f"     {first_line}")
         
         print()
     
+    finish_archive_cache(cache, {p.name for p in skill_dirs if p.is_file()})
     return True
 
 def main():
@@ -169,16 +278,22 @@ def main():
     if args.json:
         # JSON output mode
         skill_dirs = []
+        cache = load_archive_cache()
+        archive_names = set()
         try:
             for item in SKILLS_DIR.iterdir():
                 if item.is_dir():
                     info = get_skill_info(item)
                     skill_dirs.append(info)
+                elif item.is_file() and item.suffix == ".skill":
+                    skill_dirs.append(get_archive_info(item, cache))
+                    archive_names.add(item.name)
         except Exception as e:
             print(json.dumps({"error": str(e)}, indent=2))
             return 1
+        finish_archive_cache(cache, archive_names)
         
-        print(json.dumps({"skills": skill_dirs, "count": len(skill_dirs)}, indent=2))
+        print(json.dumps({"skills": skill_dirs, "count": len(skill_dirs)}, indent=2, default=str))
         return 0
     else:
         # Normal output mode
@@ -3,21 +3,127 @@
 Simple Skill Packager - Creates a .skill file from a skill directory
 
 Usage:
-    python package_skill.py <skill_directory> [output_file]
+    python package_skill.py <skill_directory> [output_file] [--deterministic]
+    python package_skill.py --all <root> [--output-dir DIR] [--workers N] [--force]
     
 Examples:
     python package_skill.py ../my-skill
     python package_skill.py ../my-skill ../dist/my-skill.skill
+    python package_skill.py ../my-skill --deterministic
+    python package_skill.py --all .. --output-dir ../dist
 """
 
 import argparse
+import contextlib
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import stat
 import sys
+import tempfile
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def package_skill(skill_dir: Path, output_file: Path = None) -> bool:
+import frontmatter
+import skill_store
+import validate_skill
+
+# Files and directories never packaged (matched against every path component)
+IGNORE_PATTERNS = ["__pycache__", "*.pyc", ".git", ".DS_Store", "PaxHeader", "._*"]
+
+# Archive member holding per-file hashes, stored next to the skill directory
+MANIFEST_NAME = ".skill-manifest.json"
+
+# Earliest timestamp a zip entry can hold
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# Written by --all next to the packages: name, size and sha256 of every archive
+RELEASE_MANIFEST = "release-manifest.json"
+RELEASE_MANIFEST_VERSION = 1
+
+def is_ignored(relative: Path) -> bool:
+    """Check whether a path relative to the skill directory should be skipped."""
+    return any(fnmatch.fnmatch(part, pattern)
+               for part in relative.parts for pattern in IGNORE_PATTERNS)
+
+def collect_files(skill_dir: Path) -> list:
+    """Return the files to package, sorted by their archive path."""
+    files = [f for f in skill_dir.rglob('*')
+             if f.is_file() and not is_ignored(f.relative_to(skill_dir))]
+    return sorted(files, key=lambda f: f.relative_to(skill_dir).as_posix())
+
+def normalized_mode(file_path: Path) -> int:
+    """Permission bits as stored in deterministic archives: 0755 or 0644."""
+    return 0o755 if file_path.stat().st_mode & stat.S_IXUSR else 0o644
+
+def source_date() -> tuple:
+    """Timestamp for deterministic entries, honouring SOURCE_DATE_EPOCH."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch and epoch.isdigit():
+        date_time = time.gmtime(int(epoch))[:6]
+        if date_time >= ZIP_EPOCH:
+            return date_time
+    return ZIP_EPOCH
+
+def build_manifest(skill_dir: Path, files: list, contents: dict) -> dict:
+    """
+    Describe every packaged file by archive path, sha256, size and mode so
+    installers can skip content they already have.
+    """
+    entries = {}
+    for file_path in files:
+        data = contents[file_path]
+        arcname = file_path.relative_to(skill_dir.parent).as_posix()
+        entries[arcname] = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+            "mode": format(normalized_mode(file_path), "o"),
+        }
+    return {"skill_dir": skill_dir.name, "files": entries}
+
+def default_file_mode() -> int:
+    """Mode of a new file under the current umask; mkstemp always creates 0600."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def _deterministic_info(arcname: str, mode: int, date_time: tuple) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, date_time=date_time)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3  # Unix, so external_attr carries the mode
+    info.external_attr = (stat.S_IFREG | mode) << 16
+    return info
+
+def write_deterministic(skill_dir: Path, zipf: zipfile.ZipFile, verbose: bool = True) -> dict:
+    """
+    Write sorted members with fixed timestamps and normalized permissions,
+    followed by the manifest. Returns the manifest.
+    """
+    files = collect_files(skill_dir)
+    contents = {f: f.read_bytes() for f in files}
+    date_time = source_date()
+
+    for file_path in files:
+        arcname = file_path.relative_to(skill_dir.parent).as_posix()
+        info = _deterministic_info(arcname, normalized_mode(file_path), date_time)
+        zipf.writestr(info, contents[file_path], compresslevel=9)
+        if verbose:
+            print(f"  Added: {arcname}")
+
+    manifest = build_manifest(skill_dir, files, contents)
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode() + b"\n"
+    zipf.writestr(_deterministic_info(MANIFEST_NAME, 0o644, date_time), data, compresslevel=9)
+    return manifest
+
+def package_skill(skill_dir: Path, output_file: Path = None, deterministic: bool = False,
+                  verbose: bool = True) -> bool:
     """
     Package a skill directory into a .skill file.
+    In deterministic mode identical sources always produce identical bytes.
     """
     skill_dir = skill_dir.resolve()
     
@@ -46,33 +152,237 @@ def package_skill(skill_dir: Path, output_file: Path = None) -> bool:
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Create the .skill file (zip format)
+    # Create the .skill file (zip format) next to the target, then move it
+    # into place so readers never see a partial archive
+    fd, temp_name = tempfile.mkstemp(dir=output_file.parent, prefix=".tmp-", suffix=".skill")
+    os.close(fd)
     try:
-        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_dir.rglob('*'):
-                if file_path.is_file():
+        with zipfile.ZipFile(temp_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            if deterministic:
+                write_deterministic(skill_dir, zipf, verbose)
+            else:
+                for file_path in collect_files(skill_dir):
                     # Calculate the relative path within the zip
                     # Include skill directory name in the zip (like skill-creator does)
                     arcname = file_path.relative_to(skill_dir.parent)
                     zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+                    if verbose:
+                        print(f"  Added: {arcname}")
+        os.chmod(temp_name, default_file_mode())
+        os.replace(temp_name, output_file)
         
-        print(f"\n✅ Successfully packaged skill to: {output_file}")
-        print(f"   Size: {output_file.stat().st_size / 1024:.1f} KB")
+        if verbose:
+            print(f"\n✅ Successfully packaged skill to: {output_file}")
+            print(f"   Size: {output_file.stat().st_size / 1024:.1f} KB")
         return True
         
     except Exception as e:
         print(f"❌ Error creating .skill file: {e}")
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
         return False
 
+def discover_skills(root: Path) -> list:
+    """Directories under root containing SKILL.md, not descending into skills."""
+    skills = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        if (directory / "SKILL.md").is_file():
+            skills.append(directory)
+            continue
+        try:
+            children = [c for c in directory.iterdir() if c.is_dir() and not c.is_symlink()]
+        except OSError:
+            continue
+        pending.extend(c for c in children if not is_ignored(Path(c.name)))
+    return sorted(skills)
+
+def source_fingerprint(skill_dir: Path) -> str:
+    """
+    Hash of everything a deterministic archive is built from: archive
+    paths, normalized modes, file contents and the entry timestamp.
+    """
+    digest = hashlib.sha256(repr(source_date()).encode())
+    for file_path in collect_files(skill_dir):
+        digest.update(file_path.relative_to(skill_dir.parent).as_posix().encode() + b"\0")
+        digest.update(format(normalized_mode(file_path), "o").encode() + b"\0")
+        digest.update(hashlib.sha256(file_path.read_bytes()).hexdigest().encode())
+    return digest.hexdigest()
+
+def load_release_manifest(output_dir: Path) -> dict:
+    try:
+        with open(output_dir / RELEASE_MANIFEST, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == RELEASE_MANIFEST_VERSION else {}
+
+def frontmatter_name(skill_dir: Path):
+    """Stripped frontmatter name of a skill, or None if SKILL.md has none."""
+    try:
+        name = frontmatter.read_frontmatter(skill_dir / "SKILL.md").get("name")
+    except (frontmatter.FrontmatterError, OSError):
+        return None
+    return str(name or "").strip() or None
+
+def build_skill(skill_dir: str, output_dir: str, previous: dict, force: bool = False) -> dict:
+    """
+    Validate and deterministically package one skill into output_dir as
+    <frontmatter name>.skill. Skipped when its source fingerprint matches
+    the previous release entry and that archive is still in place.
+    Runs in worker processes of package_all.
+    """
+    skill_dir, output_dir = Path(skill_dir), Path(output_dir)
+    result = {"source": str(skill_dir), "status": "failed"}
+
+    valid, message = validate_skill.validate_skill_directory(skill_dir)
+    if not valid:
+        result["error"] = message
+        return result
+    name = frontmatter_name(skill_dir)
+    result["name"] = name
+    output_file = output_dir / f"{name}.skill"
+
+    try:
+        fingerprint = source_fingerprint(skill_dir)
+    except OSError as e:
+        result["error"] = f"Error reading skill files: {e}"
+        return result
+    entry = previous.get(name)
+    if (not force and entry and entry.get("fingerprint") == fingerprint and output_file.exists()
+            and output_file.stat().st_size == entry.get("size")):
+        result.update(entry, source=str(skill_dir), status="unchanged")
+        return result
+
+    # Keep the per-file output of package_skill out of the shared terminal
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        packaged = package_skill(skill_dir, output_file, deterministic=True, verbose=False)
+    if not packaged:
+        result["error"] = log.getvalue().strip() or "Packaging failed"
+        return result
+
+    result.update(status="packaged", file=output_file.name, size=output_file.stat().st_size,
+                  sha256=skill_store.hash_file(output_file), fingerprint=fingerprint,
+                  files=len(collect_files(skill_dir)))
+    return result
+
+def package_all(root: Path, output_dir: Path, workers: int = 1, force: bool = False) -> dict:
+    """
+    Package every skill under root into output_dir in parallel, then write
+    the release manifest. Returns the per-skill results.
+    """
+    root = root.resolve()
+    output_dir = output_dir.resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    skills = [s for s in discover_skills(root) if output_dir not in (s, *s.parents)]
+    previous = load_release_manifest(output_dir).get("skills", {})
+
+    # Archives are named after the skill, so resolve names before any worker
+    # writes one: a later skill with a taken name is not built at all
+    results = [None] * len(skills)
+    owners = {}
+    jobs = []
+    for i, skill in enumerate(skills):
+        name = frontmatter_name(skill)
+        if name in owners:
+            results[i] = {"source": str(skill), "name": name, "status": "failed",
+                          "error": f"Duplicate skill name '{name}' (also in {owners[name]})"}
+            continue
+        if name is not None:
+            owners[name] = skill.relative_to(root).as_posix() or "."
+        jobs.append(i)
+
+    args = ([str(skills[i]) for i in jobs], [str(output_dir)] * len(jobs),
+            [previous] * len(jobs), [force] * len(jobs))
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            built = list(executor.map(build_skill, *args))
+    else:
+        built = list(map(build_skill, *args))
+    for i, result in zip(jobs, built):
+        results[i] = result
+
+    entries = {}
+    for result in results:
+        if result["status"] == "failed":
+            continue
+        entries[result["name"]] = {
+            "source": Path(result["source"]).relative_to(root).as_posix() or ".",
+            "file": result["file"],
+            "size": result["size"],
+            "sha256": result["sha256"],
+            "fingerprint": result["fingerprint"],
+            "files": result["files"],
+        }
+
+    manifest = {
+        "version": RELEASE_MANIFEST_VERSION,
+        "source_date": list(source_date()),
+        "skills": dict(sorted(entries.items())),
+    }
+    fd, temp_name = tempfile.mkstemp(dir=output_dir, prefix=".tmp-", suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.chmod(temp_name, default_file_mode())
+    os.replace(temp_name, output_dir / RELEASE_MANIFEST)
+    return {"root": str(root), "output_dir": str(output_dir), "results": results}
+
 def main():
     parser = argparse.ArgumentParser(description="Package a skill directory into a .skill file")
-    parser.add_argument("skill_dir", help="Path to skill directory")
+    parser.add_argument("skill_dir", nargs="?", help="Path to skill directory")
     parser.add_argument("output_file", nargs="?", help="Output .skill file path (optional)")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Reproducible archive: sorted members, fixed timestamps and modes, embedded manifest")
+    parser.add_argument("--all", metavar="ROOT",
+                        help="Package every skill under ROOT (always deterministic)")
+    parser.add_argument("--output-dir", default="dist",
+                        help="Output directory for --all (default: ./dist)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes used by --all")
+    parser.add_argument("--force", action="store_true",
+                        help="With --all, repackage skills whose sources are unchanged")
     
     args = parser.parse_args()
     
+    if args.all:
+        if args.skill_dir:
+            parser.error("--all takes no skill_dir or output_file")
+        root = Path(args.all)
+        if not root.is_dir():
+            print(f"❌ Error: Not a directory: {root}")
+            return 1
+        
+        print(f"📦 Packaging all skills under: {root}")
+        print(f"   Output directory: {args.output_dir}")
+        print()
+        
+        summary = package_all(root, Path(args.output_dir), args.workers, args.force)
+        results = summary["results"]
+        if not results:
+            print("📭 No skills found (directories containing SKILL.md)")
+            return 1
+        for result in results:
+            label = result.get("name") or result["source"]
+            if result["status"] == "packaged":
+                print(f"✅ {label}: {result['file']} ({result['size'] / 1024:.1f} KB)")
+            elif result["status"] == "unchanged":
+                print(f"   {label}: unchanged, kept {result['file']}")
+            else:
+                print(f"❌ {label}: {result['error']}")
+        
+        counts = {status: sum(1 for r in results if r["status"] == status)
+                  for status in ("packaged", "unchanged", "failed")}
+        print()
+        print(f"   {counts['packaged']} packaged, {counts['unchanged']} unchanged, {counts['failed']} failed")
+        print(f"   Release manifest: {Path(summary['output_dir']) / RELEASE_MANIFEST}")
+        return 1 if counts["failed"] else 0
+    
+    if not args.skill_dir:
+        parser.error("skill_dir is required unless --all is given")
+    
     skill_dir = Path(args.skill_dir)
     output_file = Path(args.output_file) if args.output_file else None
     
@@ -81,7 +391,7 @@ def main():
         print(f"   Output file: {output_file}")
     print()
     
-    success = package_skill(skill_dir, output_file)
+    success = package_skill(skill_dir, output_file, args.deterministic)
     
     return 0 if success else 1
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Search Installed Skills - Ranked search over skill names, descriptions and headings
+
+Queries run against a persisted inverted index, so no skill directory is read
+at search time. The index is updated incrementally by install_skill.py and
+can be rebuilt from the skills directory at any time.
+
+Usage:
+    python search_skills.py <query> [--limit N] [--json]
+    python search_skills.py --rebuild
+
+Examples:
+    python search_skills.py "spaced repetition vocabulary"
+    python search_skills.py pdf --limit 5 --json
+    python search_skills.py --rebuild
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+import frontmatter
+
+# Default opencode skills directory
+SKILLS_DIR = Path.home() / ".config" / "opencode" / "skill"
+
+# The index lives next to the skills directory so it is never listed as a skill
+INDEX_FILE = SKILLS_DIR.parent / "skill-index.json"
+
+INDEX_VERSION = 1
+
+# Term frequency multipliers per field
+FIELD_WEIGHTS = {"name": 3, "description": 2, "heading": 1}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "the", "to", "use", "when", "with", "your", "you",
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    """Lowercase, split on non-alphanumerics, drop stopwords and plural 's'."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def extract_headings(skill_md: Path) -> list:
+    """Return Markdown headings from SKILL.md, skipping fenced code blocks."""
+    headings = []
+    in_fence = False
+    with open(skill_md, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence and stripped.startswith("#"):
+                headings.append(stripped.lstrip("#").strip())
+    return headings
+
+
+def empty_index() -> dict:
+    return {"version": INDEX_VERSION, "docs": {}, "postings": {}, "total_length": 0}
+
+
+def load_index(index_file: Path = None) -> dict:
+    """Load the index, returning an empty one if missing or outdated."""
+    index_file = index_file or INDEX_FILE
+    try:
+        with open(index_file, "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return empty_index()
+    if index.get("version") != INDEX_VERSION:
+        return empty_index()
+    return index
+
+
+def save_index(index: dict, index_file: Path = None) -> None:
+    """Write the index atomically."""
+    index_file = index_file or INDEX_FILE
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=index_file.parent, prefix=".skill-index-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(temp_name, index_file)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+
+def remove_skill(index: dict, skill_id: str) -> bool:
+    """Remove a skill from the index. Returns True if it was indexed."""
+    doc = index["docs"].pop(skill_id, None)
+    if doc is None:
+        return False
+    for term in doc["terms"]:
+        postings = index["postings"].get(term)
+        if postings is not None:
+            postings.pop(skill_id, None)
+            if not postings:
+                del index["postings"][term]
+    index["total_length"] -= doc["length"]
+    return True
+
+
+def index_skill(index: dict, skill_dir: Path) -> bool:
+    """
+    Add or replace a skill directory in the index.
+    Returns False if the skill has no readable SKILL.md.
+    """
+    skill_id = skill_dir.name
+    remove_skill(index, skill_id)
+
+    skill_md = skill_dir / "SKILL.md"
+    try:
+        meta = frontmatter.read_frontmatter(skill_md)
+        headings = extract_headings(skill_md)
+    except (frontmatter.FrontmatterError, OSError):
+        return False
+
+    name = str(meta.get("name") or skill_id).strip()
+    description = str(meta.get("description") or "").strip()
+
+    frequencies = {}
+    fields = [("name", name.replace("-", " ")), ("description", description)]
+    fields += [("heading", heading) for heading in headings]
+    for field, text in fields:
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            frequencies[token] = frequencies.get(token, 0) + weight
+
+    length = sum(frequencies.values())
+    index["docs"][skill_id] = {
+        "name": name,
+        "description": description[:200],
+        "path": str(skill_dir),
+        "length": length,
+        "terms": sorted(frequencies),
+    }
+    for term, tf in frequencies.items():
+        index["postings"].setdefault(term, {})[skill_id] = tf
+    index["total_length"] += length
+    return True
+
+
+def rebuild_index(skills_dir: Path = None) -> dict:
+    """Build a fresh index from every installed skill directory."""
+    skills_dir = skills_dir or SKILLS_DIR
+    index = empty_index()
+    if skills_dir.exists():
+        for item in sorted(skills_dir.iterdir()):
+            if item.is_dir():
+                index_skill(index, item)
+    return index
+
+
+def update_index(skill_dir: Path, index_file: Path = None) -> None:
+    """Incrementally (re)index one installed skill and persist the index."""
+    index = load_index(index_file)
+    if skill_dir.exists():
+        index_skill(index, skill_dir)
+    else:
+        remove_skill(index, skill_dir.name)
+    save_index(index, index_file)
+
+
+def search(index: dict, query: str, limit: int = 10) -> list:
+    """Rank indexed skills against the query using BM25."""
+    docs = index["docs"]
+    if not docs:
+        return []
+    avg_length = index["total_length"] / len(docs) or 1
+    n_docs = len(docs)
+
+    scores = {}
+    for term in set(tokenize(query)):
+        postings = index["postings"].get(term)
+        if not postings:
+            continue
+        idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+        for skill_id, tf in postings.items():
+            norm = K1 * (1 - B + B * docs[skill_id]["length"] / avg_length)
+            scores[skill_id] = scores.get(skill_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [{
+        "name": docs[skill_id]["name"],
+        "description": docs[skill_id]["description"],
+        "path": docs[skill_id]["path"],
+        "score": round(score, 3),
+    } for skill_id, score in ranked]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search installed skills")
+    parser.add_argument("query", nargs="?", help="Search terms")
+    parser.add_argument("--limit", "-n", type=int, default=10, help="Maximum number of results")
+    parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from the skills directory")
+
+    args = parser.parse_args()
+
+    if args.rebuild:
+        if not SKILLS_DIR.exists():
+            print(f"❌ Skills directory does not exist: {SKILLS_DIR}")
+            return 1
+        index = rebuild_index()
+        save_index(index)
+        if not args.query:
+            print(f"✅ Indexed {len(index['docs'])} skill(s) into {INDEX_FILE}")
+            return 0
+    elif not args.query:
+        parser.print_help()
+        return 1
+    else:
+        if not INDEX_FILE.exists():
+            print(f"❌ Search index not found: {INDEX_FILE}")
+            print("   Run with --rebuild to create it")
+            return 1
+        index = load_index()
+
+    results = search(index, args.query, args.limit)
+
+    if args.json:
+        print(json.dumps({"query": args.query, "results": results, "count": len(results)}, indent=2))
+        return 0
+
+    if not results:
+        print(f"🔍 No skills match '{args.query}'")
+        return 0
+
+    print(f"🔍 Skills matching '{args.query}' ({len(results)})")
+    print()
+    for i, result in enumerate(results, 1):
+        print(f"{i:2d}. {result['name']}  (score {result['score']})")
+        desc = result["description"]
+        if desc:
+            if len(desc) > 60:
+                desc = desc[:57] + "..."
+            print(f"     {desc}")
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
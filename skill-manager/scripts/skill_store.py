@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Skill Store - Content-addressed blob store shared by installed skills
+
+Every installed file is stored once under its content hash and the skill
+directories are assembled from hardlinks into the store. Identical reference
+files shared between skills (or between versions of the same skill) take up
+disk space only once, and updates only write files whose content changed.
+
+Usage:
+    python skill_store.py stats
+    python skill_store.py gc [--dry-run]
+
+Examples:
+    python skill_store.py stats
+    python skill_store.py gc
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+# Default opencode skills directory
+SKILLS_DIR = Path.home() / ".config" / "opencode" / "skill"
+
+# The store lives next to the skills directory so it is never listed as a skill
+STORE_DIR = SKILLS_DIR.parent / "skill-store"
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: Path) -> str:
+    """Return the sha256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_key(digest: str, executable: bool = False) -> str:
+    """
+    Build the store key for a file.
+
+    Hardlinks share permission bits, so executable and non-executable copies
+    of the same content are kept as separate blobs.
+    """
+    return f"{digest}.x" if executable else digest
+
+
+def blob_path(key: str, store_dir: Path = None) -> Path:
+    """Get the path of a blob inside the store."""
+    store_dir = store_dir or STORE_DIR
+    return store_dir / "objects" / key[:2] / key[2:]
+
+
+def _blob_mode(executable: bool) -> int:
+    # Blobs are read-only so editing an installed file in place cannot
+    # silently change every other skill that links to the same content.
+    return 0o555 if executable else 0o444
+
+
+def _is_executable(file_path: Path) -> bool:
+    return bool(file_path.stat().st_mode & stat.S_IXUSR)
+
+
+def store_file(file_path: Path, digest: str = None, store_dir: Path = None) -> Path:
+    """
+    Add a file to the store and return its blob path.
+    Existing blobs are reused without writing anything.
+    """
+    executable = _is_executable(file_path)
+    digest = digest or hash_file(file_path)
+    target = blob_path(blob_key(digest, executable), store_dir)
+    if target.exists():
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as out, open(file_path, "rb") as src:
+            shutil.copyfileobj(src, out, CHUNK_SIZE)
+        os.chmod(temp_name, _blob_mode(executable))
+        os.replace(temp_name, target)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+    return target
+
+
+def store_bytes(data: bytes, executable: bool = False, store_dir: Path = None) -> Path:
+    """Add in-memory content to the store and return its blob path."""
+    key = blob_key(hashlib.sha256(data).hexdigest(), executable)
+    target = blob_path(key, store_dir)
+    if target.exists():
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.chmod(temp_name, _blob_mode(executable))
+        os.replace(temp_name, target)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+    return target
+
+
+def link_blob(blob: Path, target: Path) -> bool:
+    """
+    Hardlink a blob to target. Falls back to a copy when hardlinks are not
+    possible (e.g. store and skills directory on different filesystems).
+    Returns True if a hardlink was created.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(blob, target)
+        return True
+    except OSError:
+        shutil.copy2(blob, target)
+        os.chmod(target, stat.S_IMODE(target.stat().st_mode) | stat.S_IWUSR)
+        return False
+
+
+def link_tree(source_dir: Path, target_dir: Path, store_dir: Path = None) -> dict:
+    """
+    Assemble target_dir from the store so that it mirrors source_dir.
+    Returns counters describing how much content was new.
+    """
+    result = {"files": 0, "new_blobs": 0, "bytes_written": 0, "linked": 0, "copied": 0}
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    for file_path in sorted(source_dir.rglob('*')):
+        relative = file_path.relative_to(source_dir)
+        if file_path.is_dir():
+            (target_dir / relative).mkdir(parents=True, exist_ok=True)
+            continue
+        if not file_path.is_file():
+            continue
+
+        executable = _is_executable(file_path)
+        digest = hash_file(file_path)
+        existed = blob_path(blob_key(digest, executable), store_dir).exists()
+        blob = store_file(file_path, digest, store_dir)
+        if not existed:
+            result["new_blobs"] += 1
+            result["bytes_written"] += blob.stat().st_size
+
+        if link_blob(blob, target_dir / relative):
+            result["linked"] += 1
+        else:
+            result["copied"] += 1
+        result["files"] += 1
+
+    return result
+
+
+def remove_tree(path: Path) -> None:
+    """Remove an installed skill directory, including read-only store links."""
+    def _make_writable(func, failed_path, _exc_info):
+        os.chmod(failed_path, stat.S_IWUSR | stat.S_IRUSR | stat.S_IXUSR)
+        func(failed_path)
+
+    shutil.rmtree(path, onerror=_make_writable)
+
+
+def iter_blobs(store_dir: Path = None):
+    """Yield every blob path in the store."""
+    objects_dir = (store_dir or STORE_DIR) / "objects"
+    if not objects_dir.exists():
+        return
+    for bucket in objects_dir.iterdir():
+        if not bucket.is_dir():
+            continue
+        for blob in bucket.iterdir():
+            if blob.is_file() and not blob.name.startswith(".tmp-"):
+                yield blob
+
+
+def collect_garbage(store_dir: Path = None, dry_run: bool = False) -> dict:
+    """
+    Remove blobs that no installed skill links to.
+
+    A blob with a single link is referenced only by the store itself, so no
+    reference counting database is needed.
+    """
+    result = {"removed": 0, "bytes_freed": 0, "kept": 0}
+    for blob in iter_blobs(store_dir):
+        info = blob.stat()
+        if info.st_nlink > 1:
+            result["kept"] += 1
+            continue
+        result["removed"] += 1
+        result["bytes_freed"] += info.st_size
+        if not dry_run:
+            blob.unlink()
+            try:
+                blob.parent.rmdir()
+            except OSError:
+                pass
+    return result
+
+
+def store_stats(store_dir: Path = None) -> dict:
+    """Summarize blob count, stored bytes and bytes saved through sharing."""
+    result = {"blobs": 0, "stored_bytes": 0, "saved_bytes": 0, "unreferenced": 0}
+    for blob in iter_blobs(store_dir):
+        info = blob.stat()
+        links = info.st_nlink - 1
+        result["blobs"] += 1
+        result["stored_bytes"] += info.st_size
+        if links == 0:
+            result["unreferenced"] += 1
+        else:
+            result["saved_bytes"] += info.st_size * (links - 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the content-addressed skill store")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    subparsers.add_parser("stats", help="Show store usage")
+
+    gc_parser = subparsers.add_parser("gc", help="Remove blobs no skill links to")
+    gc_parser.add_argument("--dry-run", action="store_true", help="Only report what would be removed")
+
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        stats = store_stats()
+        print(f"📦 Skill store: {STORE_DIR}")
+        print(f"   Blobs: {stats['blobs']} ({stats['unreferenced']} unreferenced)")
+        print(f"   Stored: {stats['stored_bytes'] / (1024 * 1024):.2f} MB")
+        print(f"   Saved by sharing: {stats['saved_bytes'] / (1024 * 1024):.2f} MB")
+        return 0
+
+    if args.command == "gc":
+        result = collect_garbage(dry_run=args.dry_run)
+        verb = "Would remove" if args.dry_run else "Removed"
+        print(f"🧹 {verb} {result['removed']} blob(s), "
+              f"{result['bytes_freed'] / (1024 * 1024):.2f} MB")
+        print(f"   Kept: {result['kept']} blob(s) in use")
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,12 +11,39 @@ Examples:
 """
 
 import argparse
-import os
+import re
 import sys
 import zipfile
-import tempfile
 from pathlib import Path
 
+import frontmatter
+
+def check_frontmatter(meta: dict):
+    """
+    Check required frontmatter fields and the name format.
+    Returns (is_valid, message)
+    """
+    if "name" not in meta:
+        return False, "Missing 'name:' field in frontmatter"
+    name_value = str(meta.get("name") or "").strip()
+    if not name_value:
+        return False, "Name field is empty"
+    
+    if "description" not in meta:
+        return False, "Missing 'description:' field in frontmatter"
+    if not str(meta.get("description") or "").strip():
+        return False, "Description field is empty"
+    
+    # Check naming convention (hyphen-case): lowercase letters, digits, hyphens
+    if not re.match(r'^[a-z0-9-]+$', name_value):
+        return False, f"Name '{name_value}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    if name_value.startswith('-') or name_value.endswith('-'):
+        return False, f"Name '{name_value}' cannot start or end with hyphen"
+    if '--' in name_value:
+        return False, f"Name '{name_value}' cannot contain consecutive hyphens"
+    
+    return True, "Frontmatter is valid"
+
 def validate_skill_directory(skill_path: Path):
     """
     Validate a skill directory structure.
@@ -34,73 +61,35 @@ def validate_skill_directory(skill_path: Path):
     if not skill_md.exists():
         return False, f"SKILL.md not found in {skill_path}"
     
-    # Read SKILL.md to check frontmatter
+    # Read SKILL.md frontmatter
     try:
-        content = skill_md.read_text()
-        
-        # Check for YAML frontmatter
-        if not content.startswith("---"):
-            return False, "SKILL.md does not start with YAML frontmatter (---)"
-        
-        lines = content.split("\n")
-        
-        # Find end of frontmatter
-        try:
-            end_idx = lines.index("---", 1)
-        except ValueError:
-            return False, "YAML frontmatter not properly closed with '---'"
-        
-        frontmatter_lines = lines[1:end_idx]
-        
-        # Check for required fields
-        has_name = False
-        has_description = False
-        
-        for line in frontmatter_lines:
-            line = line.strip()
-            if line.startswith("name:"):
-                has_name = True
-                # Check name format
-                name_value = line[5:].strip()
-                if not name_value:
-                    return False, "Name field is empty"
-            elif line.startswith("description:"):
-                has_description = True
-                # Check description
-                desc_value = line[12:].strip()
-                if not desc_value:
-                    return False, "Description field is empty"
-        
-        if not has_name:
-            return False, "Missing 'name:' field in frontmatter"
-        
-        if not has_description:
-            return False, "Missing 'description:' field in frontmatter"
-        
-        # Check naming convention (hyphen-case)
-        # Extract name from frontmatter for better validation
-        for line in frontmatter_lines:
-            line = line.strip()
-            if line.startswith("name:"):
-                name_value = line[5:].strip().strip("'\"")
-                # Check hyphen-case: lowercase letters, digits, hyphens
-                import re
-                if not re.match(r'^[a-z0-9-]+$', name_value):
-                    return False, f"Name '{name_value}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
-                if name_value.startswith('-') or name_value.endswith('-'):
-                    return False, f"Name '{name_value}' cannot start or end with hyphen"
-                if '--' in name_value:
-                    return False, f"Name '{name_value}' cannot contain consecutive hyphens"
-                break
-        
+        meta = frontmatter.read_frontmatter(skill_md)
+    except frontmatter.FrontmatterError as e:
+        return False, str(e)
     except Exception as e:
         return False, f"Error reading SKILL.md: {e}"
     
+    valid, message = check_frontmatter(meta)
+    if not valid:
+        return False, message
+    
     return True, f"Skill '{skill_path.name}' is valid!"
 
+def find_skill_md_member(names: list):
+    """
+    Find the SKILL.md member of a .skill archive: either at the root or
+    directly inside the top-level skill directory.
+    """
+    candidates = [n for n in names if n == "SKILL.md" or
+                  (n.endswith("/SKILL.md") and n.count("/") == 1)]
+    if not candidates:
+        return None
+    return min(candidates, key=len)
+
 def validate_skill_file(skill_file: Path):
     """
     Validate a .skill file.
+    SKILL.md is read straight from the archive without extracting it.
     Returns (is_valid, message)
     """
     if not skill_file.exists():
@@ -113,40 +102,29 @@ def validate_skill_file(skill_file: Path):
     try:
         with zipfile.ZipFile(skill_file, 'r') as zipf:
             # Check for SKILL.md in the zip
-            skill_files = [f for f in zipf.namelist() if f.endswith('SKILL.md')]
-            if not skill_files:
+            if not any(f.endswith('SKILL.md') for f in zipf.namelist()):
                 return False, "No SKILL.md found in .skill file"
             
-            # Extract to temp directory for validation
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                zipf.extractall(temp_path)
-                
-        # Find the skill directory
-        items = list(temp_path.iterdir())
-        skill_dir = None
-        
-        # Look for a directory first
-        for item in items:
-            if item.is_dir():
-                skill_dir = item
-                break
-        
-        # If no directory found, check if files are at root (including SKILL.md)
-        if not skill_dir:
-            # Check if SKILL.md exists at root
-            if (temp_path / "SKILL.md").exists():
-                skill_dir = temp_path
-            else:
+            member = find_skill_md_member(zipf.namelist())
+            if member is None:
                 return False, "No skill directory or SKILL.md found in .skill file"
-                
-                # Validate the extracted directory
-                return validate_skill_directory(skill_dir)
-                
+            
+            with zipf.open(member) as f:
+                meta = frontmatter.read_frontmatter_stream(f)
+        
     except zipfile.BadZipFile:
         return False, f"Invalid .skill file (not a valid zip): {skill_file}"
+    except frontmatter.FrontmatterError as e:
+        return False, str(e)
     except Exception as e:
         return False, f"Error validating .skill file: {e}"
+    
+    valid, message = check_frontmatter(meta)
+    if not valid:
+        return False, message
+    
+    skill_name = member.split("/")[0] if "/" in member else skill_file.stem
+    return True, f"Skill '{skill_name}' is valid!"
 
 def main():
     parser = argparse.ArgumentParser(description="Validate a skill directory or .skill file")
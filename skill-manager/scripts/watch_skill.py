@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Skill Watcher - Keeps the installed copy of a skill in sync while you edit it
+
+Watches a skill directory (inotify on Linux, polling elsewhere), debounces
+bursts of file events, and applies only the changed files to the installed
+skill. SKILL.md is revalidated only when it changes; while it is invalid,
+changes are held back so the installed copy stays usable.
+
+Usage:
+    python watch_skill.py <skill_directory> [--package OUTPUT] [--poll]
+
+Examples:
+    python watch_skill.py ../my-skill
+    python watch_skill.py ../my-skill --package ../dist/my-skill.skill
+    python watch_skill.py ../my-skill --poll --interval 1
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+import install_skill
+import package_skill
+import search_skills
+import skill_store
+import validate_skill
+
+# Names that never trigger a sync
+IGNORED_NAMES = {"__pycache__", ".git", ".DS_Store"}
+IGNORED_SUFFIXES = (".pyc", ".swp", ".swx", "~", ".tmp")
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Returned in a change set when events were lost: every file must be resynced
+RESYNC = Path(".")
+
+
+def is_ignored(relative: Path) -> bool:
+    """Check whether a path inside the skill should be ignored."""
+    return any(part in IGNORED_NAMES for part in relative.parts) or \
+        relative.name.endswith(IGNORED_SUFFIXES)
+
+
+def snapshot(root: Path) -> dict:
+    """Map every watched file to (mtime_ns, size)."""
+    result = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            relative = path.relative_to(root)
+            if is_ignored(relative):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(path)
+            elif entry.is_file():
+                info = entry.stat()
+                result[relative] = (info.st_mtime_ns, info.st_size)
+    return result
+
+
+class PollingWatcher:
+    """Detects changes by diffing periodic directory snapshots."""
+
+    def __init__(self, root: Path, interval: float = 0.5):
+        self.root = root
+        self.interval = interval
+        self.state = snapshot(root)
+
+    def wait(self, timeout: float) -> set:
+        """Block up to timeout seconds and return changed relative paths."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = snapshot(self.root)
+            changed = {path for path in current.keys() | self.state.keys()
+                       if current.get(path) != self.state.get(path)}
+            self.state = current
+            if changed or time.monotonic() >= deadline:
+                return changed
+            time.sleep(min(self.interval, max(0.0, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher using libc through ctypes."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        libc_name = ctypes.util.find_library("c")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        self._add_tree(root)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> None:
+        self._add_watch(directory)
+        for path in directory.rglob("*"):
+            if path.is_dir() and not is_ignored(path.relative_to(self.root)):
+                self._add_watch(path)
+
+    def wait(self, timeout: float) -> set:
+        """Block up to timeout seconds and return changed relative paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # The kernel queue overflowed and events were dropped;
+                    # rewatch directories that may have appeared meanwhile
+                    try:
+                        self._add_tree(self.root)
+                    except OSError:
+                        pass
+                    changed.add(RESYNC)
+                    continue
+                if mask & (IN_IGNORED | IN_DELETE_SELF):
+                    # The directory is gone; its parent reports the deletion
+                    self.watches.pop(wd, None)
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                relative = path.relative_to(self.root)
+                if is_ignored(relative):
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Pick up files created before the watch was in place
+                    self._add_tree(path)
+                    changed.update(p.relative_to(self.root) for p in path.rglob("*") if p.is_file())
+                if name:
+                    changed.add(relative)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(root: Path, force_poll: bool = False, interval: float = 0.5):
+    """Create an inotify watcher, falling back to polling if unavailable."""
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(root, interval)
+
+
+def collect_changes(watcher, debounce: float) -> set:
+    """Wait for a change, then keep collecting until events go quiet."""
+    changed = set()
+    while not changed:
+        changed = watcher.wait(3600)
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+def sync_paths(source_dir: Path, target_dir: Path, paths: set) -> dict:
+    """Apply changed files to the installed copy through the skill store."""
+    result = {"updated": 0, "removed": 0}
+    for relative in sorted(paths):
+        source = source_dir / relative
+        target = target_dir / relative
+        if source.is_file():
+            if target.exists() or target.is_symlink():
+                if target.is_dir():
+                    skill_store.remove_tree(target)
+                else:
+                    target.unlink()
+            blob = skill_store.store_file(source, store_dir=install_skill.STORE_DIR)
+            skill_store.link_blob(blob, target)
+            result["updated"] += 1
+        elif not source.exists() and (target.exists() or target.is_symlink()):
+            if target.is_dir():
+                skill_store.remove_tree(target)
+            else:
+                target.unlink()
+            result["removed"] += 1
+    return result
+
+
+def watch(source_dir: Path, package_output: Path = None, force_poll: bool = False,
+          interval: float = 0.5, debounce: float = 0.2) -> bool:
+    """
+    Install the skill, then keep the installed copy up to date until interrupted.
+    """
+    source_dir = source_dir.resolve()
+    valid, message = validate_skill.validate_skill_directory(source_dir)
+    if not valid:
+        print(f"❌ Validation failed: {message}")
+        return False
+
+    skill_name = install_skill.extract_skill_name(source_dir)
+    install_skill.SKILLS_DIR.mkdir(parents=True, exist_ok=True)
+    if not install_skill.install_from_directory(source_dir, update=True):
+        return False
+    if package_output:
+        package_skill.package_skill(source_dir, package_output)
+
+    watcher = create_watcher(source_dir, force_poll, interval)
+    print(f"👀 Watching {source_dir} ({type(watcher).__name__.replace('Watcher', '').lower()})")
+    print("   Press Ctrl+C to stop")
+
+    pending = set()
+    try:
+        while True:
+            pending |= collect_changes(watcher, debounce)
+            started = time.monotonic()
+            if RESYNC in pending:
+                # Compare everything: files missing on either side are synced too
+                pending.discard(RESYNC)
+                pending |= snapshot(source_dir).keys() | \
+                    snapshot(install_skill.SKILLS_DIR / skill_name).keys()
+                print(f"⚠️  Events were lost, resyncing all {len(pending)} file(s)")
+
+            if Path("SKILL.md") in pending:
+                valid, message = validate_skill.validate_skill_directory(source_dir)
+                if not valid:
+                    print(f"❌ SKILL.md invalid, holding {len(pending)} change(s): {message}")
+                    continue
+                new_name = install_skill.extract_skill_name(source_dir)
+                if new_name != skill_name:
+                    print(f"⚠️  Skill renamed '{skill_name}' -> '{new_name}', reinstalling")
+                    if not install_skill.install_from_directory(source_dir, update=True):
+                        print(f"❌ Reinstall failed; '{skill_name}' stays installed, "
+                              f"holding {len(pending)} change(s)")
+                        continue
+                    # Drop the old install only once the new one is in place
+                    old_target = install_skill.SKILLS_DIR / skill_name
+                    try:
+                        if old_target.exists():
+                            skill_store.remove_tree(old_target)
+                        search_skills.update_index(old_target, install_skill.INDEX_FILE)
+                    except OSError as e:
+                        print(f"⚠️  Could not remove old install {old_target}: {e}")
+                    skill_name = new_name
+                    pending.clear()
+                    continue
+
+            target_dir = install_skill.SKILLS_DIR / skill_name
+            result = sync_paths(source_dir, target_dir, pending)
+            if Path("SKILL.md") in pending:
+                search_skills.update_index(target_dir, install_skill.INDEX_FILE)
+            pending.clear()
+
+            if package_output:
+                package_skill.package_skill(source_dir, package_output)
+
+            elapsed = (time.monotonic() - started) * 1000
+            print(f"🔄 Synced '{skill_name}': {result['updated']} updated, "
+                  f"{result['removed']} removed ({elapsed:.0f} ms)")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a skill directory and keep its installed copy in sync")
+    parser.add_argument("skill_dir", help="Path to skill directory")
+    parser.add_argument("--package", metavar="OUTPUT", help="Also repackage to this .skill file on every change")
+    parser.add_argument("--poll", action="store_true", help="Use polling instead of inotify")
+    parser.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds")
+    parser.add_argument("--debounce", type=float, default=0.2, help="Quiet period before applying changes, in seconds")
+
+    args = parser.parse_args()
+
+    skill_dir = Path(args.skill_dir)
+    if not skill_dir.is_dir():
+        print(f"❌ Error: Skill directory not found: {skill_dir}")
+        return 1
+
+    package_output = Path(args.package) if args.package else None
+    success = watch(skill_dir, package_output, args.poll, args.interval, args.debounce)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())